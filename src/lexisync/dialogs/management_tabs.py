@@ -5,6 +5,7 @@ import datetime
 import gc
 import logging
 import os
+import threading
 
 from PySide6.QtCore import QMutex, QMutexLocker, QObject, Qt, QThread, QTimer, Signal
 from PySide6.QtWidgets import (
@@ -510,7 +511,7 @@ class GlossaryManagementTab(QWidget):
 
 
 class TMImportThread(QThread):
-    progress = Signal(str)
+    progress = Signal(str, int)
     finished = Signal(bool, str)
 
     def __init__(self, tm_service, file_path, tm_dir, source_lang, target_lang):
@@ -520,10 +521,25 @@ class TMImportThread(QThread):
         self.tm_dir = tm_dir
         self.source_lang = source_lang
         self.target_lang = target_lang
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def _report_progress(self, message, percent=None):
+        self.progress.emit(message, -1 if percent is None else percent)
 
     def run(self):
         success, message = self.tm_service.import_from_file(
-            self.file_path, self.tm_dir, self.source_lang, self.target_lang, self.progress.emit
+            self.file_path,
+            self.tm_dir,
+            self.source_lang,
+            self.target_lang,
+            progress_callback=self._report_progress,
+            cancel_event=self._cancel_event,
         )
         self.finished.emit(success, message)
 
@@ -597,7 +613,7 @@ class TMManagementTab(QWidget):
     def import_tm_file(self, filepath: str | None = None):
         if not filepath:
             filepath, __ = QFileDialog.getOpenFileName(
-                self, _("Select TM File to Import"), "", _("TM Files (*.xlsx);;All Files (*.*)")
+                self, _("Select TM File to Import"), "", _("TM Files (*.tmx *.xlsx);;All Files (*.*)")
             )
         if not filepath:
             return
@@ -615,23 +631,26 @@ class TMManagementTab(QWidget):
         self.progress_dialog.setAutoClose(True)
         self.progress_dialog.show()
 
-        self.import_thread = TMImportThread(self.tm_service, filepath, self.global_tm_dir, source_lang, target_lang)
+        self.import_thread = TMImportThread(self.tm_service, filepath, self.tm_dir, source_lang, target_lang)
         self.import_thread.progress.connect(self.update_progress)
         self.import_thread.finished.connect(self.on_import_finished)
-        self.progress_dialog.canceled.connect(self.import_thread.terminate)
+        self.progress_dialog.canceled.connect(self.import_thread.cancel)
         self.import_thread.start()
 
-    def update_progress(self, message):
+    def update_progress(self, message, percent=-1):
         if self.progress_dialog.wasCanceled():
             return
         self.progress_dialog.setLabelText(message)
-        self.progress_dialog.setValue(self.progress_dialog.value() + 5)
+        if percent >= 0:
+            self.progress_dialog.setValue(percent)
 
     def on_import_finished(self, success, message):
         self.progress_dialog.setValue(100)
         if success:
             QMessageBox.information(self, _("Import Successful"), message)
             self.load_sources_into_table()
+        elif self.import_thread.is_cancelled():
+            QMessageBox.information(self, _("Import Cancelled"), message)
         else:
             QMessageBox.critical(self, _("Import Failed"), message)
 
@@ -2,7 +2,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import copy
-import json
 import logging
 import os
 from pathlib import Path
@@ -35,6 +34,7 @@ from PySide6.QtWidgets import (
 from lexisync.services import project_service
 from lexisync.services.code_file_service import extract_translatable_strings
 from lexisync.services.format_manager import FormatManager
+from lexisync.services.translation_store import entry_record, get_translation_store
 from lexisync.utils.constants import SUPPORTED_LANGUAGES, get_language_display_name
 from lexisync.utils.localization import _
 from lexisync.utils.text_utils import format_file_size
@@ -298,9 +298,10 @@ class ProjectGeneralSettingsPage(BaseSettingsPage):
 
         proj_path = Path(self.app.current_project_path)
 
+        translation_dir = proj_path / project_service.TRANSLATION_DIR
         for lang in added_langs:
-            translation_path = proj_path / project_service.TRANSLATION_DIR / f"{lang}.json"
-            if not translation_path.exists():
+            store = get_translation_store(translation_dir, lang)
+            if not store.exists():
                 if not self.app.project_config.get("source_files"):
                     logger.error("Cannot add new language: No source files in project to create structure from.")
                     continue
@@ -308,14 +309,10 @@ class ProjectGeneralSettingsPage(BaseSettingsPage):
                 with open(source_file_path, encoding="utf-8") as f:
                     content = f.read().replace("\r\n", "\n").replace("\r", "\n")
                 patterns = self.app.config.get("extraction_patterns", [])
-                initial_objects = [ts.to_dict() for ts in extract_translatable_strings(content, patterns)]
-                with open(translation_path, "w", encoding="utf-8") as f:
-                    json.dump(initial_objects, f, indent=4, ensure_ascii=False)
+                store.replace_all(entry_record(ts) for ts in extract_translatable_strings(content, patterns))
 
         for lang in removed_langs:
-            translation_path = proj_path / project_service.TRANSLATION_DIR / f"{lang}.json"
-            if translation_path.exists():
-                os.remove(translation_path)
+            get_translation_store(translation_dir, lang).delete()
             if self.app.current_target_language == lang:
                 if self.app.project_config["target_languages"]:
                     self.app.project_config["current_target_language"] = self.app.project_config["target_languages"][0]
@@ -473,9 +470,24 @@ class ProjectSourceFilesPage(BaseSettingsPage):
         if not self.changes_made:
             return False
 
+        kept_paths = {f["project_path"] for f in self.project_config["source_files"] if f["project_path"]}
+        removed_paths = {
+            f["project_path"]
+            for f in self.app.project_config.get("source_files", [])
+            if f["project_path"] not in kept_paths
+        }
         self.app.project_config["source_files"] = self.project_config["source_files"]
 
         proj_path = Path(self.app.current_project_path)
+        if removed_paths:
+            # 被移出项目的源文件的条目从各语言的翻译数据中删除
+            translation_dir = proj_path / project_service.TRANSLATION_DIR
+            removed_ids = {
+                ts.id for ts in self.app.all_project_strings if ts.source_file_path.replace("\\", "/") in removed_paths
+            }
+            for lang in self.app.project_config.get("target_languages", []):
+                removed_ids |= get_translation_store(translation_dir, lang).ids_for_sources(removed_paths)
+            self.app.project_saver.remove_entries(proj_path, removed_ids)
 
         for file_info in self.app.project_config["source_files"]:
             if not file_info["project_path"]:
@@ -4,7 +4,7 @@
 import logging
 import os
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QThreadPool, Signal
 from PySide6.QtGui import QAction, QCursor
 from PySide6.QtWidgets import (
     QAbstractItemView,
@@ -24,6 +24,7 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
+from lexisync.services.db_maintenance_service import DBMaintenanceWorker, format_maintenance_report
 from lexisync.utils.localization import _
 
 logger = logging.getLogger(__name__)
@@ -48,6 +49,7 @@ class ResourceViewerDialog(QDialog):
         self.initial_db_type = initial_db_type
 
         self.custom_services = {}
+        self._maintenance_worker = None
 
         self._init_service()
 
@@ -100,6 +102,7 @@ class ResourceViewerDialog(QDialog):
             # 更新数据库路径
             db_type = self.db_selector.itemData(index)
             self.db_path = self.service.project_db_path if db_type == "project" else self.service.global_db_path
+            self._update_optimize_button()
 
             if not self.db_path or not os.path.exists(self.db_path):
                 logger.warning(f"Database path does not exist: {self.db_path}")
@@ -180,6 +183,11 @@ class ResourceViewerDialog(QDialog):
         layout.addWidget(self.db_selector)
         layout.addStretch()
 
+        self.optimize_btn = QPushButton(_("Optimize Database"))
+        self.optimize_btn.setToolTip(_("Compact the database, merge search indexes and refresh query statistics."))
+        self.optimize_btn.clicked.connect(self.on_optimize_database)
+        layout.addWidget(self.optimize_btn)
+
         return layout
 
     def _create_filter_section(self):
@@ -241,6 +249,31 @@ class ResourceViewerDialog(QDialog):
         self.initial_source_key = None
         self.on_db_changed(self.db_selector.currentIndex())
 
+    def _update_optimize_button(self):
+        can_optimize = (
+            hasattr(self.service, "run_maintenance")
+            and bool(self.db_path)
+            and os.path.exists(self.db_path)
+            and self._maintenance_worker is None
+        )
+        self.optimize_btn.setEnabled(can_optimize)
+
+    def on_optimize_database(self):
+        if self._maintenance_worker is not None or not hasattr(self.service, "run_maintenance"):
+            return
+        worker = DBMaintenanceWorker([self.service], [self.db_path])
+        worker.signals.finished.connect(self._on_optimize_finished)
+        self._maintenance_worker = worker
+        self.optimize_btn.setEnabled(False)
+        self.optimize_btn.setText(_("Optimizing..."))
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_optimize_finished(self, reports):
+        self._maintenance_worker = None
+        self.optimize_btn.setText(_("Optimize Database"))
+        self._update_optimize_button()
+        QMessageBox.information(self, _("Database Optimized"), format_maintenance_report(reports))
+
     def _create_db_selector(self):
         """创建数据库选择器"""
         selector = QComboBox()
@@ -299,8 +332,12 @@ class ResourceViewerDialog(QDialog):
         self.next_btn.clicked.connect(self.next_page)
 
         self.total_label = QLabel(_("Total: 0"))
+        # 模糊匹配缓存的命中情况，仅翻译记忆显示
+        self.cache_stats_label = QLabel()
+        self.cache_stats_label.setVisible(self.mode == "tm")
 
         pagination_layout.addWidget(self.total_label)
+        pagination_layout.addWidget(self.cache_stats_label)
         pagination_layout.addStretch()
         pagination_layout.addWidget(self.prev_btn)
         pagination_layout.addWidget(self.page_label)
@@ -401,10 +438,25 @@ class ResourceViewerDialog(QDialog):
             "search_term": self.search_edit.text().strip(),
         }
 
+    def _update_cache_stats(self):
+        stats = self.service.get_cache_stats()
+        self.cache_stats_label.setText(
+            _("Match cache: {hits} hits, {misses} misses ({rate:.0%}), {evictions} evicted").format(
+                hits=stats["hits"], misses=stats["misses"], rate=stats["hit_rate"], evictions=stats["evictions"]
+            )
+        )
+        self.cache_stats_label.setToolTip(
+            _("{entries} cached results, {size:.1f} / {max_size:.0f} MB").format(
+                entries=stats["entries"], size=stats["bytes"] / 1048576, max_size=stats["max_bytes"] / 1048576
+            )
+        )
+
     def _update_pagination_ui(self):
         """更新分页UI状态"""
         # 更新总数标签
         self.total_label.setText(_("Total: {count}").format(count=self.total_count))
+        if self.mode == "tm":
+            self._update_cache_stats()
 
         # 计算总页数
         total_pages = max(1, (self.total_count + self.page_size - 1) // self.page_size)
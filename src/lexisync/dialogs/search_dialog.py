@@ -27,6 +27,8 @@ class AdvancedSearchDialog(QDialog):
 
         self.setWindowTitle(title)
         self.setModal(False)
+        # 点击“替换”时尚无当前匹配：等后台查找定位到第一个匹配后再替换
+        self._replace_when_located = False
 
         self.setup_ui()
 
@@ -39,6 +41,11 @@ class AdvancedSearchDialog(QDialog):
         self.search_in_translation_checkbox.setChecked(opts.get("in_trans", True))
         self.search_in_comment_checkbox.setChecked(opts.get("in_comment", True))
 
+        self.service.search_progress.connect(self._on_search_progress)
+        self.service.navigated.connect(self._on_navigated)
+        self.service.replace_all_progress.connect(self._on_replace_all_progress)
+        self.service.replace_all_finished.connect(self._on_replace_all_finished)
+
         self.paste_from_clipboard_if_needed()
 
     def setup_ui(self):
@@ -95,9 +102,13 @@ class AdvancedSearchDialog(QDialog):
         replace_btn = QPushButton(_("Replace"))
         replace_btn.clicked.connect(self._replace_current)
         button_box.addWidget(replace_btn)
-        replace_all_btn = QPushButton(_("Replace All"))
-        replace_all_btn.clicked.connect(self._replace_all)
-        button_box.addWidget(replace_all_btn)
+        self.replace_all_btn = QPushButton(_("Replace All"))
+        self.replace_all_btn.clicked.connect(self._replace_all)
+        button_box.addWidget(self.replace_all_btn)
+        self.stop_btn = QPushButton(_("Stop"))
+        self.stop_btn.setEnabled(False)
+        self.stop_btn.clicked.connect(self._stop)
+        button_box.addWidget(self.stop_btn)
         button_box.addStretch(1)
         close_btn = QPushButton(_("Close"))
         close_btn.clicked.connect(self.close)
@@ -122,7 +133,9 @@ class AdvancedSearchDialog(QDialog):
     def closeEvent(self, event):
         self.service.set_replace_term(self.replace_term_entry.text())
 
+        self._replace_when_located = False
         self.service.clear()
+        self._set_busy(False)
         self.app.clear_search_markers()
         super().closeEvent(event)
 
@@ -136,7 +149,9 @@ class AdvancedSearchDialog(QDialog):
 
     def _on_search_term_changed(self, text):
         self.results_label.setText("")
+        self._replace_when_located = False
         self.service.clear()
+        self._set_busy(False)
         self.app.clear_search_markers()
 
     def _get_current_search_options(self):
@@ -154,51 +169,83 @@ class AdvancedSearchDialog(QDialog):
                 return True
         return super().eventFilter(obj, event)
 
-    def _find_next(self):
-        term = self.search_term_entry.text()
-        if not term:
-            return
-
-        opts = self._get_current_search_options()
-        count = self.service.perform_search(term, opts)
-
-        if count == 0:
-            self.results_label.setText(_("No matches found."))
-            return
-
-        current, total = self.service.find_next()
-        self.results_label.setText(_("Match {current}/{total}").format(current=current, total=total))
+    def _on_search_progress(self, count, finished):
+        if finished:
+            self._set_busy(False)
+            if count == 0:
+                self._replace_when_located = False
+                self.results_label.setText(_("No matches found."))
+                return
+        self._show_match_status()
+
+    def _on_navigated(self, current, total):
+        self._show_match_status()
+        if self._replace_when_located:
+            self._replace_when_located = False
+            self._do_replace_current()
+
+    def _show_match_status(self):
+        total = len(self.service.search_results)
+        if self.service.current_result_index >= 0:
+            current = self.service.current_result_index + 1
+            if self.service.is_searching:
+                text = _("Match {current}/{total} (searching...)").format(current=current, total=total)
+            else:
+                text = _("Match {current}/{total}").format(current=current, total=total)
+        elif self.service.is_searching:
+            text = _("Searching... {count} match(es) found").format(count=total)
+        else:
+            text = _("{count} match(es) found").format(count=total)
+        self.results_label.setText(text)
+
+    def _set_busy(self, busy):
+        self.stop_btn.setEnabled(busy)
+        self.replace_all_btn.setEnabled(not self.service.is_replacing)
+
+    def _stop(self):
+        replacing = self.service.is_replacing
+        self.service.cancel()
+        self._replace_when_located = False
+        self._set_busy(False)
+        if replacing:
+            self.results_label.setText(_("Replace All cancelled."))
+        else:
+            self.results_label.setText(
+                _("Search stopped. {count} match(es) found").format(count=len(self.service.search_results))
+            )
 
-    def _find_prev(self):
+    def _start_search(self):
         term = self.search_term_entry.text()
         if not term:
-            return
+            return False
 
         opts = self._get_current_search_options()
-        count = self.service.perform_search(term, opts)
+        if self.service.start_search(term, opts):
+            self.results_label.setText(_("Searching..."))
+            self._set_busy(True)
+        return True
 
-        if count == 0:
-            self.results_label.setText(_("No matches found."))
-            return
+    def _find_next(self):
+        if self._start_search():
+            self.service.find_next()
 
-        current, total = self.service.find_prev()
-        self.results_label.setText(_("Match {current}/{total}").format(current=current, total=total))
+    def _find_prev(self):
+        if self._start_search():
+            self.service.find_prev()
 
     def _replace_current(self):
-        term = self.search_term_entry.text()
-        replace_with = self.replace_term_entry.text()
-        if not term:
+        if not self._start_search():
             return
 
-        opts = self._get_current_search_options()
-        self.service.perform_search(term, opts)
-
         if self.service.current_result_index == -1:
-            self._find_next()  # Highlight first match
-            if self.service.current_result_index == -1:
-                return
+            # 定位到第一个匹配后再替换，结果可能尚未送达
+            self._replace_when_located = True
+            self.service.find_next()
+            return
+        self._do_replace_current()
 
-        success = self.service.replace_current(replace_with)
+    def _do_replace_current(self):
+        success = self.service.replace_current(self.replace_term_entry.text())
 
         if success:
             self._find_next()
@@ -207,14 +254,23 @@ class AdvancedSearchDialog(QDialog):
 
     def _replace_all(self):
         term = self.search_term_entry.text()
-        replace_with = self.replace_term_entry.text()
         if not term:
             return
 
         opts = self._get_current_search_options()
-        self.service.perform_search(term, opts)
-
-        count = self.service.replace_all(replace_with)
+        self._replace_when_located = False
+        if self.service.start_replace_all(term, opts, self.replace_term_entry.text()):
+            self.results_label.setText(_("Scanning for matches..."))
+            self._set_busy(True)
+
+    def _on_replace_all_progress(self, done, total):
+        self.results_label.setText(_("Scanning for matches... {done}/{total}").format(done=done, total=total))
+
+    def _on_replace_all_finished(self, count):
+        self._set_busy(False)
+        if count < 0:
+            self.results_label.setText(_("Replace All cancelled."))
+            return
 
         if count > 0:
             QMessageBox.information(
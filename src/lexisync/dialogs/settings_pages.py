@@ -1091,6 +1091,6 @@ class ValidationSettingsPage(BaseSettingsPage):
             self.app.config["length_threshold_major"] = new_length_state["major"]
             self.app.config["length_threshold_minor"] = new_length_state["minor"]
             self._take_state_snapshot()
-            self.app._run_and_refresh_with_validation()
+            self.app._revalidate_and_refresh_rows()
 
         return False
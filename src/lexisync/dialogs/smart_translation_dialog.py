@@ -1100,7 +1100,7 @@ class SmartTranslationDialog(QDialog):
             )
 
             QMessageBox.information(self, _("Success"), msg)
-            self.app.glossary_analysis_cache.clear()
+            self.app.invalidate_glossary_cache()
         else:
             QMessageBox.critical(self, _("Error"), msg)
 
@@ -1514,6 +1514,8 @@ class SmartTranslationDialog(QDialog):
             QMessageBox.warning(self, _("Warning"), _("No items to review."))
             return
 
+        self.app._prefetch_tm_matches(self.target_items, config_snapshot)
+
         dialog = InteractiveReviewDialog(self, self.app, self.target_items, context_provider, config_snapshot)
         dialog.exec()
 
@@ -1624,6 +1626,9 @@ class SmartTranslationDialog(QDialog):
         def context_provider(ts_id, p_idx=0):
             return self.app._generate_universal_context(ts_id, config_snapshot, plural_index=p_idx)
 
+        # 预取整批 TM 模糊匹配，逐条构建上下文时直接命中缓存
+        self.app._prefetch_tm_matches(self.target_items, config_snapshot)
+
         # 开始批量翻译
         self.app.ai_manager.start_batch(
             self.target_items,
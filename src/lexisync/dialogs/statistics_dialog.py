@@ -7,20 +7,28 @@ from PySide6.QtCharts import QBarCategoryAxis, QBarSet, QChart, QChartView, QHor
 from PySide6.QtCore import QEasingCurve, QMargins, QModelIndex, QPropertyAnimation, Qt, QThread, QTimer, Signal
 from PySide6.QtGui import QColor, QFont, QPainter, QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QCheckBox,
     QDialog,
+    QFileDialog,
     QFrame,
     QGridLayout,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
+    QMessageBox,
     QProgressBar,
     QPushButton,
     QScrollArea,
     QSplitter,
+    QTableWidget,
+    QTableWidgetItem,
     QTreeView,
     QVBoxLayout,
     QWidget,
 )
 
+from lexisync.services.validation_profiler import validation_profiler
 from lexisync.utils.enums import WarningType
 from lexisync.utils.localization import _
 
@@ -138,6 +146,7 @@ class StatisticsDialog(QDialog):
 
     def __init__(self, parent, translatable_objects):
         super().__init__(parent)
+        self.main_window = parent
         self.translatable_objects = translatable_objects
         self.statistics_data = {}
         self.metrics_row_index = 0
@@ -327,7 +336,10 @@ class StatisticsDialog(QDialog):
         # Metrics panel
         self._setup_metrics_panel(right_splitter)
 
-        right_splitter.setSizes([180, 520])
+        # Validation profile panel
+        self._setup_profile_panel(right_splitter)
+
+        right_splitter.setSizes([180, 400, 220])
         parent_splitter.addWidget(right_panel_widget)
 
     def _setup_chart_panel(self, parent_splitter):
@@ -378,6 +390,105 @@ class StatisticsDialog(QDialog):
 
         parent_splitter.addWidget(metrics_container)
 
+    def _setup_profile_panel(self, parent_splitter):
+        profile_container = QFrame()
+        profile_container.setObjectName("container")
+        profile_layout = QVBoxLayout(profile_container)
+        profile_layout.setContentsMargins(12, 12, 12, 12)
+
+        profile_title = QLabel(_("Validation Profile"))
+        profile_title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        profile_title.setStyleSheet("color: #333333; margin-bottom: 8px;")
+        profile_layout.addWidget(profile_title)
+
+        controls_layout = QHBoxLayout()
+        # 剖析开关只在本次会话中有效，不写入配置
+        self.profile_checkbox = QCheckBox(_("Record validation profile"))
+        self.profile_checkbox.setChecked(validation_profiler.enabled)
+        self.profile_checkbox.toggled.connect(self.on_profile_toggled)
+        controls_layout.addWidget(self.profile_checkbox)
+        controls_layout.addStretch(1)
+
+        self.profile_run_button = QPushButton(_("Run Validation"))
+        self.profile_run_button.setToolTip(_("Revalidate all entries and record the profile"))
+        self.profile_run_button.setEnabled(validation_profiler.enabled)
+        self.profile_run_button.clicked.connect(self.run_profiled_validation)
+        controls_layout.addWidget(self.profile_run_button)
+
+        profile_reset_button = QPushButton(_("Reset"))
+        profile_reset_button.clicked.connect(self.reset_profile)
+        controls_layout.addWidget(profile_reset_button)
+
+        self.profile_export_button = QPushButton(_("Export JSON..."))
+        self.profile_export_button.clicked.connect(self.export_profile)
+        controls_layout.addWidget(self.profile_export_button)
+        profile_layout.addLayout(controls_layout)
+
+        self.profile_table = QTableWidget(0, 6)
+        self.profile_table.setHorizontalHeaderLabels(
+            [_("Rule"), _("Calls"), _("Skipped %"), _("Total (ms)"), _("Mean (ms)"), _("p95 (ms)")]
+        )
+        header = self.profile_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        for column in range(1, 6):
+            header.setSectionResizeMode(column, QHeaderView.ResizeToContents)
+        self.profile_table.verticalHeader().setVisible(False)
+        self.profile_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.profile_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.profile_table.setAlternatingRowColors(True)
+        profile_layout.addWidget(self.profile_table)
+
+        parent_splitter.addWidget(profile_container)
+        self.refresh_profile_table()
+
+    def refresh_profile_table(self):
+        rows = validation_profiler.report()
+        self.profile_table.setRowCount(len(rows))
+        for row_index, row in enumerate(rows):
+            values = [
+                row["key"],
+                str(row["calls"]),
+                f"{row['skip_ratio'] * 100:.1f}",
+                f"{row['total_ms']:.2f}",
+                f"{row['mean_ms']:.4f}",
+                f"{row['p95_ms']:.4f}",
+            ]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column > 0:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.profile_table.setItem(row_index, column, item)
+        self.profile_export_button.setEnabled(bool(rows))
+
+    def on_profile_toggled(self, checked):
+        validation_profiler.set_enabled(checked)
+        self.profile_run_button.setEnabled(checked)
+
+    def run_profiled_validation(self):
+        if not hasattr(self.main_window, "revalidate_all_entries"):
+            return
+        self.main_window.revalidate_all_entries()
+        self.refresh_profile_table()
+        self.start_calculation()
+
+    def reset_profile(self):
+        validation_profiler.reset()
+        self.refresh_profile_table()
+
+    def export_profile(self):
+        filepath, __ = QFileDialog.getSaveFileName(
+            self, _("Export Validation Profile"), "validation_profile.json", "JSON Files (*.json)"
+        )
+        if not filepath:
+            return
+        try:
+            validation_profiler.export_json(filepath)
+            QMessageBox.information(self, _("Export Successful"), _("Validation profile exported successfully."))
+        except Exception as e:
+            QMessageBox.critical(
+                self, _("Export Failed"), _("Could not export validation profile: {error}").format(error=e)
+            )
+
     def _setup_buttons(self, main_layout):
         button_layout = QHBoxLayout()
         button_layout.setSpacing(10)
@@ -410,6 +521,7 @@ class StatisticsDialog(QDialog):
 
     def start_calculation(self):
         self.refresh_button.setEnabled(False)
+        self.refresh_profile_table()
         self.progress_bar.setVisible(True)
         self.progress_bar.animation.stop()
         self.progress_bar.setValue(0)
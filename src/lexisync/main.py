@@ -51,8 +51,12 @@ class AppController(QObject):
 
 
 if __name__ == "__main__":
+    import multiprocessing
     import os
 
+    # 打包后的程序需要此调用，进程池（并行校验）的子进程才不会重新启动整个应用
+    multiprocessing.freeze_support()
+
     log_level = logging.DEBUG if debug_utils.IS_DEBUG_MODE else logging.INFO
     log_stream = sys.stdout if sys.stdout is not None else open(os.devnull, "w")
     logging.basicConfig(
@@ -1,7 +1,6 @@
 # Copyright (c) 2025-2026, TheSkyC
 # SPDX-License-Identifier: Apache-2.0
 
-from copy import deepcopy
 import datetime
 import json
 import logging
@@ -57,6 +56,7 @@ from PySide6.QtWidgets import (
     QMenu,
     QMessageBox,
     QProgressBar,
+    QProgressDialog,
     QSizePolicy,
     QStatusBar,
     QTableView,
@@ -76,18 +76,36 @@ from lexisync.services.ai_translator import AITranslator
 from lexisync.services.ai_worker import AIWorker
 from lexisync.services.build_service import BuildWorker
 from lexisync.services.code_file_service import extract_translatable_strings, save_translated_code
+from lexisync.services.db_maintenance_service import (
+    MAINTENANCE_INTERVAL_SEC,
+    DBMaintenanceWorker,
+    format_maintenance_report,
+)
 from lexisync.services.expansion_ratio_service import ExpansionRatioService
 from lexisync.services.export_service import export_qa_report
 from lexisync.services.file_monitor_service import FileMonitorService
 from lexisync.services.format_manager import FormatManager
+from lexisync.services.glossary_hit_index import GlossaryHitIndex, GlossaryHitIndexWorker
 from lexisync.services.glossary_service import GlossaryService
 from lexisync.services.glossary_worker import GlossaryAnalysisWorker
+from lexisync.services.parallel_validation import (
+    PARALLEL_VALIDATION_MIN_STRINGS,
+    ParallelValidationWorker,
+    apply_plugin_rules,
+    run_validation_parallel,
+)
 from lexisync.services.project_manager import ProjectManager
+from lexisync.services.project_saver import ProjectSaver
 from lexisync.services.project_service import create_project, load_project_data, save_project
 from lexisync.services.prompt_service import generate_prompt_from_structure
 from lexisync.services.search_service import SearchService
+from lexisync.services.tm_prefetch_worker import TMPrefetchWorker
 from lexisync.services.tm_service import TMService
-from lexisync.services.validation_service import placeholder_regex, run_validation_on_all
+from lexisync.services.undo_journal import UndoJournal
+from lexisync.services.validation_engine import IncrementalValidator, validation_signature
+from lexisync.services.validation_profiler import validation_profiler
+from lexisync.services.validation_result_cache import ValidationResultCache, validation_cache_path
+from lexisync.services.validation_service import get_validation_context, placeholder_regex, validation_context_cache
 from lexisync.ui_components.banner_overlay import BannerOverlay
 from lexisync.ui_components.cloud_dashboard_panel import CloudDashboardPanel
 from lexisync.ui_components.comment_status_panel import CommentStatusPanel
@@ -109,13 +127,12 @@ from lexisync.utils.constants import (
     DEFAULT_API_URL,
     DEFAULT_EXTRACTION_PATTERNS,
     DEFAULT_KEYBINDINGS,
-    MAX_UNDO_HISTORY,
     SUPPORTED_LANGUAGES,
 )
 from lexisync.utils.enums import AIOperationType, WarningType
 from lexisync.utils.localization import _, lang_manager
 from lexisync.utils.path_utils import get_app_data_path
-from lexisync.utils.text_utils import generate_ngrams, get_linguistic_length
+from lexisync.utils.text_utils import get_linguistic_length
 
 logger = logging.getLogger(__name__)
 
@@ -174,6 +191,7 @@ class LexiSyncApp(QMainWindow):
         self.ai_manager.item_result.connect(self._handle_ai_translation_result)
         self.ai_translation_batch_ids_queue = []
         self.is_ai_translating_batch = False
+        self._tm_prefetch = None
         self.ai_thread_pool = QThreadPool.globalInstance()
         self.ai_batch_successful_translations_for_undo = []
         self._single_ai_active_count = 0
@@ -190,6 +208,10 @@ class LexiSyncApp(QMainWindow):
         self.file_monitor = FileMonitorService(self)
         self.file_monitor.file_changed_on_disk.connect(self.on_file_changed_externally)
 
+        # 项目的增量保存，自动保存在后台线程写入
+        self.project_saver = ProjectSaver(self)
+        self.project_saver.finished.connect(self._on_project_auto_saved)
+
         self.drop_target_widget = None
 
         self.is_project_mode = False
@@ -242,14 +264,20 @@ class LexiSyncApp(QMainWindow):
 
         self.glossary_service = GlossaryService()
         self.setup_glossary_service()
-        self.glossary_analysis_cache = {}
-        self._validation_glossary_matcher = None
+        self.glossary_hits = GlossaryHitIndex(self.glossary_service)
+        self.glossary_hit_index_timer = QTimer(self)
+        self.glossary_hit_index_timer.setSingleShot(True)
+        self.glossary_hit_index_timer.timeout.connect(self._start_glossary_hit_index_build)
+        self.validation_engine = IncrementalValidator()
+        self._parallel_validation = None
 
         self.build_thread = None
         self.build_worker = None
 
-        self.undo_history = []
-        self.redo_history = []
+        # 撤销/重做记录共享一份内存预算，文本以驻留或差异形式保存
+        self.undo_journal = UndoJournal()
+        self.undo_history = self.undo_journal.undo
+        self.redo_history = self.undo_journal.redo
         self.current_selected_ts_id = None
         self.search_dialog_instance = None
         self.ai_translator = AITranslator(
@@ -273,6 +301,12 @@ class LexiSyncApp(QMainWindow):
         self.auto_save_timer.timeout.connect(self.auto_save_project)
         self.setup_auto_save_timer()
 
+        # 空闲时定期维护 TM / 术语库
+        self._db_maintenance_worker = None
+        self.db_maintenance_timer = QTimer(self)
+        self.db_maintenance_timer.timeout.connect(self._maybe_run_db_maintenance)
+        self.db_maintenance_timer.start(15 * 60 * 1000)
+
         self.placeholder_regex = placeholder_regex
         self._placeholder_validation_job = None
 
@@ -661,7 +695,7 @@ class LexiSyncApp(QMainWindow):
 
         # --- Other QA items ---
         self.action_run_validation_on_all = QAction(_("Re-validate All Entries"), self)
-        self.action_run_validation_on_all.triggered.connect(self._run_and_refresh_with_validation)
+        self.action_run_validation_on_all.triggered.connect(self.revalidate_all_entries)
         self.action_run_validation_on_all.setEnabled(False)
         self.qa_menu.addAction(self.action_run_validation_on_all)
 
@@ -735,6 +769,27 @@ class LexiSyncApp(QMainWindow):
         else:
             self.auto_save_timer.stop()
 
+    def _maybe_run_db_maintenance(self):
+        if self._db_maintenance_worker is not None or self.is_ai_translating_batch:
+            return
+        # 仅在用户离开窗口时运行，避免 VACUUM 期间阻塞写入
+        if QApplication.activeWindow() is not None and not self.isMinimized():
+            return
+        last_run = self.config.get("db_maintenance_last_run", 0)
+        if time.time() - last_run < MAINTENANCE_INTERVAL_SEC:
+            return
+
+        worker = DBMaintenanceWorker([self.tm_service, self.glossary_service])
+        worker.signals.finished.connect(self._on_db_maintenance_finished)
+        self._db_maintenance_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_db_maintenance_finished(self, reports):
+        self._db_maintenance_worker = None
+        self.config["db_maintenance_last_run"] = time.time()
+        self.save_config()
+        logger.info("Background database maintenance finished:\n" + format_maintenance_report(reports))
+
     def setup_tm_service(self):
         global_tm_dir = os.path.join(get_app_data_path(), "tm")
         project_tm_dir = None
@@ -744,6 +799,7 @@ class LexiSyncApp(QMainWindow):
             project_settings = self.project_config.get("settings", {})
             use_global = project_settings.get("use_global_tm", True)
         final_global_tm_dir = global_tm_dir if use_global else None
+        self._cancel_tm_prefetch(wait=True)
         self.tm_service.connect_databases(final_global_tm_dir, project_tm_dir)
 
     def setup_glossary_service(self):
@@ -1394,6 +1450,7 @@ class LexiSyncApp(QMainWindow):
     def refresh_sort(self):
         current_sort_column = self.table_view.horizontalHeader().sortIndicatorSection()
         current_sort_order = self.table_view.horizontalHeader().sortIndicatorOrder()
+        self.sheet_model.invalidate_columns()
         self.sheet_model.apply_filter_and_sort(
             search_term=self.search_entry.text() if self.search_entry.text() != _("Quick search...") else "",
             show_ignored=self.show_ignored_var,
@@ -1435,7 +1492,8 @@ class LexiSyncApp(QMainWindow):
                     self.mark_modified()
                     self.update_statusbar(_("Language pair updated. Re-validating all entries..."), persistent=True)
                     QApplication.processEvents()
-                    self._run_and_refresh_with_validation()
+                    self._revalidate_and_refresh_rows()
+                    self.invalidate_glossary_cache()
                     self.update_statusbar(
                         _("Validation complete. Language pair set to {src} -> {tgt}.").format(
                             src=self.source_language, tgt=self.current_target_language
@@ -1471,6 +1529,22 @@ class LexiSyncApp(QMainWindow):
             return
         if not (self.current_project_path or self.current_file_path or self.current_file_path):
             return
+        if self.is_project_mode and self.current_project_path:
+            # 只写入修改过的条目，写入在后台进行；上一次写入尚未完成时留到下次
+            if self.project_saver.is_saving:
+                return
+            try:
+                self._save_current_view_changes()
+                started = self.project_saver.save_in_background(self.current_project_path)
+            except Exception as e:
+                logger.error(f"Auto-save failed: {e}", exc_info=True)
+                self.update_statusbar(_("Auto-save failed: {error}").format(error=e), persistent=True)
+                return
+            if started:
+                # 写入期间的新修改会重新标记为已修改
+                self.mark_modified(False)
+                self.update_statusbar(_("Auto-saving..."), persistent=True)
+            return
         focused_widget = QApplication.focusWidget()
         self.update_statusbar(_("Auto-saving..."), persistent=True)
         QApplication.processEvents()
@@ -1481,6 +1555,13 @@ class LexiSyncApp(QMainWindow):
             if focused_widget and QApplication.focusWidget() != focused_widget:
                 focused_widget.setFocus()
 
+    def _on_project_auto_saved(self, success, error):
+        if success:
+            self.update_statusbar(_("Project auto-saved."), persistent=False)
+        else:
+            self.mark_modified(True)
+            self.update_statusbar(_("Auto-save failed: {error}").format(error=error), persistent=True)
+
     def change_language(self, new_lang_code):
         if new_lang_code != self.config.get("language"):
             self.config["language"] = new_lang_code
@@ -1662,22 +1743,13 @@ class LexiSyncApp(QMainWindow):
         if not source_model:
             return
 
-        data_source = self.translatable_objects
         id_to_index_map = source_model._id_to_raw_index_map
 
-        # 直接提取出有警告的对象的 ID
-        error_ids = [ts.id for ts in data_source if ts.warnings and not ts.is_warning_ignored]
-        warning_ids = [ts.id for ts in data_source if ts.minor_warnings and not ts.is_warning_ignored]
-        info_ids = [ts.id for ts in data_source if ts.infos and not ts.is_warning_ignored]
-
-        # 批量转换为 row 索引
-        errors = [id_to_index_map[tid] for tid in error_ids if tid in id_to_index_map]
-        warnings = [id_to_index_map[tid] for tid in warning_ids if tid in id_to_index_map]
-        infos = [id_to_index_map[tid] for tid in info_ids if tid in id_to_index_map]
-
-        self.marker_bar.add_markers("error", errors)
-        self.marker_bar.add_markers("warning", warnings)
-        self.marker_bar.add_markers("info", infos)
+        # 校验引擎增量维护各级别的条目 ID，这里只需转换为 row 索引
+        for kind in ("error", "warning", "info"):
+            ids = self.validation_engine.marker_ids(kind)
+            rows = [id_to_index_map[tid] for tid in ids if tid in id_to_index_map]
+            self.marker_bar.add_markers(kind, rows)
 
     def update_search_markers(self, source_rows: list):
         if self.marker_bar:
@@ -2132,7 +2204,17 @@ class LexiSyncApp(QMainWindow):
 
     def invalidate_glossary_cache(self):
         """当术语库内容、目标语言或项目文件发生变化时调用"""
-        self._validation_glossary_matcher = None
+        self._schedule_glossary_hit_index()
+
+    def _schedule_glossary_hit_index(self):
+        self.glossary_hit_index_timer.start(500)
+
+    def _start_glossary_hit_index_build(self):
+        source_pool = self.all_project_strings if self.is_project_mode else self.translatable_objects
+        worker = GlossaryHitIndexWorker(
+            self.glossary_hits, source_pool, self.source_language, self.current_target_language
+        )
+        QThreadPool.globalInstance().start(worker)
 
     def add_glossary_entry(self, from_editor=False):
         from lexisync.dialogs.add_glossary_entry_dialog import AddGlossaryEntryDialog
@@ -2208,8 +2290,6 @@ class LexiSyncApp(QMainWindow):
                 ts_obj = self._find_ts_obj_by_id(self.current_selected_ts_id)
                 if ts_obj:
                     current_p_idx = getattr(self.details_panel, "current_plural_index", 0)
-                    cache_key = f"{ts_obj.id}_{current_p_idx}"
-                    self.glossary_analysis_cache.pop(cache_key, None)
                     self.trigger_glossary_analysis(ts_obj, plural_index=current_p_idx)
         else:
             QMessageBox.critical(self, _("Error"), _("Failed to add glossary entry: {error}").format(error=message))
@@ -2303,7 +2383,7 @@ class LexiSyncApp(QMainWindow):
 
         record = {
             "type": action_type,
-            "data": deepcopy(data),
+            "data": data,
             "timestamp": datetime.datetime.now().strftime("%H:%M:%S"),
             "description": description,
             "icon_type": icon_type,
@@ -2311,9 +2391,8 @@ class LexiSyncApp(QMainWindow):
             "user": user,
         }
 
+        # append 时复制并压缩变更，超出数量或内存预算时丢弃最旧的记录
         self.undo_history.append(record)
-        if len(self.undo_history) > MAX_UNDO_HISTORY:
-            self.undo_history.pop(0)
         self.redo_history.clear()
 
         self.action_undo.setEnabled(True)
@@ -2613,6 +2692,8 @@ class LexiSyncApp(QMainWindow):
                 event.ignore()
                 return
             self.stop_batch_ai_translation(silent=True)
+        self.validation_engine.save_result_cache()
+        self._cancel_tm_prefetch(wait=True)
         self.tm_service.disconnect_databases()
         self.glossary_service.disconnect_databases()
         self.save_window_state()
@@ -2941,8 +3022,10 @@ class LexiSyncApp(QMainWindow):
             self._trigger_glossary_import(filepath, is_project_import=self.is_project_mode)
 
         elif current_target is self.tm_panel:
-            if not filepath.lower().endswith(".xlsx"):
-                QMessageBox.warning(self, _("Invalid File"), _("Only .xlsx files can be imported into the TM."))
+            if not filepath.lower().endswith((".tmx", ".xlsx")):
+                QMessageBox.warning(
+                    self, _("Invalid File"), _("Only .tmx and .xlsx files can be imported into the TM.")
+                )
                 return
             from lexisync.dialogs.settings_dialog import SettingsDialog
 
@@ -3498,6 +3581,7 @@ class LexiSyncApp(QMainWindow):
 
         try:
             from lexisync.services.project_service import TRANSLATION_DIR, rebuild_project_structure
+            from lexisync.services.translation_store import entry_record, get_translation_store
 
             # 2. 调用服务层执行全量重构
             target_langs = self.project_config.get("target_languages", [])
@@ -3570,17 +3654,13 @@ class LexiSyncApp(QMainWindow):
                     # 1. 获取该语言的“原始重构结果”（全量新 ID）
                     raw_lang_list = rebuild_data.get(lang, [])
 
-                    # 2. 获取该语言的“旧数据文件”（用于找回 Obsolete 项）
-                    old_lang_file = Path(self.current_project_path) / TRANSLATION_DIR / f"{lang}.json"
+                    # 2. 获取该语言的“旧数据”（用于找回 Obsolete 项）
+                    lang_store = get_translation_store(Path(self.current_project_path) / TRANSLATION_DIR, lang)
                     old_lang_map = {}
-                    if old_lang_file.exists():
-                        try:
-                            with open(old_lang_file, encoding="utf-8") as f:
-                                old_data = json.load(f)
-                                for item in old_data:
-                                    old_lang_map[item["id"]] = item
-                        except Exception:
-                            pass
+                    try:
+                        old_lang_map = lang_store.load(retained_old_ids)
+                    except Exception:
+                        pass
 
                     # 3. 构建该语言的最终列表
                     final_lang_list = []
@@ -3608,11 +3688,7 @@ class LexiSyncApp(QMainWindow):
                     final_lang_list.sort(key=lambda x: x.line_num_in_file if x.line_num_in_file > 0 else 999999)
 
                     # 4. 保存
-                    data_to_save = [ts.to_dict() for ts in final_lang_list]
-                    from lexisync.utils.file_utils import atomic_open
-
-                    with atomic_open(str(old_lang_file), "w", encoding="utf-8") as f:
-                        json.dump(data_to_save, f, indent=4, ensure_ascii=False)
+                    lang_store.replace_all(entry_record(ts) for ts in final_lang_list)
 
                 self.update_statusbar(_("Synchronizing data..."), persistent=True)
 
@@ -3674,6 +3750,7 @@ class LexiSyncApp(QMainWindow):
 
     def _reset_app_state(self):
         self.file_monitor.stop_monitoring()
+        self.validation_engine.attach_result_cache(None)
 
         if hasattr(self, "notification_banner"):
             self.notification_banner.force_hide()
@@ -3774,6 +3851,8 @@ class LexiSyncApp(QMainWindow):
             self.update_recent_files_menu()
 
     def prompt_save_if_modified(self):
+        # 先等待进行中的自动保存：写入失败时会重新标记为已修改，下面的提示才能覆盖这些修改
+        self.project_saver.wait()
         active_path = self.current_project_path or self.current_file_path or self.current_file_path
         if active_path:
             self._update_and_save_recent_entry(active_path)
@@ -3800,6 +3879,7 @@ class LexiSyncApp(QMainWindow):
         current_sort_col = header.sortIndicatorSection()
         current_sort_order = header.sortIndicatorOrder()
 
+        self.sheet_model.invalidate_columns()
         self.sheet_model.apply_filter_and_sort(
             search_term=self.search_entry.text() if self.search_entry.text() != _("Quick search...") else "",
             show_ignored=self.show_ignored_var,
@@ -4041,6 +4121,11 @@ class LexiSyncApp(QMainWindow):
                     + [res["new_obj"] for res in diff_results["modified"]]
                 )
                 self.all_project_strings.extend(final_strings_for_file)
+                # 消失的字符串从各语言的翻译数据中删除
+                final_ids = {ts.id for ts in final_strings_for_file}
+                self.project_saver.remove_entries(
+                    self.current_project_path, [ts_id for ts_id in old_map_by_id if ts_id not in final_ids]
+                )
 
                 self._rebuild_string_cache_indexes()
                 self._switch_active_file(self.current_active_source_file_id)
@@ -4063,13 +4148,8 @@ class LexiSyncApp(QMainWindow):
         ts_obj.warnings.extend(slow_warnings)
         ts_obj.minor_warnings.extend(slow_minor_warnings)
         ts_obj.update_style_cache()
-        visual_row = self.sheet_model.get_visual_row_by_id(ts_id)
-        if visual_row != -1:
-            source_index = self.sheet_model.index(visual_row, 0)
-        if source_index.isValid():
-            first_col = source_index.siblingAtColumn(0)
-            last_col = source_index.siblingAtColumn(self.sheet_model.columnCount() - 1)
-            self.sheet_model.dataChanged.emit(first_col, last_col)
+        self.validation_engine.record(ts_obj)
+        self._refresh_sheet_rows([ts_id])
 
     def _sort_sheet_column(self, logical_index):
         current_order = self.table_view.horizontalHeader().sortIndicatorOrder()
@@ -4498,7 +4578,7 @@ class LexiSyncApp(QMainWindow):
         current_translation_text = self.details_panel.translation_edit_text.toPlainText()
 
         # 计算净化后的字符数
-        orig_len = get_linguistic_length(ts_obj.original_semantic)
+        orig_len = ts_obj.linguistic_length(ts_obj.original_semantic)
         trans_len = get_linguistic_length(current_translation_text)
         char_counts = (orig_len, trans_len)
 
@@ -4516,7 +4596,12 @@ class LexiSyncApp(QMainWindow):
 
     def _update_history_panel(self):
         if hasattr(self, "history_panel"):
-            self.history_panel.refresh(self.undo_history, self.redo_history, self.current_active_source_file_id)
+            self.history_panel.refresh(
+                self.undo_history,
+                self.redo_history,
+                self.current_active_source_file_id,
+                memory_usage=(self.undo_journal.memory_bytes(), self.undo_journal.memory_budget),
+            )
 
     def _clear_history(self):
         reply = QMessageBox.question(
@@ -4759,7 +4844,7 @@ class LexiSyncApp(QMainWindow):
                     def do_refresh():
                         logger.debug("Executing delayed refresh for project import.")
                         self.setup_glossary_service()
-                        self._run_and_refresh_with_validation()
+                        self._revalidate_and_refresh_rows()
 
                     QTimer.singleShot(0, do_refresh)
                 elif (
@@ -4794,31 +4879,21 @@ class LexiSyncApp(QMainWindow):
         progress_dialog.show()
 
     def trigger_glossary_analysis(self, ts_obj, is_manual=False, plural_index=0):
-        # 使用组合键缓存，区分单复数
-        cache_key = f"{ts_obj.id}_{plural_index}"
-        if cache_key in self.glossary_analysis_cache:
-            self._handle_glossary_analysis_result(
-                ts_obj.id, plural_index, self.glossary_analysis_cache[cache_key], is_manual
-            )
+        # 术语索引已加载时直接读取预计算的命中，否则交给后台加载
+        matches = self.glossary_hits.get_hits(
+            ts_obj, plural_index, self.source_language, self.current_target_language, load=False
+        )
+        if matches is not None:
+            self._handle_glossary_analysis_result(ts_obj.id, plural_index, matches, is_manual)
             return
 
         self.glossary_panel.clear_matches()
 
-        # 根据索引确定要分析的文本
-        text_to_analyze = ts_obj.original_semantic
-        if ts_obj.is_plural and plural_index != ts_obj.singular_index:
-            text_to_analyze = ts_obj.original_plural or ts_obj.original_semantic
-
-        worker = GlossaryAnalysisWorker(
-            self, ts_obj.id, text_to_analyze, is_manual=is_manual, plural_index=plural_index
-        )
+        worker = GlossaryAnalysisWorker(self, ts_obj, is_manual=is_manual, plural_index=plural_index)
         worker.signals.finished.connect(self._handle_glossary_analysis_result)
         self.ai_thread_pool.start(worker)
 
     def _handle_glossary_analysis_result(self, ts_id, plural_index, matches, is_manual):
-        cache_key = f"{ts_id}_{plural_index}"
-        self.glossary_analysis_cache[cache_key] = matches
-
         if self.current_selected_ts_id == ts_id:
             current_ui_idx = getattr(self.details_panel, "current_plural_index", 0)
             if current_ui_idx == plural_index:
@@ -4841,6 +4916,7 @@ class LexiSyncApp(QMainWindow):
         self.tm_panel.clear_selected_tm_btn.setEnabled(False)
 
     def _run_and_refresh_with_validation(self):
+        """条目列表被替换（加载、切换文件、增删条目）后调用：校验脏条目并重置表格模型"""
         if not self.translatable_objects:
             self.sheet_model.set_translatable_objects([])
             if self.marker_bar:
@@ -4848,15 +4924,138 @@ class LexiSyncApp(QMainWindow):
             return
         self.update_statusbar(_("Validating all entries..."), persistent=True)
         QApplication.processEvents()
-        run_validation_on_all(self.translatable_objects, self.config, self)
+        self._sync_validation_result_cache()
+        validated = self.validation_engine.revalidate(self.translatable_objects, self.config, self)
 
+        validated_ids = {ts_obj.id for ts_obj in validated}
         for ts_obj in self.translatable_objects:
-            ts_obj.update_style_cache()
+            if ts_obj.id not in validated_ids:
+                ts_obj.update_style_cache()
+        self.validation_engine.rebuild_markers(self.translatable_objects)
         self.sheet_model.set_translatable_objects(self.translatable_objects)
         self.refresh_sheet_preserve_selection()
         self.force_refresh_ui_for_current_selection()
         self.update_statusbar(_("Validation complete."), persistent=False)
         self.update_warning_markers()
+        self._schedule_glossary_hit_index()
+
+    def _revalidate_and_refresh_rows(self, changed_ids=None):
+        """
+        条目列表不变、内容或校验配置发生变化时调用：只重新校验脏条目，
+        并只为受影响的行发出 dataChanged，不重置模型。
+        :param changed_ids: 调用方已修改、即使校验结果不变也需要重绘的条目 ID
+        """
+        if not self.translatable_objects or self.sheet_model._all_data is not self.translatable_objects:
+            self._run_and_refresh_with_validation()
+            return
+
+        validated = self.validation_engine.revalidate(self.translatable_objects, self.config, self)
+        row_ids = {ts_obj.id for ts_obj in validated}
+        if changed_ids:
+            # 审阅状态等不影响校验的修改仍需刷新样式缓存
+            for ts_id in set(changed_ids) - row_ids:
+                ts_obj = self._find_ts_obj_by_id(ts_id)
+                if ts_obj:
+                    ts_obj.update_style_cache()
+                    self.validation_engine.record(ts_obj)
+            row_ids.update(changed_ids)
+        self._refresh_sheet_rows(row_ids)
+
+        self.update_counts_display()
+        self.update_warning_markers()
+        self.force_refresh_ui_for_current_selection()
+
+    def _refresh_sheet_rows(self, ts_ids):
+        """刷新被修改的行；条目因过滤或排序移入、移出或移动位置时恢复选中行"""
+        if not self.sheet_model.refresh_rows_by_ids(ts_ids):
+            return
+        selected_id = self.current_selected_ts_id
+        if selected_id and self.sheet_model.get_visual_row_by_id(selected_id) != -1:
+            self.select_sheet_row_by_id(selected_id)
+
+    def revalidate_all_entries(self):
+        """
+        菜单 "重新校验全部条目"：忽略所有状态戳，完整重新校验。
+        项目模式下校验全部已加载的文件，条目较多时交给进程池并行校验。
+        """
+        validation_context_cache.invalidate()
+        self.validation_engine.invalidate_all()
+        pool = (
+            self.all_project_strings if self.is_project_mode and self.all_project_strings else self.translatable_objects
+        )
+        # 子进程中的校验不计入剖析数据，剖析模式下始终在主进程中校验
+        if len(pool) >= PARALLEL_VALIDATION_MIN_STRINGS and not validation_profiler.enabled:
+            self._start_parallel_validation(pool)
+        else:
+            self._run_and_refresh_with_validation()
+
+    def _sync_validation_result_cache(self):
+        """项目模式下为当前目标语言挂接持久化的校验结果缓存，其他模式不使用"""
+        if self.is_project_mode and self.current_project_path:
+            path = validation_cache_path(self.current_project_path, self.current_target_language)
+            result_cache = self.validation_engine.result_cache
+            if result_cache is None or result_cache.path != path:
+                self.validation_engine.attach_result_cache(ValidationResultCache(path))
+        else:
+            self.validation_engine.attach_result_cache(None)
+
+    def _start_parallel_validation(self, ts_objects):
+        if self._parallel_validation is not None:
+            return
+        self._sync_validation_result_cache()
+        engine = self.validation_engine
+        ctx_env, stamp_prefix = engine.prepare(self.config, self)
+        dirty = []
+        for ts_obj in ts_objects:
+            signature = validation_signature(ts_obj)
+            if engine.needs_validation(ts_obj, stamp_prefix, ctx_env, signature) and not engine.apply_cached_result(
+                ts_obj, stamp_prefix, ctx_env, signature
+            ):
+                dirty.append(ts_obj)
+        if not dirty:
+            self._run_and_refresh_with_validation()
+            return
+
+        worker = ParallelValidationWorker(dirty, ctx_env)
+        progress_dialog = QProgressDialog(
+            _("Validating {count} entries...").format(count=len(dirty)), _("Cancel"), 0, len(dirty), self
+        )
+        progress_dialog.setWindowTitle(_("Validating"))
+        progress_dialog.setWindowModality(Qt.WindowModal)
+        progress_dialog.setMinimumDuration(0)
+        progress_dialog.canceled.connect(worker.cancel)
+        worker.signals.progress.connect(lambda done, total: progress_dialog.setValue(done))
+        worker.signals.chunk_ready.connect(self._on_parallel_validation_chunk)
+        worker.signals.finished.connect(self._on_parallel_validation_finished)
+
+        self._parallel_validation = (worker, ctx_env, stamp_prefix, progress_dialog)
+        self.update_statusbar(_("Validating all entries..."), persistent=True)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_parallel_validation_chunk(self, start, signatures, items, results):
+        if self._parallel_validation is None:
+            return
+        worker, ctx_env, stamp_prefix, __ = self._parallel_validation
+        if ctx_env["plugin_rules"]:
+            # 插件规则在主线程中执行，插件不需要考虑线程安全
+            apply_plugin_rules(items, results, ctx_env)
+        chunk = worker.ts_objects[start : start + len(results)]
+        for ts_obj, signature, result in zip(chunk, signatures, results, strict=True):
+            if self.validation_engine.apply_result(ts_obj, stamp_prefix, signature, result):
+                self.validation_engine.store_result(ts_obj, ctx_env, signature, result)
+
+    def _on_parallel_validation_finished(self, completed):
+        if self._parallel_validation is None:
+            return
+        progress_dialog = self._parallel_validation[-1]
+        self._parallel_validation = None
+        progress_dialog.close()
+        progress_dialog.deleteLater()
+
+        # 当前视图中未完成（取消或校验期间被修改）的条目在这里补校验
+        self._run_and_refresh_with_validation()
+        if not completed:
+            self.update_statusbar(_("Validation cancelled. Remaining entries will be validated later."))
 
     def auto_fix_all_issues(self):
         if not self.translatable_objects:
@@ -4973,7 +5172,7 @@ class LexiSyncApp(QMainWindow):
         # Step 1: Rule Pass
         fixed_by_rules_count = self._apply_rule_fixes_silently()
         if fixed_by_rules_count > 0:
-            self._run_and_refresh_with_validation()
+            self._revalidate_and_refresh_rows()
 
         # Step 2: Filter Pass
         items_for_ai = [
@@ -5109,12 +5308,10 @@ class LexiSyncApp(QMainWindow):
         self.update_ai_related_ui_state()
 
     def _build_glossary_context(self, ts_obj, p_idx=0):
-        cache_key = f"{ts_obj.id}_{p_idx}"
-        if cache_key in self.glossary_analysis_cache:
-            matches = self.glossary_analysis_cache[cache_key]
-            if matches:
-                lines = [f"- {m['source']}: {', '.join(t['target'] for t in m['translations'])}" for m in matches]
-                return "\n".join(lines)
+        matches = self.glossary_hits.get_hits(ts_obj, p_idx, self.source_language, self.current_target_language)
+        if matches:
+            lines = [f"- {m['source']}: {', '.join(t['target'] for t in m['translations'])}" for m in matches]
+            return "\n".join(lines)
         return ""
 
     def ai_fix_current_item(self):
@@ -5168,17 +5365,15 @@ class LexiSyncApp(QMainWindow):
 
         # 构建术语表上下文
         glossary_text = ""
-        cache_key = f"{ts_obj.id}_{current_p_idx}"
-        if cache_key in self.glossary_analysis_cache:
-            matches = self.glossary_analysis_cache[cache_key]
-            if matches:
-                lines = [f"| {_('Source')} | {_('Target')} |", "|---|---|"]
-                for m in matches:
-                    src = m["source"]
-                    # 提取所有推荐译文
-                    tgts = ", ".join([t["target"] for t in m["translations"]])
-                    lines.append(f"| {src} | {tgts} |")
-                glossary_text = "\n".join(lines)
+        matches = self.glossary_hits.get_hits(ts_obj, current_p_idx, self.source_language, self.current_target_language)
+        if matches:
+            lines = [f"| {_('Source')} | {_('Target')} |", "|---|---|"]
+            for m in matches:
+                src = m["source"]
+                # 提取所有推荐译文
+                tgts = ", ".join([t["target"] for t in m["translations"]])
+                lines.append(f"| {src} | {tgts} |")
+            glossary_text = "\n".join(lines)
 
         if not glossary_text and hasattr(self, "glossary_service"):
             pass
@@ -5693,13 +5888,7 @@ class LexiSyncApp(QMainWindow):
                 old_value=old_po_comment_for_hook,
             )
         ts_obj.update_style_cache()
-        visual_row = self.sheet_model.get_visual_row_by_id(ts_obj.id)
-        if visual_row != -1:
-            source_index = self.sheet_model.index(visual_row, 0)
-        if source_index.isValid():
-            first_col_index = source_index.siblingAtColumn(0)
-            last_col_index = source_index.siblingAtColumn(self.sheet_model.columnCount() - 1)
-            self.sheet_model.dataChanged.emit(first_col_index, last_col_index)
+        self._refresh_sheet_rows([ts_obj.id])
         self.mark_modified()
         self.update_statusbar(_("Comment updated."))
         if hasattr(self.comment_status_panel, "highlighter"):
@@ -5723,7 +5912,7 @@ class LexiSyncApp(QMainWindow):
             "single_change",
             {"string_id": ts_obj.id, "field": "comment", "old_value": old_comment, "new_value": new_comment},
         )
-        self._run_and_refresh_with_validation()
+        self._revalidate_and_refresh_rows({ts_obj.id})
         self.update_statusbar(_("Comment updated for ID {id}...").format(id=str(ts_obj.id)[:8]))
         self.mark_modified()
         return True
@@ -5733,50 +5922,17 @@ class LexiSyncApp(QMainWindow):
             return
 
         # 1. 更新数据
-        if len(changed_ids) > 1 and not skip_validation:
-            from lexisync.services.validation_service import build_validation_context, validate_string
-
-            ctx_env = build_validation_context(self.config, self)
-            for ts_id in changed_ids:
-                ts_obj = self._find_ts_obj_by_id(ts_id)
-                if ts_obj:
-                    validate_string(ts_obj, ctx_env)
-                    ts_obj.update_style_cache()
+        changed_objs = [ts_obj for ts_obj in map(self._find_ts_obj_by_id, changed_ids) if ts_obj]
+        if not skip_validation:
+            self.validation_engine.mark_dirty(changed_objs)
+            self.validation_engine.revalidate(changed_objs, self.config, self)
         else:
-            for ts_id in changed_ids:
-                ts_obj = self._find_ts_obj_by_id(ts_id)
-                if ts_obj:
-                    if not skip_validation:
-                        from lexisync.services.validation_service import validate_single_string
-
-                        validate_single_string(ts_obj, self.config, self)
-                    ts_obj.update_style_cache()
-
-        # 2. UI 刷新逻辑
-        if len(changed_ids) > 200:
-            self.sheet_model.layoutChanged.emit()
-            if self.marker_bar:
-                self.update_warning_markers()
-            return
-
-        # 收集受影响的视觉行
-        rows_to_update = []
-        for ts_id in changed_ids:
-            r = self.sheet_model.get_visual_row_by_id(ts_id)
-            if r != -1:
-                rows_to_update.append(r)
-
-        if not rows_to_update:
-            return
-
-        min_row = min(rows_to_update)
-        max_row = max(rows_to_update)
-
-        top_left = self.sheet_model.index(min_row, 0)
-        bottom_right = self.sheet_model.index(max_row, self.sheet_model.columnCount() - 1)
-
-        self.sheet_model.dataChanged.emit(top_left, bottom_right)
+            for ts_obj in changed_objs:
+                ts_obj.update_style_cache()
+                self.validation_engine.record(ts_obj)
 
+        # 2. UI 刷新：只通知受影响的行
+        self._refresh_sheet_rows(changed_ids)
         self.update_counts_display()
 
         if self.marker_bar:
@@ -6241,7 +6397,7 @@ class LexiSyncApp(QMainWindow):
                 self.add_to_undo_history("bulk_excel_import", {"changes": changes_for_undo})
                 self.mark_modified()
 
-            self._run_and_refresh_with_validation()
+            self._revalidate_and_refresh_rows({change["string_id"] for change in changes_for_undo})
             if self.current_selected_ts_id:
                 self.force_refresh_ui_for_current_selection()
 
@@ -6729,7 +6885,7 @@ class LexiSyncApp(QMainWindow):
                     self.current_project_path, self.current_target_language, app_instance=self, all_files=True
                 )
                 # 运行全量验证
-                run_validation_on_all(all_strings, self.config, self)
+                run_validation_parallel(all_strings, get_validation_context(self.config, self))
                 source_pool = all_strings
             else:
                 # 当前视图（已过滤）
@@ -7429,7 +7585,7 @@ class LexiSyncApp(QMainWindow):
 
         # 3.2 Static DB Glossary
         if config["use_glossary_db"]:
-            static_terms = self._fetch_static_glossary_context(original_text)
+            static_terms = self._fetch_static_glossary_context(ts_obj, plural_index)
             if static_terms:
                 glossary_lines.extend(static_terms)
 
@@ -7593,28 +7749,61 @@ class LexiSyncApp(QMainWindow):
             logger.warning(f"Failed to fetch TM context: {e}")
             return ""
 
-    def _fetch_static_glossary_context(self, source_text):
-        try:
-            # 分词
-            candidates = generate_ngrams(source_text.lower(), min_n=1, max_n=5)
-            if not candidates:
-                return []
+    def _prefetch_tm_matches(self, items, config=None):
+        """
+        Warm the TM match cache for a whole batch in the background, so per-item
+        context building in AI workers is served from memory.
+        """
+        if config is None:
+            config = self._get_global_context_config()
+        if not config.get("use_tm") or config.get("tm_mode") != "fuzzy":
+            return
 
-            source_lang = self.source_language
-            target_lang = self.current_target_language
+        sources = []
+        for item in items:
+            ts_obj, p_idx = item if isinstance(item, tuple) else (item, 0)
+            text = ts_obj.original_semantic
+            if ts_obj.is_plural and p_idx != ts_obj.singular_index:
+                text = ts_obj.original_plural or ts_obj.original_semantic
+            if text:
+                sources.append(text)
+        if not sources:
+            return
 
-            # 批量查询
-            results = self.glossary_service.get_translations_batch(
-                list(candidates), source_lang, target_lang, include_reverse=False
-            )
+        # 同一时间只预取一批，新的批次取代尚未完成的预取
+        self._cancel_tm_prefetch()
+        worker = TMPrefetchWorker(
+            self.tm_service,
+            sources,
+            self.source_language,
+            self.current_target_language,
+            limit=config.get("tm_limit", 3),
+            threshold=config["tm_threshold"],
+        )
+        self._tm_prefetch = worker
+        QThreadPool.globalInstance().start(worker)
 
-            lines = []
-            for term, info in results.items():
-                if re.search(r"\b" + re.escape(term) + r"\b", source_text, re.IGNORECASE):
-                    targets = ", ".join([t["target"] for t in info["translations"]])
-                    lines.append(f"- {term}: {targets} (Database)")
+    def _cancel_tm_prefetch(self, wait=False):
+        """
+        取消进行中的 TM 预取。
+        :param wait: 等待正在进行的一块查询结束（切换或断开 TM 数据库前）
+        """
+        worker, self._tm_prefetch = self._tm_prefetch, None
+        if worker is None:
+            return
+        worker.cancel()
+        if QThreadPool.globalInstance().tryTake(worker):
+            # 尚未开始执行
+            return
+        if wait:
+            worker.done.wait()
 
-            return lines
+    def _fetch_static_glossary_context(self, ts_obj, plural_index=0):
+        try:
+            matches = self.glossary_hits.get_hits(
+                ts_obj, plural_index, self.source_language, self.current_target_language
+            )
+            return [f"- {m['source']}: {', '.join(t['target'] for t in m['translations'])} (Database)" for m in matches]
         except Exception as e:
             logger.warning(f"Failed to fetch glossary context: {e}")
             return []
@@ -8032,6 +8221,7 @@ class LexiSyncApp(QMainWindow):
         def batch_context_provider(ts_id, p_idx=0):
             return self._generate_universal_context(ts_id, plural_index=p_idx)
 
+        self._prefetch_tm_matches(items_queue)
         self.ai_manager.start_batch(items_queue, batch_context_provider)
 
     def _handle_ai_translation_result(self, ts_id, translated_text, error_message, op_type, plural_index=0):
@@ -8125,6 +8315,7 @@ class LexiSyncApp(QMainWindow):
 
         self.is_ai_translating_batch = False
         self.ai_batch_successful_translations_for_undo = []
+        self._cancel_tm_prefetch()
 
         self.update_ai_related_ui_state()
         self._update_view_for_ids(changed_ids)
@@ -8218,6 +8409,7 @@ class LexiSyncApp(QMainWindow):
             )
 
         self.update_statusbar(_("AI batch translation stop requested..."), persistent=True)
+        self._cancel_tm_prefetch()
         self.ai_manager.stop()
 
     def show_smart_translation_dialog(self):
@@ -8255,13 +8447,10 @@ class LexiSyncApp(QMainWindow):
             selected_rows = {idx.row() for idx in selected_indexes}
 
         selected_objs = []
-        visible_indices = self.sheet_model._visible_indices
-        all_data = self.sheet_model._all_data
-
         for row in selected_rows:
-            if 0 <= row < len(visible_indices):
-                raw_index = visible_indices[row]
-                selected_objs.append(all_data[raw_index])
+            ts_obj = self.sheet_model.get_ts_object_by_visual_row(row)
+            if ts_obj is not None:
+                selected_objs.append(ts_obj)
 
         return selected_objs
 
@@ -8340,10 +8529,10 @@ class LexiSyncApp(QMainWindow):
             return
 
         current_p_idx = getattr(self.details_panel, "current_plural_index", 0)
-        cache_key = f"{ts_obj.id}_{current_p_idx}"
 
-        if cache_key in self.glossary_analysis_cache:
-            del self.glossary_analysis_cache[cache_key]
+        # 重新从数据库加载术语索引，以反映外部对术语库的修改
+        self.glossary_service.invalidate_term_indexes()
+        self.invalidate_glossary_cache()
 
         self.update_statusbar(_("Refreshing glossary matches..."))
 
@@ -8408,7 +8597,7 @@ class LexiSyncApp(QMainWindow):
 
             if bulk_changes:
                 self.add_to_undo_history("bulk_context_menu", {"changes": bulk_changes})
-                self._run_and_refresh_with_validation()
+                self._revalidate_and_refresh_rows({change["string_id"] for change in bulk_changes})
                 if self.current_selected_ts_id in [c["string_id"] for c in bulk_changes]:
                     self.comment_status_panel.comment_edit_text.setPlainText(new_comment)
                 self.update_statusbar(_("Updated comments for {count} items.").format(count=len(bulk_changes)))
@@ -8424,6 +8613,7 @@ class LexiSyncApp(QMainWindow):
         source_lang = self.source_language
         target_lang = self.current_target_language
 
+        tasks = []
         for ts_obj in selected_objs:
             if ts_obj.is_ignored:
                 continue
@@ -8431,35 +8621,35 @@ class LexiSyncApp(QMainWindow):
             indices = ts_obj.plural_translations.keys() if ts_obj.is_plural else [0]
             for p_idx in indices:
                 source_text = ts_obj.original_semantic if p_idx == ts_obj.singular_index else ts_obj.original_plural
-                if not source_text:
-                    continue
+                if source_text:
+                    tasks.append((ts_obj, p_idx, source_text))
 
-                translation_from_tm = self.tm_service.get_translation(source_text, source_lang, target_lang)
+        # Single batch lookup instead of one TM query per string
+        tm_results = self.tm_service.get_translations_batch([t[2] for t in tasks], source_lang, target_lang)
 
-                if translation_from_tm:
-                    tm_translation_ui = translation_from_tm.replace("\\n", "\n")
-                    current_trans = (
-                        ts_obj.plural_translations.get(p_idx, "") if ts_obj.is_plural else ts_obj.translation
-                    )
+        for ts_obj, p_idx, source_text in tasks:
+            translation_from_tm = tm_results.get(source_text)
+            if translation_from_tm:
+                tm_translation_ui = translation_from_tm.replace("\\n", "\n")
+                current_trans = ts_obj.plural_translations.get(p_idx, "") if ts_obj.is_plural else ts_obj.translation
 
-                    if current_trans != tm_translation_ui:
-                        old_val = current_trans.replace("\n", "\\n")
-                        ts_obj.set_translation_internal(tm_translation_ui, plural_index=p_idx)
-                        bulk_changes.append(
-                            {
-                                "string_id": ts_obj.id,
-                                "field": "translation",
-                                "old_value": old_val,
-                                "new_value": translation_from_tm,
-                                "plural_index": p_idx,
-                            }
-                        )
-                        applied_count += 1
+                if current_trans != tm_translation_ui:
+                    old_val = current_trans.replace("\n", "\\n")
+                    ts_obj.set_translation_internal(tm_translation_ui, plural_index=p_idx)
+                    bulk_changes.append(
+                        {
+                            "string_id": ts_obj.id,
+                            "field": "translation",
+                            "old_value": old_val,
+                            "new_value": translation_from_tm,
+                            "plural_index": p_idx,
+                        }
+                    )
+                    applied_count += 1
 
         if bulk_changes:
             self.add_to_undo_history("bulk_context_menu", {"changes": bulk_changes})
-            self._run_and_refresh_with_validation()
-            self.force_refresh_ui_for_current_selection()
+            self._revalidate_and_refresh_rows({change["string_id"] for change in bulk_changes})
             self.update_statusbar(_("Applied TM to {count} selected items.").format(count=applied_count))
             self.mark_modified()
         elif selected_objs:
@@ -8525,7 +8715,7 @@ class LexiSyncApp(QMainWindow):
         self.mark_modified()
         if self.current_selected_ts_id in cleared_ids:
             self.force_refresh_ui_for_current_selection()
-        self._run_and_refresh_with_validation()
+        self._revalidate_and_refresh_rows(cleared_ids)
         self.update_statusbar(_("Cleared {count} translations.").format(count=len(bulk_changes)))
 
     def cm_ai_translate_selected(self):
@@ -8586,8 +8776,7 @@ class LexiSyncApp(QMainWindow):
                     new_obj.is_ignored = old_obj.is_ignored
                     new_obj.is_reviewed = old_obj.is_reviewed
                     new_obj.occurrences = old_obj.occurrences
-                    new_obj.context_lines = old_obj.context_lines
-                    new_obj.current_line_in_context_idx = old_obj.current_line_in_context_idx
+                    new_obj.copy_context_from(old_obj)
                     new_obj.sync_cached_text_fields()
 
                     diff_results["unchanged"].append({"old_obj": old_obj, "new_obj": new_obj})
@@ -8607,8 +8796,7 @@ class LexiSyncApp(QMainWindow):
                         new_obj.is_fuzzy = True
                         new_obj.is_reviewed = False
                         new_obj.occurrences = best_match_old_s.occurrences
-                        new_obj.context_lines = best_match_old_s.context_lines
-                        new_obj.current_line_in_context_idx = best_match_old_s.current_line_in_context_idx
+                        new_obj.copy_context_from(best_match_old_s)
 
                         if new_obj.translation.strip():
                             if not hasattr(new_obj, "minor_warnings") or not isinstance(new_obj.minor_warnings, list):
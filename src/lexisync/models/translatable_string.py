@@ -2,13 +2,15 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
+from operator import attrgetter
 
 from PySide6.QtGui import QColor, QFont
 import xxhash
 
-from lexisync.utils.constants import MAX_UNDO_HISTORY
+from lexisync.utils.context_lines import ContextSource
 from lexisync.utils.enums import WarningType
 from lexisync.utils.localization import _
+from lexisync.utils.text_utils import get_linguistic_length
 
 logger = logging.getLogger(__name__)
 
@@ -31,27 +33,47 @@ _COLOR_NL_GREEN = QColor(34, 177, 76, 180)
 _COLOR_NL_RED = QColor(237, 28, 36, 180)
 
 
+def _persisted_flag(name):
+    """保存到项目中的状态字段：赋值时把条目记为待保存"""
+    slot = f"_{name}"
+
+    def setter(self, value):
+        setattr(self, slot, value)
+        self.mark_dirty()
+
+    return property(attrgetter(slot), setter)
+
+
+# 每个字符串缓存的语言学长度条目上限（原文、复数原文与各复数形式译文）
+_MAX_CACHED_LENGTHS = 8
+
+
 class TranslatableString:
     __slots__ = [
+        "_comment",
+        "_context",
+        "_context_line",
+        "_context_source",
+        "_derived_version",
+        "_dirty_sink",
         "_display_original",
         "_display_translation",
+        "_is_fuzzy",
+        "_is_ignored",
+        "_is_obsolete",
+        "_is_reviewed",
+        "_is_warning_ignored",
+        "_linguistic_lengths",
+        "_po_comment",
         "_search_cache",
-        "_translation_edit_history",
-        "_translation_history_pointer",
+        "_text_version",
+        "_validation_stamp",
+        "_was_auto_ignored",
         "char_pos_end_in_file",
         "char_pos_start_in_file",
-        "comment",
-        "context",
-        "context_lines",
-        "current_line_in_context_idx",
         "id",
         "infos",
-        "is_fuzzy",
-        "is_ignored",
-        "is_obsolete",
         "is_plural",
-        "is_reviewed",
-        "is_warning_ignored",
         "minor_warnings",
         "occurrences",
         "original_plural",
@@ -59,15 +81,22 @@ class TranslatableString:
         "original_semantic",
         "plural_expr",
         "plural_translations",
-        "po_comment",
         "sort_weight",
         "string_type",
         "translation",
         "ui_style_cache",
         "warnings",
-        "was_auto_ignored",
     ]
 
+    context = _persisted_flag("context")
+    is_fuzzy = _persisted_flag("is_fuzzy")
+    is_ignored = _persisted_flag("is_ignored")
+    is_obsolete = _persisted_flag("is_obsolete")
+    is_reviewed = _persisted_flag("is_reviewed")
+    is_warning_ignored = _persisted_flag("is_warning_ignored")
+    po_comment = _persisted_flag("po_comment")
+    was_auto_ignored = _persisted_flag("was_auto_ignored")
+
     def __init__(
         self,
         original_raw,
@@ -82,20 +111,25 @@ class TranslatableString:
         occurrence_index=0,
         id=None,
     ):
+        # 保存服务登记的脏条目表 (id -> 条目)，持久化字段被修改时把自身记入其中
+        self._dirty_sink = None
         if id:
             self.id = id
         else:
             name_string_for_uuid = f"{source_file_path}::{original_semantic}::{string_type}::{occurrence_index!s}"
             self.id = xxhash.xxh128(name_string_for_uuid.encode("utf-8")).hexdigest()
-        self._search_cache = (original_semantic + " " + string_type).lower()
-        self.context = ""
+        # 搜索文本和显示文本在首次读取时生成；文本变化时递增 _text_version 使其失效
+        self._text_version = 0
+        self._derived_version = -1
+        self._search_cache = None
+        self._display_original = None
+        self._display_translation = None
+        self._context = ""
         self.original_raw = original_raw
         self.original_semantic = original_semantic
         self.translation = ""
-        self._display_original = self.original_semantic.replace("\n", "↵")
-        self._display_translation = ""
-        self.is_ignored = False
-        self.was_auto_ignored = False
+        self._is_ignored = False
+        self._was_auto_ignored = False
         if occurrences is not None:
             self.occurrences = occurrences
         elif line_num > 0:
@@ -108,13 +142,13 @@ class TranslatableString:
         self.minor_warnings = []
         self.infos = []
 
-        self.is_warning_ignored = False
-        self.is_obsolete = False
+        self._is_warning_ignored = False
+        self._is_obsolete = False
         self.string_type = string_type
-        self.comment = ""
-        self.is_reviewed = False
-        self.is_fuzzy = False
-        self.po_comment = ""
+        self._comment = ""
+        self._is_reviewed = False
+        self._is_fuzzy = False
+        self._po_comment = ""
 
         self.is_plural = False
         self.original_plural = ""
@@ -122,19 +156,16 @@ class TranslatableString:
         self.plural_expr = None
 
         self.ui_style_cache = {}
-        context_radius = 5
-        start_line_idx = max(0, line_num - 1 - context_radius)
-        current_line_content_idx = line_num - 1
-        if full_code_lines:
-            self.context_lines = full_code_lines[
-                start_line_idx : min(len(full_code_lines), current_line_content_idx + context_radius + 1)
-            ]
-            self.current_line_in_context_idx = current_line_content_idx - start_line_idx
+        # 上下文只记录来源和行号，行内容在需要时从共享的行缓存中取
+        if isinstance(full_code_lines, ContextSource):
+            self._context_source = full_code_lines
         else:
-            self.context_lines = []
-            self.current_line_in_context_idx = -1
-        self._translation_edit_history = [self.translation]
-        self._translation_history_pointer = 0
+            self._context_source = ContextSource(full_code_lines) if full_code_lines else None
+        self._context_line = line_num
+        # 最近一次校验时的状态戳，None 表示需要重新校验（见 IncrementalValidator）
+        self._validation_stamp = None
+        # 文本 -> 语言学长度，按文本内容缓存，修改译文时清空
+        self._linguistic_lengths = {}
 
     def update_sort_weight(self):
         """
@@ -174,7 +205,31 @@ class TranslatableString:
 
         self.sort_weight = 4  # Translated
 
+    def mark_dirty(self):
+        """记为待保存（见 ProjectSaver）；直接修改列表或字典字段后也需调用"""
+        sink = self._dirty_sink
+        if sink is not None:
+            sink[self.id] = self
+
     def update_search_cache(self):
+        """原文、译文、注释等被直接修改后调用，使搜索文本和显示文本在下次读取时重新生成"""
+        self._text_version += 1
+        self.mark_dirty()
+
+    @property
+    def comment(self) -> str:
+        return self._comment
+
+    @comment.setter
+    def comment(self, value):
+        # 注释参与搜索文本，修改后使派生文本失效
+        if value != self._comment:
+            self._comment = value
+            self._text_version += 1
+            self.mark_dirty()
+
+    def compose_search_text(self) -> str:
+        """由当前字段生成小写的搜索文本，不读写缓存（后台线程构建搜索索引时使用）"""
         plural_trans_text = ""
         if self.is_plural:
             plural_trans_text = " ".join(self.plural_translations.values())
@@ -186,17 +241,57 @@ class TranslatableString:
             orig_plural,
             self.translation or "",
             plural_trans_text,
-            self.comment or "",
+            self._comment or "",
             self.string_type or "",
         ]
+        return " ".join(search_content).lower()
+
+    def _ensure_derived_text(self):
+        if self._derived_version == self._text_version:
+            return
+        self._search_cache = self.compose_search_text()
+        self._display_original = self.original_semantic.replace("\n", "↵")
+        self._display_translation = self.translation.replace("\n", "↵")
+        self._derived_version = self._text_version
+
+    @property
+    def search_text(self) -> str:
+        """小写的搜索文本（原文、复数形式、译文、注释与类型）"""
+        self._ensure_derived_text()
+        return self._search_cache
 
-        self._search_cache = " ".join(search_content).lower()
+    @property
+    def display_original(self) -> str:
+        self._ensure_derived_text()
+        return self._display_original
+
+    @property
+    def display_translation(self) -> str:
+        self._ensure_derived_text()
+        return self._display_translation
 
     def sync_cached_text_fields(self):
         if self.is_plural:
             self.translation = self.plural_translations.get(0, self.translation)
-        self._display_translation = self.translation.replace("\n", "↵")
-        self.update_search_cache()
+        self._text_version += 1
+        self.mark_dirty()
+
+    @property
+    def context_lines(self) -> list:
+        """当前行前后的源码行；没有上下文时为空列表"""
+        if self._context_source is None:
+            return []
+        return self._context_source.window(self._context_line)[0]
+
+    @property
+    def current_line_in_context_idx(self) -> int:
+        if self._context_source is None:
+            return -1
+        return self._context_source.window(self._context_line)[1]
+
+    def copy_context_from(self, other):
+        self._context_source = other._context_source
+        self._context_line = other._context_line
 
     @property
     def line_num_in_file(self):
@@ -221,29 +316,29 @@ class TranslatableString:
     def set_translation_internal(self, text_with_newlines, is_initial=False, plural_index=0):
         """
         设置译文并同步缓存。
-        is_initial: 如果为 True，则重置撤销栈，将其设为初始状态。
+        is_initial: 加载时设置的初始译文。撤销记录由主窗口的 UndoJournal 统一管理，条目本身不再保存编辑历史。
         """
         if self.is_plural:
             self.plural_translations[plural_index] = text_with_newlines
             # 默认 translation 始终保持与 index 0 同步，用于列表展示
             if plural_index == 0:
                 self.translation = text_with_newlines
-                self._display_translation = self.translation.replace("\n", "↵")
         else:
             self.translation = text_with_newlines
-            self._display_translation = self.translation.replace("\n", "↵")
-
-        if is_initial:
-            self._translation_edit_history = [self.translation]
-            self._translation_history_pointer = 0
-        else:
-            if self._translation_history_pointer < len(self._translation_edit_history) - 1:
-                self._translation_edit_history = self._translation_edit_history[: self._translation_history_pointer + 1]
-            self._translation_edit_history.append(self.translation)
-            if len(self._translation_edit_history) > MAX_UNDO_HISTORY * 2:
-                self._translation_edit_history.pop(0)
-            self._translation_history_pointer = len(self._translation_edit_history) - 1
-        self.update_search_cache()
+        self._text_version += 1
+        self._validation_stamp = None
+        self._linguistic_lengths.clear()
+        self.mark_dirty()
+
+    def linguistic_length(self, text) -> int:
+        """原文或译文的语言学长度（见 get_linguistic_length），按文本缓存"""
+        cache = self._linguistic_lengths
+        length = cache.get(text)
+        if length is None:
+            if len(cache) >= _MAX_CACHED_LENGTHS:
+                cache.clear()
+            length = cache[text] = get_linguistic_length(text)
+        return length
 
     def get_translation_for_ui(self):
         return self.translation
@@ -1,13 +1,31 @@
 # Copyright (c) 2025-2026, TheSkyC
 # SPDX-License-Identifier: Apache-2.0
 
-from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from collections import OrderedDict
+
+import numpy as np
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, QThreadPool
 from PySide6.QtGui import QColor
 
+from lexisync.services.search_index import SearchIndex
 from lexisync.utils.localization import _
 
 NewlineColorRole = Qt.UserRole + 1
 
+NEW_ENTRY_ID = "##NEW_ENTRY##"
+
+# 状态列的位标记
+STATUS_IGNORED = 1
+STATUS_TRANSLATED = 2
+STATUS_REVIEWED = 4
+STATUS_NEW_ENTRY = 8
+
+# 按文本排序的列 -> 属性名
+TEXT_SORT_COLUMNS = {2: "original_semantic", 3: "translation", 4: "comment"}
+# 编辑条目后可能改变排序结果的列
+MUTABLE_SORT_COLUMNS = {1, 3, 4, 5}
+MAX_CACHED_SEARCHES = 16
+
 
 class TranslatableStringsModel(QAbstractTableModel):
     def __init__(self, data, parent=None):
@@ -16,8 +34,14 @@ class TranslatableStringsModel(QAbstractTableModel):
         self.headers = ["#", "S", "Original", "Translation", "Comment", "✔", "Line"]
 
         self._all_data = data  # 所有数据 (List[TranslatableString])
-        self._visible_indices = list(range(len(data)))  # 可见行的索引映射 [0, 1, 5, 8...]
-        self._raw_to_visual_map = {i: i for i in range(len(data))}  # 反向映射表
+        # 快速过滤与查找替换共用的全文索引，首次搜索时在后台构建
+        self._search_index = SearchIndex()
+        self._search_index.build_requested = self._start_search_index_build
+        self._search_index.reset(data)
+        self._visible_indices = None  # 可见行对应的原始下标 (np.ndarray)
+        self._raw_to_visual_map = None  # 原始下标 -> 可见行，不可见为 -1 (np.ndarray)
+        self._set_visible(np.arange(len(data), dtype=np.int64))
+        self._reset_columns()
 
         # ID 映射表
         self._id_to_raw_index_map = {obj.id: i for i, obj in enumerate(self._all_data)}
@@ -51,17 +75,191 @@ class TranslatableStringsModel(QAbstractTableModel):
         }
         self._column_count = len(self.headers)
         self.current_search_term = ""
+        self._filter_args = None  # 上次 apply_filter_and_sort 的参数，编辑条目后据此重新过滤
 
     def set_translatable_objects(self, new_data):
         """重置整个模型的数据"""
         self.beginResetModel()
+        if new_data is self._all_data:
+            # 同一个列表（如批量替换后的整表刷新）：索引仍可用，只需找出修改过的条目
+            self._search_index.invalidate()
+        else:
+            self._search_index.reset(new_data)
         self._all_data = new_data
         self._id_to_index_map = {obj.id: i for i, obj in enumerate(self._all_data)}  # 兼容旧代码命名习惯
         self._id_to_raw_index_map = self._id_to_index_map
+        self._reset_columns()
         # 默认显示所有数据
-        self._visible_indices = list(range(len(new_data)))
+        self._filter_args = None
+        self._set_visible(np.arange(len(new_data), dtype=np.int64))
         self.endResetModel()
 
+    # --- 列式缓存 ---
+
+    def _reset_columns(self):
+        """丢弃全部列缓存，下次过滤/排序时按需重建"""
+        self._status = None
+        self._line_nums = None
+        self._sort_weights = None
+        self._sort_permutations = {}
+        self._search_results = OrderedDict()
+
+    def invalidate_columns(self):
+        """
+        条目状态可能被批量修改后调用（如 refresh_sheet），下次过滤/排序时重新读取。
+        条目列表本身不变，行号和原文的排序排列仍然有效。
+        """
+        self._status = None
+        self._sort_weights = None
+        self._search_results.clear()
+        self._search_index.invalidate()
+        for cache_key in [key for key in self._sort_permutations if key[0] in MUTABLE_SORT_COLUMNS]:
+            del self._sort_permutations[cache_key]
+
+    @staticmethod
+    def _status_code(ts) -> int:
+        code = 0
+        if ts.is_ignored:
+            code |= STATUS_IGNORED
+        if ts.translation.strip():
+            code |= STATUS_TRANSLATED
+        if ts.is_reviewed:
+            code |= STATUS_REVIEWED
+        if ts.id == NEW_ENTRY_ID:
+            code |= STATUS_NEW_ENTRY
+        return code
+
+    def _ensure_status(self):
+        if self._status is None:
+            status_code = self._status_code
+            self._status = np.fromiter((status_code(ts) for ts in self._all_data), np.uint8, len(self._all_data))
+        return self._status
+
+    def _ensure_line_nums(self):
+        if self._line_nums is None:
+            self._line_nums = np.fromiter((ts.line_num_in_file for ts in self._all_data), np.int64, len(self._all_data))
+        return self._line_nums
+
+    def _ensure_sort_weights(self):
+        if self._sort_weights is None:
+            self._sort_weights = np.fromiter(
+                (getattr(ts, "sort_weight", 0) for ts in self._all_data), np.int64, len(self._all_data)
+            )
+        return self._sort_weights
+
+    def _sort_permutation(self, sort_col, reverse):
+        """
+        整个数据集按某列排序后的原始下标排列，按 (列, 方向) 缓存。
+        可见行 = 排列中通过过滤的部分；稳定排序保证与先过滤再排序的结果一致。
+        """
+        cache_key = (sort_col, reverse)
+        perm = self._sort_permutations.get(cache_key)
+        if perm is not None:
+            return perm
+
+        data = self._all_data
+        if sort_col in TEXT_SORT_COLUMNS:
+            attr = TEXT_SORT_COLUMNS[sort_col]
+            # 小写键只在排序时生成，得到排列后即释放
+            keys = [getattr(ts, attr).lower() for ts in data]
+            perm = np.array(sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse), dtype=np.int64)
+        elif sort_col in {1, 5}:
+            # 优先按权重排序，次级按行号；降序时取负值以保持相等项的原始顺序
+            weights = self._ensure_sort_weights()
+            lines = self._ensure_line_nums()
+            perm = np.lexsort((-lines, -weights) if reverse else (lines, weights))
+        else:
+            lines = self._ensure_line_nums()
+            perm = np.argsort(-lines if reverse else lines, kind="stable")
+        self._sort_permutations[cache_key] = perm
+        return perm
+
+    def _search_mask(self, search_term):
+        """
+        搜索词命中掩码。保留最近若干个搜索词的结果：新词包含旧词时只需在旧词的命中行中查找，
+        逐字输入或退格时不必每次扫描全部条目。
+        """
+        results = self._search_results
+        hits = results.get(search_term)
+        if hits is not None:
+            results.move_to_end(search_term)
+            return hits
+
+        data = self._all_data
+        base = None
+        for term, term_hits in results.items():
+            if term in search_term and (base is None or len(term) > len(base[0])):
+                base = (term, term_hits)
+        # 候选行取全文索引与已缓存的旧词命中中较少的一方，两者都没有时逐条扫描
+        candidates = self._search_index.candidates(search_term)
+        if base is not None:
+            base_candidates = np.flatnonzero(base[1])
+            if candidates is None or len(base_candidates) < len(candidates):
+                candidates = base_candidates
+        if candidates is None:
+            hits = np.fromiter((search_term in ts.search_text for ts in data), np.bool_, len(data))
+        else:
+            hits = np.zeros(len(data), dtype=np.bool_)
+            hits[candidates] = np.fromiter(
+                (search_term in data[i].search_text for i in candidates.tolist()), np.bool_, len(candidates)
+            )
+
+        results[search_term] = hits
+        if len(results) > MAX_CACHED_SEARCHES:
+            results.popitem(last=False)
+        return hits
+
+    def _update_rows(self, raw_indices):
+        """条目内容被修改后同步对应行的列缓存；受影响列的排序排列需要重建"""
+        data = self._all_data
+        if self._status is not None:
+            for i in raw_indices:
+                self._status[i] = self._status_code(data[i])
+        if self._sort_weights is not None:
+            for i in raw_indices:
+                self._sort_weights[i] = getattr(data[i], "sort_weight", 0)
+        for term, hits in self._search_results.items():
+            for i in raw_indices:
+                hits[i] = term in data[i].search_text
+        self._search_index.mark_dirty(raw_indices)
+        for cache_key in [key for key in self._sort_permutations if key[0] in MUTABLE_SORT_COLUMNS]:
+            del self._sort_permutations[cache_key]
+
+    def _start_search_index_build(self, worker):
+        worker.signals.finished.connect(self._on_search_index_built)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_search_index_built(self, generation, data):
+        self._search_index.install(generation, data)
+
+    def search_candidate_rows(self, term):
+        """
+        可能包含 term（不区分大小写）的可见行，按行号升序；索引尚未就绪时返回 None，由调用方扫描全部可见行。
+        """
+        raw_indices = self._search_index.candidates(term)
+        if raw_indices is None:
+            return None
+        rows = self._raw_to_visual_map[raw_indices]
+        return np.sort(rows[rows >= 0]).tolist()
+
+    def search_scan_targets(self, term):
+        """
+        后台查找需要逐条确认的条目：(条目列表, 按可见行顺序排列的原始下标)。
+        索引就绪时只包含候选条目，否则包含全部可见条目。
+        """
+        visible = self._visible_indices
+        raw_indices = self._search_index.candidates(term)
+        if raw_indices is not None:
+            rows = self._raw_to_visual_map[raw_indices]
+            visible = visible[np.sort(rows[rows >= 0])]
+        return self._all_data, visible.tolist()
+
+    def _set_visible(self, visible):
+        self._visible_indices = visible
+        raw_to_visual = np.full(len(self._all_data), -1, dtype=np.int64)
+        raw_to_visual[visible] = np.arange(len(visible), dtype=np.int64)
+        self._raw_to_visual_map = raw_to_visual
+
     def rowCount(self, parent=QModelIndex()):
         return len(self._visible_indices)
 
@@ -87,15 +285,14 @@ class TranslatableStringsModel(QAbstractTableModel):
         if row >= len(self._visible_indices):
             return None
 
-        raw_index = self._visible_indices[row]
-        ts_obj = self._all_data[raw_index]
+        ts_obj = self._all_data[self._visible_indices[row]]
         col = index.column()
 
         if role == Qt.DisplayRole:
             if col == 2:
-                return ts_obj._display_original
+                return ts_obj.display_original
             if col == 3:
-                return ts_obj._display_translation
+                return ts_obj.display_translation
             if col == 4:
                 return ts_obj.comment.replace("\n", " ")
             if col == 1:
@@ -178,77 +375,95 @@ class TranslatableStringsModel(QAbstractTableModel):
         sort_col,
         sort_order,
     ):
-        self.current_search_term = search_term.lower().strip()
-        self.beginResetModel()
-
         search_term = search_term.lower().strip()
-        new_entry_id = "##NEW_ENTRY##"
-        data = self._all_data
+        self.current_search_term = search_term
+        self._filter_args = (
+            search_term,
+            show_ignored,
+            show_untranslated,
+            show_translated,
+            show_unreviewed,
+            is_translation_mode,
+            sort_col,
+            sort_order,
+        )
+        self._apply_visible(self._compute_visible(self._filter_args))
+
+    def _filter_depends_on_rows(self) -> bool:
+        """当前的过滤或排序是否取决于可编辑的内容（状态、搜索文本、可变排序列）"""
+        if self._filter_args is None:
+            return False
+        search_term, show_ignored, show_untranslated, show_translated, show_unreviewed, _mode, sort_col, _order = (
+            self._filter_args
+        )
+        unfiltered = not search_term and show_ignored and show_untranslated and show_translated and not show_unreviewed
+        return not unfiltered or sort_col in MUTABLE_SORT_COLUMNS
+
+    def _compute_visible(self, filter_args):
+        """:return: 按 apply_filter_and_sort 的参数过滤、排序得到的可见行（原始下标）"""
+        (
+            search_term,
+            show_ignored,
+            show_untranslated,
+            show_translated,
+            show_unreviewed,
+            is_translation_mode,
+            sort_col,
+            sort_order,
+        ) = filter_args
+        data_len = len(self._all_data)
 
         if not search_term and show_ignored and show_untranslated and show_translated and not show_unreviewed:
-            self._visible_indices = list(range(len(data)))
+            mask = None
         else:
-            filtered_indices = []
-            for i, ts in enumerate(data):
-                if is_translation_mode and ts.id == new_entry_id:
-                    filtered_indices.append(i)
-                    continue
-
-                if search_term and search_term not in ts._search_cache:
-                    continue
-
-                if ts.is_ignored:
-                    if not show_ignored:
-                        continue
-                else:
-                    has_trans = bool(ts.translation.strip())
-                    if not has_trans and not show_untranslated:
-                        continue
-                    if has_trans and not show_translated:
-                        continue
-
-                if show_unreviewed and ts.is_reviewed:
-                    continue
-
-                filtered_indices.append(i)
-
-            self._visible_indices = filtered_indices
-
-        # 排序
+            status = self._ensure_status()
+            ignored = (status & STATUS_IGNORED) != 0
+            translated = (status & STATUS_TRANSLATED) != 0
+            if show_translated and show_untranslated:
+                mask = np.ones(data_len, dtype=np.bool_) if show_ignored else ~ignored
+            else:
+                mask = translated if show_translated else ~translated if show_untranslated else np.zeros_like(ignored)
+                mask = mask | ignored if show_ignored else mask & ~ignored
+            if show_unreviewed:
+                mask &= (status & STATUS_REVIEWED) == 0
+            if search_term:
+                mask &= self._search_mask(search_term)
+            if is_translation_mode:
+                mask |= (status & STATUS_NEW_ENTRY) != 0
+
+        # 排序：在整体排序排列上取可见部分
         if sort_col != -1:
-            reverse = sort_order == Qt.DescendingOrder
-
-            key_func = None
-
-            if sort_col in {1, 5}:  # Status / Reviewed
-                # 优先按权重排序，次级按行号
-                def key_func(i):
-                    return (data[i].sort_weight, data[i].line_num_in_file)
-            elif sort_col == 2:  # Original
-
-                def key_func(i):
-                    return data[i].original_semantic.lower()
-            elif sort_col == 3:  # Translation
-
-                def key_func(i):
-                    return data[i].translation.lower()
-            elif sort_col == 4:  # Comment
-
-                def key_func(i):
-                    return data[i].comment.lower()
-            elif sort_col == 6:  # Line
-
-                def key_func(i):
-                    return data[i].line_num_in_file
-            else:  # ID (0)
-
-                def key_func(i):
-                    return data[i].line_num_in_file
-
-            if key_func:
-                self._visible_indices.sort(key=key_func, reverse=reverse)
+            perm = self._sort_permutation(sort_col, sort_order == Qt.DescendingOrder)
+            visible = perm if mask is None else perm[mask[perm]]
+        else:
+            visible = np.arange(data_len, dtype=np.int64) if mask is None else np.flatnonzero(mask)
+        return visible
+
+    def _apply_visible(self, visible):
+        """
+        按可见行的变化选择最小的通知方式：
+        行完全相同时只刷新显示，行集合相同仅顺序变化时发出布局变化，其余情况重置模型。
+        """
+        old_visible = self._visible_indices
+        if len(visible) == len(old_visible):
+            if np.array_equal(visible, old_visible):
+                if len(visible):
+                    self.dataChanged.emit(self.index(0, 0), self.index(len(visible) - 1, self._column_count - 1))
+                return
+            if (self._raw_to_visual_map[visible] >= 0).all():
+                self.layoutAboutToBeChanged.emit()
+                old_persistent = self.persistentIndexList()
+                self._set_visible(visible)
+                new_rows = self._raw_to_visual_map
+                self.changePersistentIndexList(
+                    old_persistent,
+                    [self.index(int(new_rows[old_visible[index.row()]]), index.column()) for index in old_persistent],
+                )
+                self.layoutChanged.emit()
+                return
 
-        self._raw_to_visual_map = {raw_idx: visual_idx for visual_idx, raw_idx in enumerate(self._visible_indices)}
+        self.beginResetModel()
+        self._set_visible(visible)
         self.endResetModel()
 
     # --- 辅助方法 ---
@@ -256,22 +471,58 @@ class TranslatableStringsModel(QAbstractTableModel):
     def get_ts_object_by_visual_row(self, row):
         """获取当前视图第 row 行对应的对象"""
         if 0 <= row < len(self._visible_indices):
-            raw_index = self._visible_indices[row]
-            return self._all_data[raw_index]
+            return self._all_data[self._visible_indices[row]]
         return None
 
     def get_visual_row_by_id(self, ts_id):
         raw_index = self._id_to_raw_index_map.get(ts_id)
         if raw_index is None:
             return -1
-
-        try:
-            return self._visible_indices.index(raw_index)
-        except ValueError:
-            return -1
+        return self.get_visual_row_by_raw_index(raw_index)
+
+    def refresh_rows_by_ids(self, ts_ids) -> bool:
+        """
+        为指定条目所在的可见行发出 dataChanged，连续的行合并为一个区间。
+        过滤或排序取决于被修改的内容时重新过滤，条目因此移入、移出或移动位置时改为布局变化/重置。
+        :return: 可见行是否发生了变化（重置时调用方需要恢复选中行）
+        """
+        id_map = self._id_to_raw_index_map
+        raw_indices = [id_map[ts_id] for ts_id in ts_ids if ts_id in id_map]
+        if not raw_indices:
+            return False
+        self._update_rows(raw_indices)
+        if self._filter_depends_on_rows():
+            visible = self._compute_visible(self._filter_args)
+            if not np.array_equal(visible, self._visible_indices):
+                self._apply_visible(visible)
+                return True
+        raw_to_visual = self._raw_to_visual_map
+        rows = sorted(row for row in raw_to_visual[raw_indices].tolist() if row >= 0)
+        if not rows:
+            return False
+
+        last_col = self._column_count - 1
+        ranges = []
+        start = end = rows[0]
+        for row in rows[1:]:
+            if row <= end + 1:
+                end = row
+            else:
+                ranges.append((start, end))
+                start = end = row
+        ranges.append((start, end))
+
+        # 区间过多时合并为一次通知，避免视图逐段重绘
+        if len(ranges) > 64:
+            ranges = [(rows[0], rows[-1])]
+        for start, end in ranges:
+            self.dataChanged.emit(self.index(start, 0), self.index(end, last_col))
+        return False
 
     def get_visual_row_by_raw_index(self, raw_index):
-        return self._raw_to_visual_map.get(raw_index, -1)
+        if 0 <= raw_index < len(self._raw_to_visual_map):
+            return int(self._raw_to_visual_map[raw_index])
+        return -1
 
     def get_raw_index_by_id(self, ts_id):
         return self._id_to_raw_index_map.get(ts_id)
@@ -415,9 +415,24 @@ class PluginBase(ABC):
 
     def register_validation_rules(self) -> list:
         """
-        (Collecting Hook) Called by the ValidationService to gather custom validation rules.
-        :return: A list of callable functions. Each function should accept a
-                 TranslatableString object and return a ValidationWarning object or None.
+        (Collecting Hook) Called when the validation context is built to gather custom validation rules.
+        Rules run after the built-in rules for every translated form, using the same fast-path machinery.
+
+        :return: A list of rule dictionaries (or bare check functions). Supported keys:
+            - 'check_func' (required): check_func(source, target, **kwargs) -> str | None,
+              returning the warning message or None.
+            - 'key': Rule name, prefixed with the plugin ID. Can be toggled under 'validation_rules' in the config.
+            - 'fast_path': fast_path(ctx) -> bool, called before check_func. ctx provides 'original',
+              'translation', 'has_percent', 'has_brace', 'has_html', 'has_url_email', 'has_brackets', etc.
+            - 'kwargs_gen': kwargs_gen(ctx) -> dict, evaluated once per validation context.
+            - 'level': 'error', 'warning' (default) or 'info'.
+            - 'warning_type': A WarningType member (default: WarningType.PLUGIN_RULE).
+            - 'use_clean_text': Pass text with accelerator markers stripped (default: False).
+        Rules are timed. Slow rules are skipped during project-wide validation, and rules that keep failing
+        or exceed the hard time budget are disabled for the rest of the session.
+        Rules only run on the main (GUI) thread: parallel project-wide validation applies them when results
+        are merged on the main thread, and validation on other threads (e.g. the AI self-repair check) skips
+        them. Check functions therefore do not need to be thread-safe.
         """
         return []
 
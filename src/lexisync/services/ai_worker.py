@@ -8,6 +8,7 @@ import weakref
 from PySide6.QtCore import QObject, QRunnable, Signal
 
 from lexisync.models.translatable_string import TranslatableString
+from lexisync.services.glossary_hit_index import glossary_source_text
 from lexisync.services.prompt_service import generate_prompt_from_structure
 from lexisync.utils.constants import (
     COT_INJECTION_PROMPT,
@@ -17,7 +18,6 @@ from lexisync.utils.constants import (
 from lexisync.utils.enums import AIOperationType
 from lexisync.utils.localization import _
 from lexisync.utils.plural_utils import get_plural_form_description
-from lexisync.utils.text_utils import generate_ngrams
 
 logger = logging.getLogger(__name__)
 
@@ -387,46 +387,26 @@ class AIWorker(QRunnable):
         return base_prompt + strict_suffix
 
     def _build_glossary_context(self, app):
-        candidates = generate_ngrams(self.original_text, min_n=1, max_n=5)
-        if not candidates:
+        ts_obj = app._find_ts_obj_by_id(self.ts_id)
+        if not ts_obj:
             return ""
-
-        source_lang = app.source_language
-        target_lang_code = app.current_target_language
-
-        # 批量查询数据库
-        potential_terms = app.glossary_service.get_translations_batch(
-            words=candidates, source_lang=source_lang, target_lang=target_lang_code, include_reverse=False
+        matches = app.glossary_hits.get_hits(
+            ts_obj, self.plural_index, app.source_language, app.current_target_language
         )
-
-        if not potential_terms:
+        if not matches:
             return ""
 
-        placeholder_spans = [m.span() for m in app.placeholder_regex.finditer(self.original_text)]
+        source_text = glossary_source_text(ts_obj, self.plural_index)
+        placeholder_spans = [m.span() for m in app.placeholder_regex.finditer(source_text)]
         valid_terms = {}
-        sorted_terms = sorted(potential_terms.keys(), key=len, reverse=True)
-        matched_mask = [False] * len(self.original_text)
-
-        for word in sorted_terms:
-            term_info = potential_terms[word]
-            try:
-                for match in re.finditer(r"\b" + re.escape(word) + r"\b", self.original_text, re.IGNORECASE):
-                    start, end = match.start(), match.end()
-
-                    if any(p_start <= start < p_end for p_start, p_end in placeholder_spans):
-                        continue
-
-                    if any(matched_mask[i] for i in range(start, end)):
-                        continue
-
-                    for i in range(start, end):
-                        matched_mask[i] = True
-
-                    valid_terms[word] = term_info
-                    break
 
-            except re.error:
+        for match in matches:
+            # 至少有一处出现不在占位符内
+            if all(
+                any(p_start <= start < p_end for p_start, p_end in placeholder_spans) for start, _end in match["spans"]
+            ):
                 continue
+            valid_terms[match["source"]] = match
 
         if not valid_terms:
             return ""
@@ -9,6 +9,7 @@ import re
 import shutil
 
 from lexisync.models.translatable_string import TranslatableString
+from lexisync.utils.context_lines import ContextSource
 from lexisync.utils.file_utils import atomic_open
 from lexisync.utils.localization import _
 
@@ -81,7 +82,7 @@ def extract_translatable_strings(code_content, extraction_patterns, source_file_
     mv_occupied = memoryview(occupied_mask)
 
     strings = []
-    full_code_lines = code_content.splitlines()
+    full_code_lines = ContextSource(code_content.splitlines())
     occurrence_counters = {}
 
     fill_enabled = bool(
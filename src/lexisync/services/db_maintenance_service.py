@@ -0,0 +1,141 @@
+# Copyright (c) 2025-2026, TheSkyC
+# SPDX-License-Identifier: Apache-2.0
+
+from collections.abc import Callable
+import logging
+import os
+import sqlite3
+import time
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from lexisync.utils.localization import _
+
+logger = logging.getLogger(__name__)
+
+# 自动维护的最小间隔（秒）
+MAINTENANCE_INTERVAL_SEC = 7 * 24 * 3600
+
+
+def get_database_size(db_path: str) -> int:
+    """Size of the database file plus its WAL and shared-memory files."""
+    total = 0
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            total += os.path.getsize(db_path + suffix)
+        except OSError:
+            pass
+    return total
+
+
+def _time_probe(conn: sqlite3.Connection, probe: Callable | None) -> float | None:
+    if probe is None:
+        return None
+    start = time.perf_counter()
+    try:
+        probe(conn)
+    except sqlite3.Error as e:
+        logger.warning(f"Maintenance latency probe failed: {e}")
+        return None
+    return (time.perf_counter() - start) * 1000
+
+
+def optimize_database(
+    conn: sqlite3.Connection, db_path: str, fts_tables: tuple[str, ...] = (), probe: Callable | None = None
+) -> dict:
+    """
+    Run FTS optimize, incremental vacuum, ANALYZE and a WAL checkpoint on an autocommit connection.
+    The caller must hold the owning service's write lock. probe(conn) is timed before and after
+    to report query latency.
+    """
+    report = {
+        "db_path": db_path,
+        "size_before": get_database_size(db_path),
+        "latency_before_ms": _time_probe(conn, probe),
+        "steps": [],
+    }
+    start = time.perf_counter()
+
+    existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()}
+    for table in fts_tables:
+        if table in existing:
+            # 合并 FTS5 段，清理触发器累积的 delete 标记
+            conn.execute(f"INSERT INTO {table}({table}) VALUES('optimize')")
+            report["steps"].append(f"optimize:{table}")
+
+    if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+        # 切换到增量模式需要一次完整 VACUUM，之后只做增量回收
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("VACUUM")
+        report["steps"].append("vacuum")
+    else:
+        conn.execute("PRAGMA incremental_vacuum")
+        report["steps"].append("incremental_vacuum")
+
+    conn.execute("ANALYZE")
+    report["steps"].append("analyze")
+
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    report["steps"].append("wal_checkpoint")
+
+    report["duration_s"] = time.perf_counter() - start
+    report["size_after"] = get_database_size(db_path)
+    report["latency_after_ms"] = _time_probe(conn, probe)
+    logger.info(
+        f"Database maintenance finished for {db_path}: "
+        f"{report['size_before']} -> {report['size_after']} bytes in {report['duration_s']:.2f}s"
+    )
+    return report
+
+
+def format_maintenance_report(reports: list[dict]) -> str:
+    if not reports:
+        return _("No databases to maintain.")
+
+    def fmt_size(size):
+        return f"{size / (1024 * 1024):.2f} MB"
+
+    def fmt_latency(value):
+        return f"{value:.1f} ms" if value is not None else "-"
+
+    lines = []
+    for r in reports:
+        lines.append(os.path.basename(os.path.dirname(r["db_path"])) + "/" + os.path.basename(r["db_path"]))
+        if r.get("error"):
+            lines.append("  " + _("Failed: {error}").format(error=r["error"]))
+            continue
+        lines.append(
+            "  "
+            + _("Size: {before} → {after}").format(before=fmt_size(r["size_before"]), after=fmt_size(r["size_after"]))
+        )
+        lines.append(
+            "  "
+            + _("Query latency: {before} → {after}").format(
+                before=fmt_latency(r["latency_before_ms"]), after=fmt_latency(r["latency_after_ms"])
+            )
+        )
+        lines.append("  " + _("Duration: {seconds:.2f}s").format(seconds=r["duration_s"]))
+    return "\n".join(lines)
+
+
+class DBMaintenanceSignals(QObject):
+    finished = Signal(list)
+
+
+class DBMaintenanceWorker(QRunnable):
+    """Runs run_maintenance() of the given services in the thread pool and reports all results."""
+
+    def __init__(self, services: list, db_paths: list[str] | None = None):
+        super().__init__()
+        self.services = services
+        self.db_paths = db_paths
+        self.signals = DBMaintenanceSignals()
+
+    def run(self):
+        reports = []
+        for service in self.services:
+            try:
+                reports.extend(service.run_maintenance(self.db_paths))
+            except Exception as e:
+                logger.error(f"Database maintenance failed: {e}", exc_info=True)
+        self.signals.finished.emit(reports)
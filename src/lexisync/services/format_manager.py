@@ -18,6 +18,7 @@ import xxhash
 
 from lexisync.models.translatable_string import TranslatableString
 from lexisync.services import code_file_service, po_file_service
+from lexisync.utils.context_lines import ContextSource
 from lexisync.utils.file_utils import atomic_open
 from lexisync.utils.localization import _
 
@@ -161,7 +162,7 @@ class TsFormatHandler(BaseFormatHandler):
 
         translatable_objects = []
         occurrence_counters = {}
-        file_content_cache = {}
+        context_sources = {}
 
         relative_path = kwargs.get("relative_path")
         ts_file_rel_path = relative_path if relative_path else self._get_relative_path(filepath)
@@ -190,16 +191,12 @@ class TsFormatHandler(BaseFormatHandler):
                     src_rel_path = locations[0][0]
                     src_abs_path = os.path.normpath(os.path.join(os.path.dirname(filepath), src_rel_path))
 
-                    if src_abs_path in file_content_cache:
-                        full_code_lines = file_content_cache[src_abs_path]
-                    elif os.path.isfile(src_abs_path):
-                        try:
-                            with open(src_abs_path, encoding="utf-8", errors="replace") as f:
-                                lines = f.read().splitlines()
-                                file_content_cache[src_abs_path] = lines
-                                full_code_lines = lines
-                        except Exception as e:
-                            logger.warning(f"Failed to read source file for context: {src_abs_path}, error: {e}")
+                    # 只记录源文件路径，行内容在显示上下文时才读取
+                    if src_abs_path not in context_sources:
+                        context_sources[src_abs_path] = (
+                            ContextSource.from_path(src_abs_path) if os.path.isfile(src_abs_path) else []
+                        )
+                    full_code_lines = context_sources[src_abs_path]
 
                 line_num = int(locations[0][1]) if locations else 0
                 forced_occurrences = [(ts_file_rel_path, str(line_num))]
@@ -5140,7 +5137,7 @@ class MarkdownFormatHandler(BaseFormatHandler):
 
         rel_path = kwargs.get("relative_path") or self._get_relative_path(filepath)
 
-        full_lines = content.splitlines()
+        full_lines = ContextSource(content.splitlines())
 
         translatable_objects = []
         occurrence_counters = {}
@@ -5213,7 +5210,7 @@ class MarkdownFormatHandler(BaseFormatHandler):
         return False
 
     def _extract_frontmatter(
-        self, content: str, rel_path: str, results: list, counters: dict, full_lines: list[str], app_instance=None
+        self, content: str, rel_path: str, results: list, counters: dict, full_lines: ContextSource, app_instance=None
     ) -> tuple[dict, int]:
         """提取 YAML frontmatter 中的可翻译字段，返回 (字段dict, frontmatter结束位置)"""
         fm_end = 0
@@ -5259,7 +5256,7 @@ class MarkdownFormatHandler(BaseFormatHandler):
         rel_path: str,
         results: list,
         counters: dict,
-        full_lines: list[str],
+        full_lines: ContextSource,
         app_instance=None,
     ):
         """逐行扫描文档正文，按语义单元提取"""
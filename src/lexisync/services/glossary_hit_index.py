@@ -0,0 +1,154 @@
+# Copyright (c) 2025-2026, TheSkyC
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import threading
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+logger = logging.getLogger(__name__)
+
+
+def _is_plural_form(ts_obj, plural_index) -> bool:
+    return ts_obj.is_plural and plural_index is not None and plural_index != ts_obj.singular_index
+
+
+def glossary_source_text(ts_obj, plural_index=None) -> str:
+    """返回某个复数形式对应的原文（与术语面板、校验和 AI 提示词使用的原文一致）"""
+    if _is_plural_form(ts_obj, plural_index):
+        return ts_obj.original_plural or ts_obj.original_semantic
+    return ts_obj.original_semantic
+
+
+class GlossaryHitIndex:
+    """
+    项目级术语命中索引：记录每个 TranslatableString（每个原文形式）中出现了哪些术语及其位置。
+    条目以原文和术语索引的 generation 校验有效性：原文变化或术语库变化时按需重算，
+    术语库增量变化时，只有原文中包含变更术语的条目需要重算。
+    """
+
+    def __init__(self, glossary_service):
+        self.glossary_service = glossary_service
+        self._entries: dict[tuple, tuple] = {}
+        self._build_token = 0
+        self._token_lock = threading.Lock()
+
+    def clear(self):
+        self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_hits(self, ts_obj, plural_index, source_lang, target_lang, load=True) -> list[dict] | None:
+        """
+        返回原文中的术语命中：
+        [{'source': 术语(小写), 'term': 原文中的写法, 'translations': [...], 'spans': [(start, end), ...]}]
+        load=False 且语言对的术语索引尚未加载时返回 None，避免在 UI 线程访问数据库。
+        """
+        if load:
+            term_index = self.glossary_service.get_term_index(source_lang, target_lang)
+        else:
+            term_index = self.glossary_service.peek_term_index(source_lang, target_lang)
+            if term_index is None:
+                return None
+
+        text = glossary_source_text(ts_obj, plural_index)
+        key = (ts_obj.id, _is_plural_form(ts_obj, plural_index), source_lang, target_lang)
+        entry = self._entries.get(key)
+        hits = self._validate_entry(entry, text, term_index)
+        if hits is None:
+            hits = self._compute(text, term_index)
+            self._entries[key] = (text, term_index.generation, hits)
+        elif entry[1] != term_index.generation:
+            self._entries[key] = (text, term_index.generation, hits)
+        return hits
+
+    def _validate_entry(self, entry, text, term_index):
+        if entry is None:
+            return None
+        cached_text, generation, hits = entry
+        if cached_text is not text and cached_text != text:
+            return None
+        if generation == term_index.generation:
+            return hits
+        # 术语索引只前进了一步增量更新：原文中不包含任何变更术语时命中不变
+        if generation == term_index.parent_generation and term_index.changed_keys is not None:
+            text_lower = text.lower()
+            if not any(key in text_lower for key in term_index.changed_keys):
+                return hits
+        return None
+
+    @staticmethod
+    def _compute(text, term_index) -> list[dict]:
+        hits = {}
+        for match in term_index.extract_keywords(text):
+            info = match["data"]
+            hit = hits.get(info["term"])
+            if hit is None:
+                hits[info["term"]] = {
+                    "source": info["term"],
+                    "term": match["term"],
+                    "translations": info["translations"],
+                    "spans": [(match["start"], match["end"])],
+                }
+            else:
+                hit["spans"].append((match["start"], match["end"]))
+        return list(hits.values())
+
+    def new_build_token(self) -> int:
+        with self._token_lock:
+            self._build_token += 1
+            return self._build_token
+
+    def is_current_token(self, token: int) -> bool:
+        return token == self._build_token
+
+    def precompute(self, ts_objects, source_lang, target_lang, token=None) -> bool:
+        """为全部字符串计算命中；未变化的条目直接复用，不再出现的字符串被移除"""
+        term_index = self.glossary_service.get_term_index(source_lang, target_lang)
+        old_entries = self._entries
+        new_entries = {}
+        for count, ts_obj in enumerate(ts_objects):
+            if token is not None and count % 512 == 0 and not self.is_current_token(token):
+                return False
+            for is_plural_form in (False, True) if ts_obj.is_plural else (False,):
+                text = (
+                    (ts_obj.original_plural or ts_obj.original_semantic) if is_plural_form else ts_obj.original_semantic
+                )
+                key = (ts_obj.id, is_plural_form, source_lang, target_lang)
+                entry = old_entries.get(key)
+                hits = self._validate_entry(entry, text, term_index)
+                if hits is None:
+                    hits = self._compute(text, term_index)
+                new_entries[key] = (text, term_index.generation, hits)
+
+        if token is not None and not self.is_current_token(token):
+            return False
+        self._entries = new_entries
+        logger.debug(f"Glossary hit index covers {len(new_entries)} source forms.")
+        return True
+
+
+class GlossaryHitIndexSignals(QObject):
+    finished = Signal(bool)
+
+
+class GlossaryHitIndexWorker(QRunnable):
+    """在后台为整个项目预计算术语命中；有更新的任务启动时旧任务自动放弃"""
+
+    def __init__(self, hit_index: GlossaryHitIndex, ts_objects, source_lang, target_lang):
+        super().__init__()
+        self.hit_index = hit_index
+        self.ts_objects = list(ts_objects)
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self.token = hit_index.new_build_token()
+        self.signals = GlossaryHitIndexSignals()
+
+    def run(self):
+        completed = False
+        try:
+            completed = self.hit_index.precompute(self.ts_objects, self.source_lang, self.target_lang, self.token)
+        except Exception as e:
+            logger.error(f"Glossary hit index build failed: {e}", exc_info=True)
+        self.signals.finished.emit(completed)
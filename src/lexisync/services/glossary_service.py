@@ -4,12 +4,15 @@
 from contextlib import contextmanager
 from datetime import datetime
 import hashlib
+import itertools
 import json
 import logging
 import os
 import sqlite3
 import threading
 
+from lexisync.services.db_maintenance_service import optimize_database
+from lexisync.utils.keyword_matcher import KeywordMatcher
 from lexisync.utils.localization import _
 from lexisync.utils.tbx_parser import TBXParser
 
@@ -18,12 +21,95 @@ logger = logging.getLogger(__name__)
 MANIFEST_FILE = "manifest.json"
 DB_FILE = "glossary.db"
 
+_SQL_PAIR_TERMS = """
+    SELECT
+        t_source.term_text_lower AS source_key,
+        t_target.term_text AS target_term,
+        t_target.language_code AS target_lang,
+        tt.comment,
+        tt.confidence_score
+    FROM terms t_source
+    JOIN term_translations tt ON t_source.id = tt.source_term_id
+    JOIN terms t_target ON tt.target_term_id = t_target.id
+    WHERE t_source.language_code = ? AND t_target.language_code = ?
+"""
+_SQL_PAIR_TERMS_FOR_KEYS = _SQL_PAIR_TERMS + " AND t_source.term_text_lower IN (SELECT value FROM json_each(?))"
+
+_index_generations = itertools.count(1)
+
+
+class GlossaryTermIndex:
+    """
+    某一 (源语言, 目标语言) 对的内存术语索引，合并项目库与全局库的正向术语。
+    实例不可变：更新时生成新实例，查询方无需加锁，也不会访问 SQLite。
+    terms 的值与 get_translations_batch 的返回格式一致，额外带有小写的 "term" 键。
+    由 updated() 生成的实例记录上一版本的 generation 与变更的术语，供派生缓存增量失效。
+    """
+
+    __slots__ = ("_matcher", "changed_keys", "generation", "parent_generation", "source_lang", "target_lang", "terms")
+
+    def __init__(
+        self,
+        source_lang: str,
+        target_lang: str,
+        terms: dict[str, dict],
+        parent_generation: int | None = None,
+        changed_keys: frozenset[str] | None = None,
+    ):
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self.terms = terms
+        self.generation = next(_index_generations)
+        self.parent_generation = parent_generation
+        self.changed_keys = changed_keys
+        self._matcher = None
+
+    def __len__(self):
+        return len(self.terms)
+
+    def get(self, term: str) -> dict | None:
+        return self.terms.get(term.lower())
+
+    def lookup(self, words: list[str]) -> dict:
+        """按词精确查询，返回格式同 get_translations_batch"""
+        terms = self.terms
+        return {w: terms[w] for w in {word.lower() for word in words} if w in terms}
+
+    def updated(self, changes: dict[str, dict | None]) -> "GlossaryTermIndex":
+        """返回应用了变更（值为 None 表示删除）的新索引，匹配自动机在首次查询时重新编译"""
+        terms = dict(self.terms)
+        for key, info in changes.items():
+            if info is None:
+                terms.pop(key, None)
+            else:
+                terms[key] = info
+        return GlossaryTermIndex(self.source_lang, self.target_lang, terms, self.generation, frozenset(changes))
+
+    @property
+    def matcher(self) -> KeywordMatcher:
+        matcher = self._matcher
+        if matcher is None:
+            matcher = KeywordMatcher(case_sensitive=False)
+            matcher.add_keywords(self.terms)
+            self._matcher = matcher
+        return matcher
+
+    def extract_keywords(self, text: str) -> list[dict]:
+        """
+        查找 text 中出现的整词术语（最长匹配、互不重叠）。
+        :return: list of {'term': str, 'data': dict, 'start': int, 'end': int}
+        """
+        if not text or not self.terms:
+            return []
+        return self.matcher.extract_keywords(text)
+
 
 class GlossaryService:
     def __init__(self):
         self.project_db_path: str | None = None
         self.global_db_path: str | None = None
         self._lock = threading.RLock()  # 线程安全锁
+        self._term_indexes: dict[tuple[str, str], GlossaryTermIndex] = {}
 
     def connect_databases(self, global_glossary_path: str, project_glossary_path: str | None = None):
         with self._lock:
@@ -44,6 +130,7 @@ class GlossaryService:
         with self._lock:
             self.project_db_path = None
             self.global_db_path = None
+            self._term_indexes = {}
 
     @contextmanager
     def _get_db_connection(self, db_path: str):
@@ -169,6 +256,72 @@ class GlossaryService:
             logger.error(f"Failed to register source in manifest: {e}")
             return False
 
+    def get_term_index(self, source_lang: str, target_lang: str) -> GlossaryTermIndex:
+        """获取语言对的内存术语索引，首次访问时从数据库加载"""
+        pair = (source_lang, target_lang)
+        index = self._term_indexes.get(pair)
+        if index is not None:
+            return index
+
+        with self._lock:
+            index = self._term_indexes.get(pair)
+            if index is None:
+                index = GlossaryTermIndex(source_lang, target_lang, self._load_pair_terms(source_lang, target_lang))
+                self._term_indexes[pair] = index
+                logger.debug(f"Loaded glossary index {source_lang}->{target_lang} with {len(index)} terms.")
+            return index
+
+    def peek_term_index(self, source_lang: str, target_lang: str) -> GlossaryTermIndex | None:
+        """仅返回已加载的术语索引，不访问数据库"""
+        return self._term_indexes.get((source_lang, target_lang))
+
+    def invalidate_term_indexes(self):
+        self._term_indexes = {}
+
+    def _load_pair_terms(self, source_lang: str, target_lang: str, keys: list[str] | None = None) -> dict[str, dict]:
+        """读取语言对的正向术语（可限定为指定的小写术语）；项目库中的术语覆盖全局库"""
+        terms = {}
+        for db_path in (self.global_db_path, self.project_db_path):
+            if not db_path or not os.path.exists(db_path):
+                continue
+            db_terms = {}
+            try:
+                with self._get_db_connection(db_path) as conn:
+                    if keys is None:
+                        cursor = conn.execute(_SQL_PAIR_TERMS, (source_lang, target_lang))
+                    else:
+                        cursor = conn.execute(_SQL_PAIR_TERMS_FOR_KEYS, (source_lang, target_lang, json.dumps(keys)))
+                    for row in cursor:
+                        key = row["source_key"]
+                        if key not in db_terms:
+                            db_terms[key] = {"term": key, "translations": []}
+                        db_terms[key]["translations"].append(
+                            {
+                                "target": row["target_term"],
+                                "target_lang": row["target_lang"],
+                                "comment": row["comment"],
+                                "confidence_score": row["confidence_score"],
+                                "direction": "forward",
+                            }
+                        )
+            except Exception as e:
+                logger.warning(f"Failed to load glossary index from {db_path}: {e}")
+            terms.update(db_terms)
+        return terms
+
+    def _refresh_term_indexes(self, source_lang: str, target_langs: list[str], terms: set[str]):
+        """增量更新已加载的索引：只重新读取受影响的源术语（调用方需持有 self._lock）"""
+        keys = sorted({t.strip().lower() for t in terms if t and t.strip()})
+        if not keys:
+            return
+        for target_lang in target_langs:
+            pair = (source_lang, target_lang)
+            index = self._term_indexes.get(pair)
+            if index is None:
+                continue
+            found = self._load_pair_terms(source_lang, target_lang, keys)
+            self._term_indexes[pair] = index.updated({k: found.get(k) for k in keys})
+
     def get_translations(
         self, term_text: str, source_lang: str, target_lang: str | None = None, include_reverse: bool = True
     ) -> list[dict] | None:
@@ -312,6 +465,7 @@ class GlossaryService:
                     )
 
                     cursor.execute("COMMIT")
+                    self.invalidate_term_indexes()
                     return True
             except sqlite3.IntegrityError:
                 logger.warning(f"Glossary update failed: Term '{new_text}' already exists in this language.")
@@ -376,6 +530,18 @@ class GlossaryService:
                         progress_callback,
                     )
 
+                self._refresh_term_indexes(
+                    source_lang,
+                    target_langs,
+                    {
+                        term
+                        for lang_map in terms_to_import
+                        for lang_in_file, terms in lang_map.items()
+                        if lang_mapping.get(lang_in_file) == source_lang
+                        for term in terms
+                    },
+                )
+
                 # 更新manifest
                 file_stats["import_date"] = datetime.now().isoformat() + "Z"
                 file_stats["term_count"] = term_count
@@ -554,6 +720,7 @@ class GlossaryService:
                             logger.info(f"Cleaned up {orphaned_terms_cleaned} orphaned terms.")
 
                         cursor.execute("COMMIT")
+                        self.invalidate_term_indexes()
 
                         manifest = self._read_manifest(manifest_path)
                         if "imported_sources" in manifest and source_key in manifest["imported_sources"]:
@@ -812,6 +979,7 @@ class GlossaryService:
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM term_translations WHERE id = ?", (entry_id,))
                 conn.commit()
+                self.invalidate_term_indexes()
                 return True
         except Exception as e:
             logger.error(f"Glossary delete failed: {e}")
@@ -829,6 +997,41 @@ class GlossaryService:
         except Exception:
             return [], []
 
+    def run_maintenance(self, db_paths: list[str] | None = None) -> list[dict]:
+        """优化已连接（或指定）的术语库，并报告文件大小与查询延迟的变化"""
+        if db_paths is None:
+            db_paths = [self.project_db_path, self.global_db_path]
+
+        reports = []
+        for db_path in dict.fromkeys(p for p in db_paths if p and os.path.exists(p)):
+            with self._lock:
+                try:
+                    with self._get_db_connection(db_path) as conn:
+                        # 清理逐条删除后残留的孤立术语
+                        orphaned = conn.execute("""
+                            DELETE FROM terms
+                            WHERE id NOT IN (
+                                SELECT source_term_id FROM term_translations
+                                UNION
+                                SELECT target_term_id FROM term_translations
+                            )
+                        """).rowcount
+                        samples = conn.execute(
+                            "SELECT term_text, language_code FROM terms ORDER BY random() LIMIT 50"
+                        ).fetchall()
+
+                        def probe(c, samples=samples):
+                            for row in samples:
+                                self._query_translations_in_db(c, row[0], row[1])
+
+                        report = optimize_database(conn, db_path, probe=probe)
+                        report["steps"].insert(0, f"orphaned_terms:{orphaned}")
+                        reports.append(report)
+                except Exception as e:
+                    logger.error(f"Glossary maintenance failed for {db_path}: {e}", exc_info=True)
+                    reports.append({"db_path": db_path, "error": str(e)})
+        return reports
+
     def _read_manifest(self, manifest_path: str) -> dict:
         """读取manifest文件"""
         try:
@@ -1012,6 +1215,9 @@ class GlossaryService:
                         pass  # 关系已存在
 
                 cursor.execute("COMMIT")
+                self._refresh_term_indexes(
+                    source_lang, [target_lang], {e["source"] for e in entries if e.get("action", "new") != "skip"}
+                )
                 return True, _("Successfully saved {count} entries.").format(count=count_success)
 
         except Exception as e:
@@ -1068,6 +1274,7 @@ class GlossaryService:
                     (source_id, target_id, 1, comment, source_key),
                 )
                 conn.commit()
+                self._refresh_term_indexes(source_lang, [target_lang], {source_term})
                 return True, _("Glossary entry added successfully.")
             except Exception as e:
                 conn.rollback()
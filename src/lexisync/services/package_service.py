@@ -9,6 +9,9 @@ from pathlib import Path
 
 from PySide6.QtCore import QObject, Signal
 
+from lexisync.services.project_service import TRANSLATION_DIR
+from lexisync.services.translation_store import get_translation_store
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -100,7 +103,7 @@ class PackageWorker(QObject):
         # 1. Calculate Languages Stats
         langs_stats = {}
         for lang in self.options["langs"]:
-            trans_file = self.project_path / "translation" / f"{lang}.json"
+            store = get_translation_store(self.project_path / TRANSLATION_DIR, lang)
 
             stats = {
                 "total_strings": 0,
@@ -110,26 +113,23 @@ class PackageWorker(QObject):
                 "progress_percent": 0.0,
             }
 
-            if trans_file.exists():
+            if store.exists():
                 try:
-                    with open(trans_file, encoding="utf-8") as f:
-                        data = json.load(f)
-                        stats["total_strings"] = len(data)
-
-                        for item in data:
-                            src_len = len(item.get("original_semantic", ""))
-                            trans_len = len(item.get("translation", ""))
-                            is_trans = bool(item.get("translation", "").strip()) and not item.get("is_ignored", False)
-
-                            stats["source_char_count"] += src_len
-                            if is_trans:
-                                stats["translated_strings"] += 1
-                                stats["translation_char_count"] += trans_len
-
-                        if stats["total_strings"] > 0:
-                            stats["progress_percent"] = round(
-                                (stats["translated_strings"] / stats["total_strings"]) * 100, 1
-                            )
+                    for item in store.iter_records():
+                        stats["total_strings"] += 1
+                        src_len = len(item.get("original_semantic", ""))
+                        trans_len = len(item.get("translation", ""))
+                        is_trans = bool(item.get("translation", "").strip()) and not item.get("is_ignored", False)
+
+                        stats["source_char_count"] += src_len
+                        if is_trans:
+                            stats["translated_strings"] += 1
+                            stats["translation_char_count"] += trans_len
+
+                    if stats["total_strings"] > 0:
+                        stats["progress_percent"] = round(
+                            (stats["translated_strings"] / stats["total_strings"]) * 100, 1
+                        )
                 except Exception as e:
                     logger.error(f"Error calculating stats for {lang}: {e}")
 
@@ -193,12 +193,13 @@ class PackageWorker(QObject):
         scan_dir(self.project_path / "source")
 
         # Translation dir
-        trans_dir = self.project_path / "translation"
+        trans_dir = self.project_path / TRANSLATION_DIR
         if trans_dir.exists():
             for lang in self.options["langs"]:
-                f = trans_dir / f"{lang}.json"
-                if f.exists() and not is_junk(f):
-                    files.append(f)
+                # 旧版 JSON 先转换，打包的始终是数据库文件
+                store = get_translation_store(trans_dir, lang)
+                if store.convert_legacy():
+                    files.append(store.path)
 
         # TM
         if self.options["include_tm"]:
@@ -0,0 +1,287 @@
+# Copyright (c) 2025-2026, TheSkyC
+# SPDX-License-Identifier: Apache-2.0
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import logging
+import multiprocessing
+import os
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from lexisync.services.validation_engine import validation_signature
+from lexisync.services.validation_service import (
+    VALIDATION_REGISTRY,
+    lookup_glossary_matches,
+    run_plugin_rules,
+    translated_forms,
+    validate_string,
+)
+from lexisync.utils.localization import lang_manager
+from lexisync.utils.text_utils import get_linguistic_length
+
+logger = logging.getLogger(__name__)
+
+# 少于该数量的字符串直接在本进程校验，启动进程池的开销不划算
+PARALLEL_VALIDATION_MIN_STRINGS = 5000
+CHUNK_SIZE = 1000
+
+# 从 ctx_env 原样传给子进程的标量字段
+_PORTABLE_KEYS = (
+    "markers",
+    "fuzzy_enabled",
+    "fuzzy_level",
+    "glossary_enabled",
+    "glossary_level",
+    "check_length",
+    "expected_ratio",
+    "source_lang",
+    "target_lang",
+    "len_major_up",
+    "len_major_down",
+    "len_minor_up",
+    "len_minor_down",
+)
+
+
+def default_worker_count() -> int:
+    return max(1, min((os.cpu_count() or 2) - 1, 8))
+
+
+def portable_validation_context(ctx_env) -> dict:
+    """
+    把校验上下文转换为可 pickle 的形式：规则以其在 VALIDATION_REGISTRY 中的下标表示
+    （同一 key 可能对应多条规则），在子进程中从注册表还原。
+    术语命中不在子进程中计算，而是随每个字符串一起发送。
+    """
+    portable = {key: ctx_env[key] for key in _PORTABLE_KEYS}
+    registry_index = {id(rule): i for i, rule in enumerate(VALIDATION_REGISTRY)}
+    portable["active_rules"] = [
+        (registry_index[id(rule_pack["rule"])], rule_pack["rule"]["key"], rule_pack["kwargs"], rule_pack["level"])
+        for rule_pack in ctx_env["active_rules"]
+    ]
+    portable["has_glossary"] = ctx_env["term_cache"] is not None
+    return portable
+
+
+def _restore_context(portable) -> dict:
+    ctx_env = {key: portable[key] for key in _PORTABLE_KEYS}
+    ctx_env["active_rules"] = [
+        {"rule": VALIDATION_REGISTRY[index], "kwargs": kwargs, "level": level}
+        for index, key, kwargs, level in portable["active_rules"]
+        if index < len(VALIDATION_REGISTRY) and VALIDATION_REGISTRY[index]["key"] == key
+    ]
+    # term_cache 只作为 "启用术语检查" 的标记，实际命中由 _ShippedGlossaryHits 提供
+    ctx_env["term_cache"] = True if portable["has_glossary"] else None
+    ctx_env["glossary_hits"] = _ShippedGlossaryHits()
+    # 插件规则只存在于主进程，由主进程在收到结果后执行
+    ctx_env["plugin_rules"] = []
+    return ctx_env
+
+
+def compact_string(ts_obj, ctx_env) -> tuple:
+    """提取校验所需的最少数据，并在主进程中预先解析好术语命中"""
+    glossary = None
+    if ctx_env["term_cache"] is not None and ctx_env["glossary_enabled"] and not ts_obj.is_ignored:
+        glossary = {}
+        for idx, original in translated_forms(ts_obj):
+            matches = lookup_glossary_matches(ts_obj, idx, original, ctx_env)
+            if matches:
+                glossary[idx] = [
+                    {"term": m["term"], "translations": [{"target": t["target"]} for t in m["translations"]]}
+                    for m in matches
+                ]
+    return (
+        ts_obj.original_semantic,
+        ts_obj.original_plural,
+        ts_obj.translation,
+        dict(ts_obj.plural_translations) if ts_obj.is_plural else None,
+        ts_obj.singular_index if ts_obj.is_plural else 0,
+        ts_obj.is_ignored,
+        ts_obj.is_fuzzy,
+        glossary,
+    )
+
+
+class _CompactString:
+    """子进程中代替 TranslatableString 的轻量对象，只提供 validate_string 需要的属性"""
+
+    __slots__ = (
+        "glossary",
+        "infos",
+        "is_fuzzy",
+        "is_ignored",
+        "is_plural",
+        "minor_warnings",
+        "original_plural",
+        "original_semantic",
+        "plural_translations",
+        "singular_index",
+        "translation",
+        "warnings",
+    )
+
+    def __init__(self, item):
+        (
+            self.original_semantic,
+            self.original_plural,
+            self.translation,
+            plural_translations,
+            self.singular_index,
+            self.is_ignored,
+            self.is_fuzzy,
+            self.glossary,
+        ) = item
+        self.is_plural = plural_translations is not None
+        self.plural_translations = plural_translations if self.is_plural else {0: self.translation}
+        self.warnings = []
+        self.minor_warnings = []
+        self.infos = []
+
+    def linguistic_length(self, text) -> int:
+        return get_linguistic_length(text)
+
+
+class _ShippedGlossaryHits:
+    @staticmethod
+    def get_hits(ts_obj, plural_index, source_lang, target_lang):
+        return (ts_obj.glossary or {}).get(plural_index, [])
+
+
+_WORKER_CTX = None
+
+
+def _init_worker(portable_ctx, ui_language):
+    global _WORKER_CTX  # noqa: PLW0603
+    # 子进程以 spawn 方式启动，需要重新设置界面语言，警告信息才能与主进程一致
+    lang_manager.setup_translation(ui_language)
+    _WORKER_CTX = _restore_context(portable_ctx)
+
+
+def _validate_chunk(items) -> list:
+    results = []
+    for item in items:
+        ts_obj = _CompactString(item)
+        validate_string(ts_obj, _WORKER_CTX)
+        results.append((ts_obj.warnings, ts_obj.minor_warnings, ts_obj.infos))
+    return results
+
+
+def apply_plugin_rules(items, results, ctx_env):
+    """
+    对子进程返回的结果补充执行插件规则，顺序与串行校验一致（插件规则在最后）。
+    插件规则不要求线程安全，只在主线程中调用。
+    """
+    for item, (warnings, minor_warnings, infos) in zip(items, results, strict=True):
+        ts_obj = _CompactString(item)
+        if ts_obj.is_ignored:
+            continue
+        ts_obj.warnings = warnings
+        ts_obj.minor_warnings = minor_warnings
+        ts_obj.infos = infos
+        run_plugin_rules(ts_obj, ctx_env, bulk=True)
+
+
+def iter_validation_results(
+    ts_objects, ctx_env, is_cancelled=None, max_workers=None, chunk_size=CHUNK_SIZE, *, run_plugins=True
+):
+    """
+    在进程池中分块校验字符串，按完成顺序逐块产出 (start, signatures, items, results)。
+    results[i] 为 ts_objects[start + i] 的 (warnings, minor_warnings, infos)；
+    signatures 为发送时的内容签名，用于在写回前确认字符串未被修改；items 为发送给子进程的精简数据。
+    插件规则无法发送到子进程，run_plugins 为 True 时在产出前于调用线程中执行，
+    为 False 时由调用方对 items 调用 apply_plugin_rules。
+    """
+    total = len(ts_objects)
+    if not total:
+        return
+    workers = max_workers or default_worker_count()
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(portable_validation_context(ctx_env), lang_manager.get_current_language()),
+    )
+    pending = {}
+    next_start = 0
+    try:
+        while next_start < total or pending:
+            # 只保持有限数量的块在途，压缩工作随进度进行，取消时也能尽快停止
+            while next_start < total and len(pending) < workers * 2:
+                if is_cancelled and is_cancelled():
+                    return
+                chunk = ts_objects[next_start : next_start + chunk_size]
+                signatures = [validation_signature(ts_obj) for ts_obj in chunk]
+                items = [compact_string(ts_obj, ctx_env) for ts_obj in chunk]
+                pending[executor.submit(_validate_chunk, items)] = (next_start, signatures, items)
+                next_start += len(chunk)
+
+            done, __ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                start, signatures, items = pending.pop(future)
+                results = future.result()
+                if run_plugins and ctx_env["plugin_rules"]:
+                    apply_plugin_rules(items, results, ctx_env)
+                yield start, signatures, items, results
+            if is_cancelled and is_cancelled():
+                return
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def run_validation_parallel(ts_objects, ctx_env):
+    """阻塞式校验，结果在调用线程中写回；字符串较少时直接在本进程中校验"""
+    if len(ts_objects) < PARALLEL_VALIDATION_MIN_STRINGS:
+        for ts_obj in ts_objects:
+            validate_string(ts_obj, ctx_env, bulk=True)
+        return
+    for start, __, __, results in iter_validation_results(ts_objects, ctx_env):
+        for ts_obj, (warnings, minor_warnings, infos) in zip(
+            ts_objects[start : start + len(results)], results, strict=True
+        ):
+            ts_obj.warnings = warnings
+            ts_obj.minor_warnings = minor_warnings
+            ts_obj.infos = infos
+
+
+class ParallelValidationSignals(QObject):
+    progress = Signal(int, int)
+    chunk_ready = Signal(int, list, list, list)
+    finished = Signal(bool)
+
+
+class ParallelValidationWorker(QRunnable):
+    """
+    在后台线程中驱动进程池校验，逐块通过 chunk_ready 把结果交回主线程写入字符串对象。
+    插件规则不在本线程中执行，由主线程收到结果后调用 apply_plugin_rules。
+    finished(True) 表示全部完成，False 表示被取消或出错。
+    """
+
+    def __init__(self, ts_objects, ctx_env, max_workers=None):
+        super().__init__()
+        self.ts_objects = list(ts_objects)
+        self.ctx_env = ctx_env
+        self.max_workers = max_workers
+        self.signals = ParallelValidationSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def run(self):
+        completed = False
+        total = len(self.ts_objects)
+        done_count = 0
+        try:
+            for start, signatures, items, results in iter_validation_results(
+                self.ts_objects, self.ctx_env, self.is_cancelled, self.max_workers, run_plugins=False
+            ):
+                self.signals.chunk_ready.emit(start, signatures, items, results)
+                done_count += len(results)
+                self.signals.progress.emit(done_count, total)
+            completed = not self._cancelled
+        except Exception as e:
+            logger.error(f"Parallel validation failed: {e}", exc_info=True)
+        self.signals.finished.emit(completed)
@@ -0,0 +1,191 @@
+# Copyright (c) 2025-2026, TheSkyC
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import threading
+
+from lexisync.utils.enums import WarningType
+from lexisync.utils.plugin_context import plugin_libs_context
+
+logger = logging.getLogger(__name__)
+
+# 插件规则的耗时预算（每次调用的平均耗时，毫秒）
+# 超过 DEMOTE 后降级：批量校验（全项目、多条目）时跳过，只在单条编辑时执行；
+# 超过 DISABLE 或单次调用超过 HARD_LIMIT 时在本次会话中停用。
+PLUGIN_RULE_DEMOTE_MS = 1.0
+PLUGIN_RULE_DISABLE_MS = 10.0
+PLUGIN_RULE_HARD_LIMIT_MS = 500.0
+# 至少采样这么多次调用后才按平均耗时判断，避免首次调用的冷启动开销误判
+PLUGIN_RULE_MIN_SAMPLES = 50
+PLUGIN_RULE_MAX_ERRORS = 3
+
+RULE_STATE_ACTIVE = "active"
+RULE_STATE_DEMOTED = "demoted"
+RULE_STATE_DISABLED = "disabled"
+
+
+def _always(ctx):
+    return True
+
+
+def _no_kwargs(ctx):
+    return {}
+
+
+class PluginRuleStats:
+    """单条插件规则的计时计数器与预算状态"""
+
+    __slots__ = ("calls", "errors", "key", "max_seconds", "results", "skipped", "state", "total_seconds")
+
+    def __init__(self, key):
+        self.key = key
+        self.calls = 0
+        self.skipped = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.state = RULE_STATE_ACTIVE
+        # 规则产生过的 (WarningType, 消息)，状态变化时据此找出需要重新校验的条目
+        self.results = set()
+
+    @property
+    def average_ms(self) -> float:
+        return self.total_seconds / self.calls * 1000 if self.calls else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "key": self.key,
+            "state": self.state,
+            "calls": self.calls,
+            "skipped": self.skipped,
+            "errors": self.errors,
+            "total_ms": self.total_seconds * 1000,
+            "average_ms": self.average_ms,
+            "max_ms": self.max_seconds * 1000,
+        }
+
+
+def normalize_plugin_rule(plugin_id, plugin_version, spec):
+    """
+    把插件返回的规则转换为 VALIDATION_REGISTRY 的条目格式。
+    只给出函数时视为 check_func(source, target)，键名取函数名。
+    :return: 规则字典，格式不正确时返回 None
+    """
+    if callable(spec):
+        spec = {"check_func": spec}
+    if not isinstance(spec, dict) or not callable(spec.get("check_func")):
+        logger.warning(f"Plugin '{plugin_id}' returned an invalid validation rule: {spec!r}")
+        return None
+
+    name = spec.get("key") or spec["check_func"].__name__
+    key = name if name.startswith(f"{plugin_id}.") else f"{plugin_id}.{name}"
+    warning_type = spec.get("warning_type", WarningType.PLUGIN_RULE)
+    if not isinstance(warning_type, WarningType):
+        warning_type = WarningType.PLUGIN_RULE
+    return {
+        "key": key,
+        "profile_key": key,
+        "warning_type": warning_type,
+        "fast_path": spec.get("fast_path") or _always,
+        "check_func": spec["check_func"],
+        "kwargs_gen": spec.get("kwargs_gen") or _no_kwargs,
+        "use_clean_text": bool(spec.get("use_clean_text", False)),
+        "default_level": spec.get("level", "warning"),
+        "plugin": f"{plugin_id}@{plugin_version}",
+        "stats": PluginRuleStats(key),
+    }
+
+
+class PluginRuleRegistry:
+    """
+    收集已启用插件通过 register_validation_rules 提供的校验规则。
+    规则在构建校验上下文时与内置规则合并；已启用插件列表变化（启用/停用/重新加载）后重新收集，version 递增。
+    规则的降级/停用状态在执行时读取，不影响校验上下文；状态变化按顺序记录，
+    校验引擎据此只重新校验含有该规则结果的条目。
+    收集规则与记录耗时只在主线程中进行（插件规则只在主线程中执行）。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rules = []
+        self._source = None
+        self.version = 0
+        self._state_changes = []  # 状态发生变化的规则，按发生顺序
+
+    @property
+    def state_version(self) -> int:
+        return len(self._state_changes)
+
+    def state_changes_since(self, state_version) -> list:
+        """:return: state_version 之后状态发生变化的规则 [(变化后的 state_version, 规则)]"""
+        with self._lock:
+            changes = self._state_changes[state_version:]
+        return list(enumerate(changes, start=state_version + 1))
+
+    def sync(self, plugin_manager):
+        """已启用插件列表对象变化时重新收集规则"""
+        if plugin_manager is None:
+            return
+        enabled = plugin_manager.get_enabled_plugins()
+        if enabled is self._source:
+            return
+
+        rules = []
+        with plugin_libs_context():
+            for plugin in enabled:
+                try:
+                    specs = plugin.register_validation_rules() or []
+                    plugin_id = plugin.plugin_id()
+                    plugin_version = plugin.version()
+                except Exception as e:
+                    logger.error(f"Error collecting validation rules from plugin: {e}", exc_info=True)
+                    continue
+                for spec in specs:
+                    rule = normalize_plugin_rule(plugin_id, plugin_version, spec)
+                    if rule is not None:
+                        rules.append(rule)
+
+        with self._lock:
+            self._rules = rules
+            self._source = enabled
+            self.version += 1
+        if rules:
+            logger.info(f"Registered {len(rules)} plugin validation rule(s).")
+
+    def rules(self) -> list:
+        return self._rules
+
+    def stats(self) -> list:
+        return [rule["stats"].as_dict() for rule in self._rules]
+
+    def record(self, rule, elapsed, failed=False):
+        """记录一次调用的耗时，并按预算调整规则状态"""
+        stats = rule["stats"]
+        stats.calls += 1
+        stats.total_seconds += elapsed
+        stats.max_seconds = max(stats.max_seconds, elapsed)
+        if failed:
+            stats.errors += 1
+
+        if stats.state == RULE_STATE_DISABLED:
+            return
+        elapsed_ms = elapsed * 1000
+        if stats.errors >= PLUGIN_RULE_MAX_ERRORS:
+            self._set_state(rule, RULE_STATE_DISABLED, f"raised {stats.errors} errors")
+        elif elapsed_ms > PLUGIN_RULE_HARD_LIMIT_MS:
+            self._set_state(rule, RULE_STATE_DISABLED, f"a single call took {elapsed_ms:.0f} ms")
+        elif stats.calls >= PLUGIN_RULE_MIN_SAMPLES:
+            average_ms = stats.average_ms
+            if average_ms > PLUGIN_RULE_DISABLE_MS:
+                self._set_state(rule, RULE_STATE_DISABLED, f"averages {average_ms:.2f} ms per call")
+            elif average_ms > PLUGIN_RULE_DEMOTE_MS and stats.state == RULE_STATE_ACTIVE:
+                self._set_state(rule, RULE_STATE_DEMOTED, f"averages {average_ms:.2f} ms per call")
+
+    def _set_state(self, rule, state, reason):
+        with self._lock:
+            rule["stats"].state = state
+            self._state_changes.append(rule)
+        logger.warning(f"Plugin validation rule '{rule['key']}' {state}: {reason}.")
+
+
+plugin_rule_registry = PluginRuleRegistry()
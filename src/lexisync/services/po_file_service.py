@@ -13,6 +13,7 @@ import xxhash
 from lexisync.models.translatable_string import TranslatableString
 from lexisync.services.code_file_service import extract_translatable_strings
 from lexisync.utils.constants import APP_VERSION
+from lexisync.utils.context_lines import ContextSource
 
 logger = logging.getLogger(__name__)
 
@@ -103,7 +104,6 @@ def po_entry_to_translatable_string(
 
     # 默认显示 index 0
     ts.translation = plural_translations.get(0, "")
-    ts._display_translation = ts.translation.replace("\n", "↵")
 
     if msgctxt:
         ts.context = msgctxt
@@ -264,13 +264,23 @@ def load_from_po(filepath, relative_path=None):
 
     translatable_objects = []
     project_root = _find_project_root(filepath)
-    file_content_cache = {}
-    path_exists_cache = {}
-
-    def cached_is_file(path_str):
-        if path_str not in path_exists_cache:
-            path_exists_cache[path_str] = os.path.isfile(path_str)
-        return path_exists_cache[path_str]
+    # 引用路径 -> 上下文来源（找不到源文件时为 None），每个引用的源文件只解析一次
+    context_sources = {}
+
+    def resolve_context_source(relative_path):
+        normalized_rel_path = os.path.normpath(relative_path)
+        if project_root:
+            candidate = os.path.join(project_root, normalized_rel_path)
+            return ContextSource.from_path(candidate) if os.path.isfile(candidate) else None
+        current_search_dir = Path(filepath).parent
+        for _ in range(6):
+            candidate_str = str(current_search_dir / normalized_rel_path)
+            if os.path.isfile(candidate_str):
+                return ContextSource.from_path(candidate_str)
+            if current_search_dir.parent == current_search_dir:
+                break
+            current_search_dir = current_search_dir.parent
+        return None
 
     po_file_rel_path = ""
     if relative_path:
@@ -292,39 +302,18 @@ def load_from_po(filepath, relative_path=None):
         current_index = occurrence_counters.get(key, 0)
         occurrence_counters[key] = current_index + 1
 
-        full_code_lines = []
+        # 只记录源文件路径，行内容在显示上下文时才读取
+        full_code_lines = None
         if entry.occurrences:
-            source_path_to_read = None
-            try:
-                relative_path = entry.occurrences[0][0]
-                normalized_rel_path = os.path.normpath(relative_path)
-
-                if project_root:
-                    candidate = os.path.join(project_root, normalized_rel_path)
-                    if cached_is_file(candidate):
-                        source_path_to_read = candidate
-                else:
-                    current_search_dir = Path(filepath).parent
-                    for _ in range(6):
-                        candidate = current_search_dir / normalized_rel_path
-                        candidate_str = str(candidate)
-                        if cached_is_file(candidate_str):
-                            source_path_to_read = candidate_str
-                            break
-                        if current_search_dir.parent == current_search_dir:
-                            break
-                        current_search_dir = current_search_dir.parent
-
-                if source_path_to_read:
-                    if source_path_to_read in file_content_cache:
-                        full_code_lines = file_content_cache[source_path_to_read]
-                    else:
-                        with open(source_path_to_read, encoding="utf-8", errors="replace") as f:
-                            lines = f.read().splitlines()
-                            file_content_cache[source_path_to_read] = lines
-                            full_code_lines = lines
-            except Exception as e:
-                logger.warning(f"Warning: Could not load context file for entry '{entry.msgid[:20]}...': {e}")
+            relative_path = entry.occurrences[0][0]
+            if relative_path in context_sources:
+                full_code_lines = context_sources[relative_path]
+            else:
+                try:
+                    full_code_lines = resolve_context_source(relative_path)
+                except Exception as e:
+                    logger.warning(f"Warning: Could not locate context file for entry '{entry.msgid[:20]}...': {e}")
+                context_sources[relative_path] = full_code_lines
 
         ts = po_entry_to_translatable_string(
             entry,
@@ -7,6 +7,7 @@ import shutil
 import uuid
 
 from lexisync.services.format_manager import FormatManager
+from lexisync.services.translation_store import entry_record, get_translation_store
 from lexisync.utils.localization import _
 
 from . import project_service
@@ -75,12 +76,10 @@ class ProjectManager:
                         str(destination_path), extraction_patterns=patterns, relative_path=relative_path
                     )
 
-                initial_data = [ts.to_dict() for ts in initial_objects]
+                initial_data = [entry_record(ts) for ts in initial_objects]
 
                 for lang in self.project_config["target_languages"]:
-                    translation_path = proj_path / project_service.TRANSLATION_DIR / f"{lang}.json"
-                    with open(translation_path, "w", encoding="utf-8") as f:
-                        json.dump(initial_data, f, indent=4, ensure_ascii=False)
+                    get_translation_store(proj_path / project_service.TRANSLATION_DIR, lang).replace_all(initial_data)
             except Exception as e:
                 self.project_config["source_files"].pop()
                 return False, _("Failed to create initial translation data: {error}").format(error=e)
@@ -0,0 +1,219 @@
+# Copyright (c) 2025-2026, TheSkyC
+# SPDX-License-Identifier: Apache-2.0
+
+from contextlib import ExitStack
+from itertools import chain
+import json
+import logging
+from pathlib import Path
+import threading
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from lexisync.services.project_service import PROJECT_CONFIG_FILE, TRANSLATION_DIR, project_config_for_save
+from lexisync.services.translation_store import entry_record, get_translation_store
+from lexisync.utils.file_utils import atomic_open
+from lexisync.utils.localization import _
+
+logger = logging.getLogger(__name__)
+
+
+class ProjectSaveJob:
+    """一次保存要写入的内容。在 UI 线程中准备，写入可以在后台线程进行"""
+
+    def __init__(self, store, dirty, records, *, removed_ids, new_objects, config_path, config_text):
+        self.store = store
+        self.dirty = dirty  # 本次写入的脏条目，写入失败时重新记为待保存
+        self.records = records  # 脏条目在 UI 线程中序列化的结果
+        self.removed_ids = removed_ids  # 已从项目中移除的条目，在同一事务中删除
+        self.new_objects = new_objects  # 新加入的条目，由存储按摘要比对后写入有变化的部分
+        self.config_path = config_path
+        self.config_text = config_text  # 配置未变化时为 None
+        self.written = 0
+        self.error = None
+        self.done = threading.Event()
+
+    def run(self):
+        try:
+            # 条目在一个事务中提交，之后再原子替换 project.json
+            self.written = self.store.save_records(
+                chain(self.records, map(entry_record, self.new_objects)), removed_ids=self.removed_ids
+            )
+            if self.config_text is not None:
+                with atomic_open(str(self.config_path), "w") as f:
+                    f.write(self.config_text)
+        except Exception as e:
+            logger.error(f"Project save failed: {e}", exc_info=True)
+            self.error = e
+        finally:
+            self.done.set()
+
+
+class ProjectSaveWorkerSignals(QObject):
+    finished = Signal(object)
+
+
+class ProjectSaveWorker(QRunnable):
+    def __init__(self, job):
+        super().__init__()
+        self.job = job
+        self.signals = ProjectSaveWorkerSignals()
+
+    def run(self):
+        self.job.run()
+        self.signals.finished.emit(self.job)
+
+
+class ProjectSaver(QObject):
+    """
+    项目的增量保存。条目的持久化字段被修改时把自身记入 dirty 表（见 TranslatableString.mark_dirty），
+    保存时只序列化这些条目；条目列表被替换或追加时，新条目交给存储按内容摘要比对一次。
+    project.json 的内容与上次写入的相同时不重写。
+    同一时间只有一个写入任务：自动保存在后台线程写入，同步保存先等待进行中的任务完成。
+    """
+
+    # (是否成功, 错误信息)，后台保存完成时发出（包括由 wait 处理的任务）
+    finished = Signal(bool, str)
+
+    def __init__(self, app_instance):
+        super().__init__()
+        self.app = app_instance
+        self._dirty = {}
+        self._removed = set()
+        self._tracked = None
+        self._tracked_store = None
+        self._tracked_count = 0
+        self._saved_config = None  # (路径, 内容, 修改时间)
+        self._job = None
+        self._ignore_changes = None
+
+    @property
+    def is_saving(self) -> bool:
+        return self._job is not None
+
+    def remove_entries(self, project_path, ts_ids):
+        """
+        条目已从项目中移除（重新扫描后消失的字符串、被移出项目的源文件）：
+        当前语言在下次保存时与其他修改在同一事务中删除，其他语言立即删除。
+        """
+        ts_ids = set(ts_ids)
+        if not ts_ids:
+            return
+        translation_dir = Path(project_path) / TRANSLATION_DIR
+        for lang in self.app.project_config.get("target_languages", []):
+            if lang != self.app.current_target_language:
+                get_translation_store(translation_dir, lang).delete_ids(ts_ids)
+        for ts_id in ts_ids:
+            self._dirty.pop(ts_id, None)
+        self._removed |= ts_ids
+
+    def _prepare(self, project_path) -> ProjectSaveJob:
+        app = self.app
+        proj_path = Path(project_path)
+        config_path = proj_path / PROJECT_CONFIG_FILE
+        if not config_path.is_file():
+            raise FileNotFoundError(_("Cannot save, project configuration file is missing."))
+        store = get_translation_store(proj_path / TRANSLATION_DIR, app.current_target_language)
+
+        config_text = json.dumps(project_config_for_save(app), indent=4, ensure_ascii=False)
+        # 文件在其他地方被改写过（修改时间不同）时即使内容未变也重新写入
+        if self._saved_config == (config_path, config_text, config_path.stat().st_mtime_ns):
+            config_text = None
+
+        objects = app.all_project_strings
+        if objects is self._tracked and store is self._tracked_store and len(objects) >= self._tracked_count:
+            # 同一列表中追加的条目（如按需加载的源文件）
+            new_objects = objects[self._tracked_count :]
+        else:
+            # 条目列表被替换或切换了语言：旧条目的修改不再属于当前存储
+            self._dirty = {}
+            new_objects = list(objects)
+        sink = self._dirty
+        for ts_obj in new_objects:
+            ts_obj._dirty_sink = sink
+        self._tracked, self._tracked_store, self._tracked_count = objects, store, len(objects)
+
+        dirty = list(sink.values())
+        sink.clear()
+        records = [entry_record(ts_obj) for ts_obj in dirty]
+        removed_ids, self._removed = self._removed, set()
+        app.validation_engine.save_result_cache()
+        return ProjectSaveJob(
+            store,
+            dirty,
+            records,
+            removed_ids=removed_ids,
+            new_objects=new_objects,
+            config_path=config_path,
+            config_text=config_text,
+        )
+
+    def _finish_job(self, job) -> bool:
+        """在 UI 线程中处理写入结果，每个任务只处理一次。:return: 是否由本次调用处理"""
+        if job is not self._job:
+            return False
+        self._job = None
+        if self._ignore_changes is not None:
+            self._ignore_changes.close()
+            self._ignore_changes = None
+
+        if job.error is None:
+            if job.config_text is not None:
+                try:
+                    mtime = job.config_path.stat().st_mtime_ns
+                except OSError:
+                    mtime = None
+                self._saved_config = (job.config_path, job.config_text, mtime)
+            logger.debug(
+                f"Project saved: {len(job.dirty)} modified, {len(job.new_objects)} compared, {job.written} written."
+            )
+            return True
+        # 写入失败：条目重新记为待保存，新加入的条目下次重新比对
+        for ts_obj in job.dirty:
+            if ts_obj._dirty_sink is self._dirty:
+                self._dirty.setdefault(ts_obj.id, ts_obj)
+        self._removed |= job.removed_ids
+        if job.new_objects:
+            self._tracked = None
+        self._saved_config = None
+        return True
+
+    def wait(self):
+        """等待进行中的后台写入完成，并立即发出其 finished（写入失败时调用方据此重新标记为已修改）"""
+        job = self._job
+        if job is not None:
+            job.done.wait()
+            if self._finish_job(job):
+                self.finished.emit(job.error is None, str(job.error or ""))
+
+    def save(self, project_path):
+        """在当前线程中保存，写入失败时抛出异常"""
+        self.wait()
+        job = self._prepare(project_path)
+        self._job = job
+        with self.app.file_monitor.ignore_changes():
+            job.run()
+        self._finish_job(job)
+        if job.error is not None:
+            raise job.error
+
+    def save_in_background(self, project_path) -> bool:
+        """
+        在后台线程中写入，完成后发出 finished。
+        :return: 是否开始了写入；已有任务在进行时返回 False
+        """
+        if self._job is not None:
+            return False
+        job = self._prepare(project_path)
+        self._job = job
+        self._ignore_changes = ExitStack()
+        self._ignore_changes.enter_context(self.app.file_monitor.ignore_changes())
+        worker = ProjectSaveWorker(job)
+        worker.signals.finished.connect(self._on_worker_finished)
+        QThreadPool.globalInstance().start(worker)
+        return True
+
+    def _on_worker_finished(self, job):
+        # 任务已由 wait 处理过时不再重复报告
+        if self._finish_job(job):
+            self.finished.emit(job.error is None, str(job.error or ""))
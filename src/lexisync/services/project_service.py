@@ -12,6 +12,7 @@ from rapidfuzz import fuzz
 
 from lexisync.services.code_file_service import extract_translatable_strings
 from lexisync.services.format_manager import FormatManager
+from lexisync.services.translation_store import entry_record, get_translation_store
 from lexisync.utils.constants import APP_VERSION, DEFAULT_EXTRACTION_PATTERNS
 from lexisync.utils.localization import _
 
@@ -110,11 +111,9 @@ def create_project(
         with open(proj_path / PROJECT_CONFIG_FILE, "w", encoding="utf-8") as f:
             json.dump(project_config, f, indent=4, ensure_ascii=False)
 
-        initial_data = [ts.to_dict() for ts in all_translatable_objects]
+        initial_data = [entry_record(ts) for ts in all_translatable_objects]
         for lang in target_langs:
-            translation_path = proj_path / TRANSLATION_DIR / f"{lang}.json"
-            with open(translation_path, "w", encoding="utf-8") as f:
-                json.dump(initial_data, f, indent=4, ensure_ascii=False)
+            get_translation_store(proj_path / TRANSLATION_DIR, lang).replace_all(initial_data)
 
         return str(proj_path)
 
@@ -135,13 +134,8 @@ def load_project_data(
     with open(config_path, encoding="utf-8") as f:
         project_config = json.load(f)
 
-    translation_file = proj_path / TRANSLATION_DIR / f"{target_language}.json"
-    translation_map = {}
-    if translation_file.is_file():
-        with open(translation_file, encoding="utf-8") as f:
-            translation_data = json.load(f)
-        translation_map = {item["id"]: item for item in translation_data}
-
+    # 旧版的 <lang>.json 在首次访问时自动转换；每个源文件只读取其中条目的翻译数据
+    store = get_translation_store(proj_path / TRANSLATION_DIR, target_language)
     loaded_strings = []
 
     files_to_process = []
@@ -193,13 +187,12 @@ def load_project_data(
         except Exception as e:
             logger.error(f"Failed to parse file {source_file_path_abs}: {e}", exc_info=True)
 
+        translation_map = store.load(ts_obj.id for ts_obj in extracted_strings) if extracted_strings else {}
         for ts_obj in extracted_strings:
             if ts_obj.id in translation_map:
                 ts_data = translation_map[ts_obj.id]
                 val = ts_data.get("translation", "").replace("\\n", "\n")
-                ts_obj.set_translation_internal(val)
-                ts_obj._translation_edit_history = [ts_obj.translation]
-                ts_obj._translation_history_pointer = 0
+                ts_obj.set_translation_internal(val, is_initial=True)
                 ts_obj.comment = ts_data.get("comment", "")
                 ts_obj.is_reviewed = ts_data.get("is_reviewed", False)
                 ts_obj.is_ignored = ts_data.get("is_ignored", False)
@@ -213,26 +206,8 @@ def load_project_data(
     return project_config, loaded_strings
 
 
-def save_project(project_path: str, app_instance):
-    proj_path = Path(project_path)
-    config_path = proj_path / PROJECT_CONFIG_FILE
-
-    if not config_path.is_file():
-        raise FileNotFoundError(_("Cannot save, project configuration file is missing."))
-
-    current_lang = app_instance.current_target_language
-    translation_file = proj_path / TRANSLATION_DIR / f"{current_lang}.json"
-
-    translation_data = [ts.to_dict() for ts in app_instance.all_project_strings]
-
-    temp_file = translation_file.with_suffix(".json.tmp")
-    with app_instance.file_monitor.ignore_changes():
-        temp_file = translation_file.with_suffix(".json.tmp")
-        with open(temp_file, "w", encoding="utf-8") as f:
-            json.dump(translation_data, f, indent=4, ensure_ascii=False)
-        shutil.move(temp_file, translation_file)
-    shutil.move(temp_file, translation_file)
-
+def project_config_for_save(app_instance) -> dict:
+    """写入 project.json 的配置：项目配置加上当前目标语言与界面状态"""
     project_config_to_save = app_instance.project_config
     project_config_to_save["current_target_language"] = app_instance.current_target_language
     project_config_to_save["ui_state"] = {
@@ -241,12 +216,14 @@ def save_project(project_path: str, app_instance):
         else "",
         "selected_ts_id": app_instance.current_selected_ts_id or "",
     }
+    return project_config_to_save
 
-    temp_config_file = config_path.with_suffix(".json.tmp")
-    with open(temp_config_file, "w", encoding="utf-8") as f:
-        json.dump(project_config_to_save, f, indent=4, ensure_ascii=False)
-    shutil.move(temp_config_file, config_path)
 
+def save_project(project_path: str, app_instance):
+    """
+    同步保存项目：只写入修改过的条目，配置未变化时不重写 project.json（见 ProjectSaver）。
+    """
+    app_instance.project_saver.save(project_path)
     return True
 
 
@@ -264,12 +241,7 @@ def build_project_target_files(project_path: str, app_instance, progress_callbac
     current_step = 0
 
     for lang_code in target_langs:
-        translation_file = proj_path / TRANSLATION_DIR / f"{lang_code}.json"
-        translation_map = {}
-        if translation_file.is_file():
-            with open(translation_file, encoding="utf-8") as f:
-                translation_data = json.load(f)
-            translation_map = {item["id"]: item for item in translation_data}
+        translation_map = get_translation_store(proj_path / TRANSLATION_DIR, lang_code).load()
 
         lang_target_dir = proj_path / TARGET_DIR / lang_code
         lang_target_dir.mkdir(parents=True, exist_ok=True)
@@ -411,14 +383,7 @@ def rebuild_project_structure(project_path: str, target_langs: list, new_pattern
     rebuild_results = {}  # {lang: [new_objects]}
 
     for lang in target_langs:
-        trans_file = proj_path / TRANSLATION_DIR / f"{lang}.json"
-        old_data_map = {}
-        if trans_file.is_file():
-            with open(trans_file, encoding="utf-8") as f:
-                old_data_list = json.load(f)
-                # 以原文语义为 Key 建立映射，方便找回翻译
-                for item in old_data_list:
-                    old_data_map[item["id"]] = item
+        old_data_map = get_translation_store(proj_path / TRANSLATION_DIR, lang).load()
 
         final_lang_strings = []
         current_new_strings = deepcopy(all_new_strings)
@@ -0,0 +1,280 @@
+# Copyright (c) 2025-2026, TheSkyC
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import re
+import threading
+
+import numpy as np
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+logger = logging.getLogger(__name__)
+
+# 构建时每块处理的条目数。每块的字符串操作各是一次 C 调用，分块使后台构建不会长时间占用 GIL
+BUILD_CHUNK_SIZE = 10000
+# 比这更短的词片太常见，不用于缩小候选范围
+MIN_RUN_CHARS = 2
+# 一个词片在词表中出现超过该次数时视为没有区分度
+MAX_RUN_HITS = 20000
+# 候选条目少于该数量时不再用其余词片求交集，直接交给调用方逐条确认
+SMALL_CANDIDATE_SET = 1000
+# 自上次构建以来修改过的条目超过该数量且超过总数的 REBUILD_DIRTY_RATIO 时在后台重建
+REBUILD_DIRTY_MIN = 5000
+REBUILD_DIRTY_RATIO = 0.02
+
+_DOC_SEPARATOR = "\x00"
+_NON_WORD = re.compile(r"[^\w\x00]+")
+_WORD_RUN = re.compile(r"\w+")
+# 中日文没有空格分词，连续的汉字/假名拆成重叠的二元组："导出文件" -> "导出 出文 文件 件"
+_CJK_CLASS = "[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]"
+_CJK_PAIR = re.compile(f"({_CJK_CLASS})(?=({_CJK_CLASS}))")
+
+
+def _sorted_unique(values):
+    if len(values) == 0:
+        return values
+    values = np.sort(values)
+    keep = np.empty(len(values), dtype=np.bool_)
+    keep[0] = True
+    np.not_equal(values[1:], values[:-1], out=keep[1:])
+    return values[keep]
+
+
+def _intersect_sorted(a, b):
+    """两个已排序、无重复的数组求交集"""
+    if len(a) == 0 or len(b) == 0:
+        return a[:0]
+    pos = np.minimum(np.searchsorted(b, a), len(b) - 1)
+    return a[b[pos] == a]
+
+
+def _normalize(text):
+    """折叠大小写并拆开中日文字符，索引的词与搜索词的词片按同一规则生成"""
+    return _CJK_PAIR.sub(r"\1\2 ", text.casefold())
+
+
+def search_runs(term):
+    """搜索词按索引的规则拆出的词片"""
+    return _WORD_RUN.findall(_normalize(term))
+
+
+class SearchIndexData:
+    """
+    一次构建得到的不可变索引：
+    词表（按词编号顺序以 \\x00 连接成一个字符串，查找包含某词片的词只需扫描词表）
+    与 CSR 形式的倒排表（词编号 -> 包含该词的条目下标，升序）。
+    """
+
+    __slots__ = ("doc_count", "offsets", "postings", "versions", "vocab_blob", "vocab_starts")
+
+    def __init__(self, vocab, postings, offsets, versions):
+        self.vocab_blob = _DOC_SEPARATOR.join(vocab)
+        lengths = np.fromiter((len(token) + 1 for token in vocab), np.int64, len(vocab))
+        self.vocab_starts = np.zeros(len(vocab), dtype=np.int64)
+        np.cumsum(lengths[:-1], out=self.vocab_starts[1:])
+        self.postings = postings
+        self.offsets = offsets
+        self.versions = versions
+        self.doc_count = len(versions)
+
+    def docs_with_run(self, run):
+        """:return: 有词包含 run 的条目下标（升序），词片没有区分度时返回 None"""
+        blob = self.vocab_blob
+        positions = []
+        pos = blob.find(run)
+        while pos != -1:
+            positions.append(pos)
+            if len(positions) > MAX_RUN_HITS:
+                return None
+            pos = blob.find(run, pos + 1)
+        if not positions:
+            return self.postings[:0]
+
+        token_ids = _sorted_unique(np.searchsorted(self.vocab_starts, positions, side="right") - 1)
+        starts = self.offsets[token_ids]
+        lengths = self.offsets[token_ids + 1] - starts
+        total = int(lengths.sum())
+        # 把各个词的倒排区间拼接成一个下标数组
+        shifts = np.repeat(starts - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths)
+        return _sorted_unique(self.postings[shifts + np.arange(total)])
+
+
+def build_search_index(ts_objects, is_cancelled=None):
+    """
+    为 ts_objects 的搜索文本建立索引，条目下标即其在列表中的位置。
+    is_cancelled 返回 True 时放弃构建并返回 None。
+    """
+    doc_count = len(ts_objects)
+    vocab = {_DOC_SEPARATOR: 0}
+    versions = np.empty(doc_count, dtype=np.int64)
+    token_chunks = []
+    doc_chunks = []
+
+    for start in range(0, doc_count, BUILD_CHUNK_SIZE):
+        if is_cancelled is not None and is_cancelled():
+            return None
+        chunk = ts_objects[start : start + BUILD_CHUNK_SIZE]
+        # 先记下版本再读取文本；读取期间被修改的条目在安装索引时会被识别为已修改
+        versions[start : start + len(chunk)] = [ts._text_version for ts in chunk]
+        joined = _DOC_SEPARATOR.join([ts.compose_search_text().replace(_DOC_SEPARATOR, " ") for ts in chunk])
+        tokens = _NON_WORD.sub(" ", _normalize(joined)).replace(_DOC_SEPARATOR, " \x00 ").split()
+
+        for token in dict.fromkeys(tokens).keys() - vocab.keys():
+            vocab[token] = len(vocab)
+        ids = np.fromiter(map(vocab.__getitem__, tokens), np.int64, len(tokens))
+        separators = ids == 0
+        docs = np.cumsum(separators) + start
+        token_chunks.append(ids[~separators])
+        doc_chunks.append(docs[~separators])
+
+    token_ids = np.concatenate(token_chunks) if token_chunks else np.empty(0, dtype=np.int64)
+    doc_ids = np.concatenate(doc_chunks) if doc_chunks else np.empty(0, dtype=np.int64)
+    del token_chunks, doc_chunks
+    # (词, 条目) 组合为一个整数后排序去重，得到按词分组、组内条目升序的倒排表
+    keys = _sorted_unique(token_ids * (doc_count + 1) + doc_ids)
+    del token_ids, doc_ids
+    postings = (keys % (doc_count + 1)).astype(np.int32)
+    counts = np.bincount(keys // (doc_count + 1), minlength=len(vocab))
+    offsets = np.zeros(len(vocab) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+
+    vocab_list = list(vocab)
+    vocab_list[0] = ""
+    return SearchIndexData(vocab_list, postings, offsets, versions)
+
+
+class SearchIndex:
+    """
+    当前条目列表的全文索引，用于快速过滤和查找替换缩小候选范围。
+    索引在首次查询时于后台构建，构建完成前查询返回 None，由调用方逐条扫描。
+    编辑过的条目记入 dirty 集合并始终作为候选，累计过多时在后台重建。
+    返回的候选是包含搜索词所有词片的条目（不区分大小写），调用方仍需逐条确认。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._objects = []
+        self._data = None
+        self._dirty = set()
+        self._check_versions = False
+        self._generation = 0
+        self._building = False
+        # 需要（重新）构建时以 SearchIndexWorker 为参数回调，由调用方放入线程池；未设置时同步构建
+        self.build_requested = None
+
+    def reset(self, ts_objects):
+        with self._lock:
+            self._objects = ts_objects
+            self._data = None
+            self._dirty = set()
+            self._check_versions = False
+            self._generation += 1
+            self._building = False
+
+    def is_ready(self) -> bool:
+        return self._data is not None
+
+    def mark_dirty(self, raw_indices):
+        if self._data is not None:
+            self._dirty.update(raw_indices)
+
+    def invalidate(self):
+        """条目可能被批量修改（修改位置未知）时调用，下次查询前按文本版本找出修改过的条目"""
+        self._check_versions = True
+
+    def candidates(self, term):
+        """
+        :return: 可能包含 term 的条目下标（升序 np.ndarray）；
+                 索引未就绪或搜索词没有可用的词片时返回 None
+        """
+        data = self._data
+        if data is None:
+            self._request_build()
+            return None
+        if self._check_versions:
+            self._sync_versions()
+            data = self._data
+            if data is None:
+                return None
+
+        runs = sorted({run for run in search_runs(term) if len(run) >= MIN_RUN_CHARS}, key=len, reverse=True)
+        result = None
+        for run in runs:
+            docs = data.docs_with_run(run)
+            if docs is None:
+                continue
+            result = docs if result is None else _intersect_sorted(result, docs)
+            if len(result) < SMALL_CANDIDATE_SET:
+                break
+        if result is None:
+            return None
+
+        if self._dirty:
+            result = _sorted_unique(np.concatenate((result, np.fromiter(self._dirty, np.int32, len(self._dirty)))))
+        if len(self._dirty) > max(REBUILD_DIRTY_MIN, data.doc_count * REBUILD_DIRTY_RATIO):
+            self._request_build()
+        return result
+
+    def _sync_versions(self):
+        self._check_versions = False
+        data = self._data
+        objects = self._objects
+        if len(objects) != data.doc_count:
+            self.reset(objects)
+            self._request_build()
+            return
+        current = np.fromiter((ts._text_version for ts in objects), np.int64, len(objects))
+        self._dirty.update(np.flatnonzero(current != data.versions).tolist())
+
+    def _request_build(self):
+        with self._lock:
+            if self._building:
+                return
+            self._building = True
+            generation = self._generation
+        if self.build_requested is None:
+            self.install(generation, build_search_index(self._objects))
+            return
+        self.build_requested(SearchIndexWorker(self, list(self._objects), generation))
+
+    def is_current_generation(self, generation) -> bool:
+        return generation == self._generation
+
+    def install(self, generation, data):
+        """在 UI 线程中安装构建结果；构建期间修改过的条目由版本比对找出"""
+        with self._lock:
+            if generation != self._generation:
+                return False
+            self._building = False
+            if data is None:
+                return False
+            self._data = data
+            self._dirty = set()
+        self._sync_versions()
+        logger.debug(f"Search index built: {data.doc_count} entries, {len(data.vocab_starts)} tokens.")
+        return True
+
+
+class SearchIndexSignals(QObject):
+    finished = Signal(int, object)
+
+
+class SearchIndexWorker(QRunnable):
+    """在后台构建搜索索引；条目列表重置后旧任务自动放弃"""
+
+    def __init__(self, search_index, ts_objects, generation):
+        super().__init__()
+        self.search_index = search_index
+        self.ts_objects = ts_objects
+        self.generation = generation
+        self.signals = SearchIndexSignals()
+
+    def run(self):
+        data = None
+        try:
+            data = build_search_index(
+                self.ts_objects, lambda: not self.search_index.is_current_generation(self.generation)
+            )
+        except Exception as e:
+            logger.error(f"Search index build failed: {e}", exc_info=True)
+        self.signals.finished.emit(self.generation, data)
@@ -1,14 +1,129 @@
 # Copyright (c) 2025-2026, TheSkyC
 # SPDX-License-Identifier: Apache-2.0
 
+from bisect import bisect_left, bisect_right
+import logging
+from operator import itemgetter
 import re
+import time
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+logger = logging.getLogger(__name__)
+
+# 后台查找每块确认的条目数，每块结束时送回命中并检查是否已取消
+SEARCH_CHUNK_SIZE = 2000
+# 查找进行中刷新标记栏的最小间隔（秒），标记栏每次刷新都要重排全部命中
+MARKER_UPDATE_INTERVAL = 0.2
+
+_proxy_row = itemgetter("proxy_row")
+
+
+def _compile_pattern(term, options):
+    flags = 0 if options.get("case") else re.IGNORECASE
+    return re.compile(re.escape(term), flags)
+
+
+def match_columns(ts_obj, pattern, options):
+    """ts_obj 中匹配 pattern 的列：2 原文、3 译文、4 注释"""
+    columns = []
+    if options.get("in_orig") and (
+        pattern.search(ts_obj.original_semantic) or (ts_obj.is_plural and pattern.search(ts_obj.original_plural))
+    ):
+        columns.append(2)
+
+    if options.get("in_trans"):
+        if ts_obj.is_plural:
+            if any(pattern.search(v) for v in tuple(ts_obj.plural_translations.values())):
+                columns.append(3)
+        elif pattern.search(ts_obj.get_translation_for_ui()):
+            columns.append(3)
+
+    if options.get("in_comment") and pattern.search(ts_obj.comment):
+        columns.append(4)
+    return columns
+
+
+def plan_replacements(ts_obj, pattern, replace_with, options):
+    """:return: [(field, plural_index, old_text, new_text), ...]，译文的每个复数形式与注释各自独立替换"""
+    plan = []
+    if options.get("in_trans"):
+        items = tuple(ts_obj.plural_translations.items()) if ts_obj.is_plural else ((0, ts_obj.translation),)
+        for plural_index, text in items:
+            new_text, count = pattern.subn(replace_with, text)
+            if count:
+                plan.append(("translation", plural_index, text, new_text))
+    if options.get("in_comment"):
+        text = ts_obj.comment
+        new_text, count = pattern.subn(replace_with, text)
+        if count:
+            plan.append(("comment", 0, text, new_text))
+    return plan
+
+
+class SearchWorkerSignals(QObject):
+    matches_found = Signal(int, list)  # generation, [(raw_index, [col, ...]), ...]
+    progress = Signal(int, int, int)  # generation, done, total
+    finished = Signal(int, bool, object)  # generation, completed, replace plan
+
+
+class SearchWorker(QRunnable):
+    """
+    在后台逐块确认候选条目。查找时每块的命中通过 matches_found 送回；
+    给出 replace_with 时改为计算替换计划 [(raw_index, field, plural_index, old_text, new_text), ...]，
+    完成后随 finished 一并送回，由主线程一次性应用。
+    """
+
+    def __init__(self, ts_objects, raw_indices, pattern, options, generation, *, replace_with=None):
+        super().__init__()
+        self.ts_objects = ts_objects
+        self.raw_indices = raw_indices
+        self.pattern = pattern
+        self.options = options
+        self.generation = generation
+        self.replace_with = replace_with
+        self.signals = SearchWorkerSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        ts_objects, pattern, options = self.ts_objects, self.pattern, self.options
+        total = len(self.raw_indices)
+        plan = [] if self.replace_with is not None else None
+        completed = False
+        try:
+            for start in range(0, total, SEARCH_CHUNK_SIZE):
+                if self._cancelled:
+                    break
+                chunk = self.raw_indices[start : start + SEARCH_CHUNK_SIZE]
+                if plan is None:
+                    matches = []
+                    for raw_index in chunk:
+                        columns = match_columns(ts_objects[raw_index], pattern, options)
+                        if columns:
+                            matches.append((raw_index, columns))
+                    if matches:
+                        self.signals.matches_found.emit(self.generation, matches)
+                else:
+                    for raw_index in chunk:
+                        for item in plan_replacements(ts_objects[raw_index], pattern, self.replace_with, options):
+                            plan.append((raw_index, *item))
+                self.signals.progress.emit(self.generation, start + len(chunk), total)
+            completed = not self._cancelled
+        except Exception as e:
+            logger.error(f"Search failed: {e}", exc_info=True)
+        self.signals.finished.emit(self.generation, completed, plan if completed else None)
 
 
 class SearchService(QObject):
     highlights_changed = Signal()
     navigate_to = Signal(int, int)  # proxy_row, col
+    search_progress = Signal(int, bool)  # match count, finished
+    navigated = Signal(int, int)  # current, total
+    replace_all_progress = Signal(int, int)  # scanned, total
+    replace_all_finished = Signal(int)  # modified items, -1 when cancelled
 
     def __init__(self, app_instance):
         super().__init__()
@@ -20,17 +135,39 @@ class SearchService(QObject):
         self.highlight_indices = set()
         self.current_focus_index = None
 
+        # Background search
+        self._worker = None
+        self._generation = 0
+        self._scan_objects = None
+        self._results_complete = False
+        self._pending_direction = 0
+        self._marker_rows = []
+        self._markers_updated_at = 0.0
+
         # Persistent State
         self.last_term = ""
         self.last_replace_term = ""
         self.last_options = {"case": False, "in_orig": True, "in_trans": True, "in_comment": True}
         self._load_state_from_config()
 
+    @property
+    def is_searching(self) -> bool:
+        return self._worker is not None and self._worker.replace_with is None
+
+    @property
+    def is_replacing(self) -> bool:
+        return self._worker is not None and self._worker.replace_with is not None
+
+    def cancel(self):
+        """停止正在进行的后台查找或全部替换，已送达的结果保留"""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        self._generation += 1
+        self._pending_direction = 0
+
     def clear(self):
-        self.search_results.clear()
-        self.highlight_indices.clear()
-        self.current_result_index = -1
-        self.current_focus_index = None
+        self._reset_results()
         self.highlights_changed.emit()
 
         if hasattr(self.app, "clear_search_markers"):
@@ -56,9 +193,18 @@ class SearchService(QObject):
             "options": self.last_options,
         }
 
+    def _reset_results(self):
+        self.cancel()
+        self.search_results.clear()
+        self.highlight_indices.clear()
+        self.current_focus_index = None
+        self.current_result_index = -1
+        self._results_complete = False
+        self._marker_rows = []
+
     def perform_search(self, term, options):
         """
-        Executes the search logic.
+        在当前线程中执行查找。
         options: dict with keys 'case', 'in_orig', 'in_trans', 'in_comment'
         Returns: int (count of matches)
         """
@@ -72,48 +218,30 @@ class SearchService(QObject):
         current_options_signature = options.copy()
         current_options_signature["term"] = term
 
-        if self.last_options == current_options_signature and self.search_results:
+        if self.last_options == current_options_signature and self.search_results and self._results_complete:
             return len(self.search_results)
 
-        # Reset
-        self.search_results.clear()
-        self.highlight_indices.clear()
-        self.current_focus_index = None
-        self.current_result_index = -1
-
-        flags = 0 if options.get("case") else re.IGNORECASE
+        self._reset_results()
         try:
-            pattern = re.compile(re.escape(term), flags)
+            pattern = _compile_pattern(term, options)
         except re.error:
             return 0
 
         model = self.app.sheet_model
+        # 全文索引给出可能命中的行，索引未就绪时扫描全部可见行
+        candidate_rows = model.search_candidate_rows(term)
+        if candidate_rows is None:
+            candidate_rows = range(model.rowCount())
 
-        for row in range(model.rowCount()):
+        for row in candidate_rows:
             ts_obj = model.get_ts_object_by_visual_row(row)
             if not ts_obj:
                 continue
-
-            # --- 检查原文列 (Column 2) ---
-            if options.get("in_orig") and (
-                pattern.search(ts_obj.original_semantic)
-                or (ts_obj.is_plural and pattern.search(ts_obj.original_plural))
-            ):
-                self._add_match(row, 2, ts_obj)
-
-            # --- 检查译文列 (Column 3) ---
-            if options.get("in_trans"):
-                if ts_obj.is_plural:
-                    if any(pattern.search(v) for v in ts_obj.plural_translations.values()):
-                        self._add_match(row, 3, ts_obj)
-                elif pattern.search(ts_obj.get_translation_for_ui()):
-                    self._add_match(row, 3, ts_obj)
-
-            # --- 检查注释列 (Column 4) ---
-            if options.get("in_comment") and pattern.search(ts_obj.comment):
-                self._add_match(row, 4, ts_obj)
+            for col in match_columns(ts_obj, pattern, options):
+                self._add_match(row, col, ts_obj)
 
         self.last_options = current_options_signature
+        self._results_complete = True
         self.highlights_changed.emit()
 
         # Update MarkerBar
@@ -129,6 +257,91 @@ class SearchService(QObject):
 
         return len(self.search_results)
 
+    def start_search(self, term, options):
+        """
+        在后台开始查找，命中按行序分批加入 search_results，并通过 search_progress 通知。
+        :return: True 表示开始了新的查找；False 表示沿用已有（或正在进行的）查找
+        """
+        if not term:
+            self.clear()
+            return False
+
+        self.last_term = term
+        self._save_state_to_config()
+
+        current_options_signature = options.copy()
+        current_options_signature["term"] = term
+
+        if self.last_options == current_options_signature and (
+            self.is_searching or (self._results_complete and self.search_results)
+        ):
+            return False
+
+        self._reset_results()
+        self.highlights_changed.emit()
+        if hasattr(self.app, "clear_search_markers"):
+            self.app.clear_search_markers()
+        try:
+            pattern = _compile_pattern(term, options)
+        except re.error:
+            self.search_progress.emit(0, True)
+            return False
+
+        self.last_options = current_options_signature
+        ts_objects, raw_indices = self.app.sheet_model.search_scan_targets(term)
+        worker = SearchWorker(ts_objects, raw_indices, pattern, dict(options), self._generation)
+        worker.signals.matches_found.connect(self._on_matches_found)
+        worker.signals.finished.connect(self._on_search_finished)
+        self._start_worker(worker, ts_objects)
+        return True
+
+    def _start_worker(self, worker, ts_objects):
+        self._worker = worker
+        self._scan_objects = ts_objects
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_matches_found(self, generation, matches):
+        if generation != self._generation:
+            return
+        model = self.app.sheet_model
+        if model._all_data is not self._scan_objects:
+            # 查找期间条目列表已被替换，下标不再有效
+            self.cancel()
+            self.search_progress.emit(len(self.search_results), True)
+            return
+
+        for raw_index, columns in matches:
+            row = model.get_visual_row_by_raw_index(raw_index)
+            if row < 0:
+                continue
+            ts_obj = self._scan_objects[raw_index]
+            for col in columns:
+                self._add_match(row, col, ts_obj)
+            self._marker_rows.append(raw_index)
+
+        self.highlights_changed.emit()
+        self._update_markers(force=False)
+        self.search_progress.emit(len(self.search_results), False)
+        self._resolve_pending_navigation()
+
+    def _on_search_finished(self, generation, completed, __):
+        if generation != self._generation:
+            return
+        self._worker = None
+        self._results_complete = completed
+        self._update_markers(force=True)
+        self.search_progress.emit(len(self.search_results), True)
+        self._resolve_pending_navigation()
+
+    def _update_markers(self, force):
+        if not hasattr(self.app, "update_search_markers"):
+            return
+        now = time.monotonic()
+        if not force and now - self._markers_updated_at < MARKER_UPDATE_INTERVAL:
+            return
+        self._markers_updated_at = now
+        self.app.update_search_markers(self._marker_rows)
+
     def _add_match(self, row, col, obj):
         self.search_results.append({"proxy_row": row, "col": col, "obj": obj})
         self.highlight_indices.add((row, col))
@@ -139,47 +352,45 @@ class SearchService(QObject):
     def find_prev(self):
         return self._navigate(-1)
 
+    def _target_index(self, direction):
+        """下一步要跳转到的结果下标，可能越界（需要回绕）"""
+        if self.current_result_index != -1:
+            return self.current_result_index + direction
+
+        # Start from current selection if possible
+        current_selection = self.app.table_view.selectionModel().currentIndex()
+        start_row = current_selection.row() if current_selection.isValid() else -1
+        if direction > 0:
+            # First result after start_row
+            return bisect_right(self.search_results, start_row, key=_proxy_row)
+        # Last result before start_row
+        return bisect_left(self.search_results, start_row, key=_proxy_row) - 1
+
     def _navigate(self, direction):
-        if not self.search_results:
+        total = len(self.search_results)
+        index = self._target_index(direction)
+        # 结果按行序陆续送达：查找未完成时，只有确定不会被后续结果改变的目标才能立即跳转
+        if self.is_searching and not (0 <= index < total and (direction > 0 or index + 1 < total)):
+            self._pending_direction = direction
+            return -1, -1
+        self._pending_direction = 0
+        if not total:
             return -1, -1
 
-        if self.current_result_index == -1:
-            # Start from current selection if possible
-            current_selection = self.app.table_view.selectionModel().currentIndex()
-            start_row = current_selection.row() if current_selection.isValid() else -1
-
-            if direction > 0:
-                # Find first result after start_row
-                for i, res in enumerate(self.search_results):
-                    if res["proxy_row"] >= start_row:
-                        if res["proxy_row"] > start_row:
-                            self.current_result_index = i - 1
-                        else:
-                            self.current_result_index = i
-                        break
-                else:
-                    self.current_result_index = -1  # Wrap around to 0 next step
-            else:
-                # Find last result before start_row
-                for i in range(len(self.search_results) - 1, -1, -1):
-                    if self.search_results[i]["proxy_row"] <= start_row:
-                        if self.search_results[i]["proxy_row"] < start_row:
-                            self.current_result_index = i + 1
-                        else:
-                            self.current_result_index = i
-                        break
-                else:
-                    self.current_result_index = len(self.search_results)  # Wrap around
-
-        # Advance index
-        self.current_result_index = (self.current_result_index + direction) % len(self.search_results)
+        self.current_result_index = index % total
 
         res = self.search_results[self.current_result_index]
         self.current_focus_index = (res["proxy_row"], res["col"])
+        position = (self.current_result_index + 1, total)
         self.highlights_changed.emit()
         self.navigate_to.emit(res["proxy_row"], res["col"])
+        self.navigated.emit(*position)
 
-        return self.current_result_index + 1, len(self.search_results)
+        return position
+
+    def _resolve_pending_navigation(self):
+        if self._pending_direction:
+            self._navigate(self._pending_direction)
 
     def set_replace_term(self, term):
         self.last_replace_term = term
@@ -193,8 +404,7 @@ class SearchService(QObject):
         ts_obj = res["obj"]
         col = res["col"]
         term = self.last_options.get("term", "")
-        flags = 0 if self.last_options.get("case") else re.IGNORECASE
-        pattern = re.compile(re.escape(term), flags)
+        pattern = _compile_pattern(term, self.last_options)
 
         p_idx = 0
         if hasattr(self.app, "details_panel") and self.app.current_selected_ts_id == ts_obj.id:
@@ -218,69 +428,103 @@ class SearchService(QObject):
             self.last_options = {}
         return success
 
-    def replace_all(self, replace_with):
-        if not self.search_results:
-            return 0
-
-        term = self.last_options.get("term", "")
-        flags = 0 if self.last_options.get("case") else re.IGNORECASE
-        pattern = re.compile(re.escape(term), flags)
-
-        trans_results = [res for res in self.search_results if res["col"] == 3]
-        comment_results = [res for res in self.search_results if res["col"] == 4]
+    def start_replace_all(self, term, options, replace_with):
+        """
+        在后台扫描全部匹配并计算替换结果，完成后在主线程中作为一次可撤销的批量修改应用，
+        并通过 replace_all_finished 通知修改的条目数。
+        :return: 是否开始了替换
+        """
+        if not term:
+            return False
+        self._reset_results()
+        try:
+            pattern = _compile_pattern(term, options)
+        except re.error:
+            return False
 
+        self.last_term = term
+        self._save_state_to_config()
+        ts_objects, raw_indices = self.app.sheet_model.search_scan_targets(term)
+        worker = SearchWorker(
+            ts_objects, raw_indices, pattern, dict(options), self._generation, replace_with=replace_with
+        )
+        worker.signals.progress.connect(self._on_replace_progress)
+        worker.signals.finished.connect(self._on_replace_plan_ready)
+        self._start_worker(worker, ts_objects)
+        return True
+
+    def _on_replace_progress(self, generation, done, total):
+        if generation == self._generation:
+            self.replace_all_progress.emit(done, total)
+
+    def _on_replace_plan_ready(self, generation, completed, plan):
+        if generation != self._generation:
+            return
+        worker = self._worker
+        self._worker = None
+        if not completed or self.app.sheet_model._all_data is not self._scan_objects:
+            self.replace_all_finished.emit(-1)
+            return
+        count = self.apply_replacements(self._scan_objects, plan, worker.pattern, worker.replace_with)
+        self.replace_all_finished.emit(count)
+
+    def apply_replacements(self, ts_objects, plan, pattern, replace_with):
+        """
+        把后台计算的替换计划作为一条撤销记录应用，最后只刷新受影响的行。
+        扫描之后又被修改过的文本按当前内容重新替换。
+        :return: 修改的条目数
+        """
         bulk_changes = []
+        web_changes = []
         modified_ids = set()
 
-        # Process Translations
-        for res in trans_results:
-            ts_obj = res["obj"]
-            if ts_obj.id in modified_ids:
-                continue
-
-            indices = ts_obj.plural_translations.keys() if ts_obj.is_plural else [0]
-            item_modified = False
-            for p_idx in indices:
+        for raw_index, field, p_idx, old_text, planned_text in plan:
+            ts_obj = ts_objects[raw_index]
+            if field == "translation":
                 current_text = ts_obj.plural_translations.get(p_idx, "") if ts_obj.is_plural else ts_obj.translation
-                new_text, count = pattern.subn(replace_with, current_text)
-
-                if count > 0:
-                    old_val = current_text.replace("\n", "\\n")
-                    ts_obj.set_translation_internal(new_text, plural_index=p_idx)
-                    bulk_changes.append(
-                        {
-                            "string_id": ts_obj.id,
-                            "field": "translation",
-                            "old_value": old_val,
-                            "new_value": ts_obj.get_translation_for_storage_and_tm(),
-                            "plural_index": p_idx,
-                        }
-                    )
-                    item_modified = True
-            if item_modified:
-                modified_ids.add(ts_obj.id)
-
-        # Process Comments
-        for res in comment_results:
-            ts_obj = res["obj"]
-            if ts_obj.id in modified_ids:
-                continue
-
-            current_text = ts_obj.comment
-            new_text = pattern.sub(replace_with, current_text)
-
-            if new_text != current_text:
-                old_val = ts_obj.comment
+            else:
+                current_text = ts_obj.comment
+            new_text = planned_text
+            if current_text != old_text:
+                new_text = pattern.sub(replace_with, current_text)
+                if new_text == current_text:
+                    continue
+
+            if field == "translation":
+                ts_obj.set_translation_internal(new_text, plural_index=p_idx)
+                bulk_changes.append(
+                    {
+                        "string_id": ts_obj.id,
+                        "field": "translation",
+                        "old_value": current_text.replace("\n", "\\n"),
+                        "new_value": new_text.replace("\n", "\\n"),
+                        "plural_index": p_idx,
+                    }
+                )
+                web_changes.append(
+                    {
+                        "ts_id": ts_obj.id,
+                        "new_text": new_text,
+                        "is_reviewed": ts_obj.is_reviewed,
+                        "is_fuzzy": ts_obj.is_fuzzy,
+                        "plural_index": p_idx,
+                    }
+                )
+            else:
                 ts_obj.comment = new_text
                 bulk_changes.append(
-                    {"string_id": ts_obj.id, "field": "comment", "old_value": old_val, "new_value": new_text}
+                    {"string_id": ts_obj.id, "field": "comment", "old_value": current_text, "new_value": new_text}
                 )
-                modified_ids.add(ts_obj.id)
+            modified_ids.add(ts_obj.id)
 
         if bulk_changes:
             self.app.add_to_undo_history("bulk_replace_all", {"changes": bulk_changes})
             self.app.mark_modified()
-            self.app.force_full_refresh(id_to_reselect=self.app.current_selected_ts_id)
+            self.app._revalidate_and_refresh_rows(modified_ids)
+
+            web_service = getattr(self.app, "web_service", None)
+            if web_changes and web_service and web_service.isRunning():
+                web_service.broadcast_bulk_data_change(web_changes, user="Host")
 
             self.clear()
 
@@ -0,0 +1,47 @@
+# Copyright (c) 2025-2026, TheSkyC
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import threading
+
+from PySide6.QtCore import QRunnable
+
+logger = logging.getLogger(__name__)
+
+# 每次批量查询的原文数；两次查询之间检查是否已取消
+PREFETCH_CHUNK_SIZE = 256
+
+
+class TMPrefetchWorker(QRunnable):
+    """在后台分块预取一批原文的模糊匹配，结果进入 TMService 的匹配缓存"""
+
+    def __init__(self, tm_service, sources, source_lang, target_lang, *, limit, threshold):
+        super().__init__()
+        self.tm_service = tm_service
+        self.sources = sources
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self.limit = limit
+        self.threshold = threshold
+        self._cancelled = False
+        self.done = threading.Event()
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        try:
+            for start in range(0, len(self.sources), PREFETCH_CHUNK_SIZE):
+                if self._cancelled:
+                    return
+                self.tm_service.get_fuzzy_matches_batch(
+                    self.sources[start : start + PREFETCH_CHUNK_SIZE],
+                    self.source_lang,
+                    self.target_lang,
+                    limit=self.limit,
+                    threshold=self.threshold,
+                )
+        except Exception as e:
+            logger.warning(f"TM batch prefetch failed: {e}")
+        finally:
+            self.done.set()
@@ -1,19 +1,24 @@
 # Copyright (c) 2025-2026, TheSkyC
 # SPDX-License-Identifier: Apache-2.0
 
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime
-from functools import lru_cache
 import hashlib
 import json
 import logging
 import os
 import re
 import sqlite3
+import sys
 import threading
+import xml.etree.ElementTree as ET
 
-from rapidfuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
 
+from lexisync.services.db_maintenance_service import optimize_database
 from lexisync.utils.localization import _
 
 logger = logging.getLogger(__name__)
@@ -21,20 +26,256 @@ logger = logging.getLogger(__name__)
 MANIFEST_FILE = "manifest.json"
 DB_FILE = "tm.db"
 
+# 热路径查询使用固定 SQL 文本，配合连接级语句缓存实现预编译复用
+_SQL_EXACT = "SELECT target_text FROM translation_units WHERE source_text = ? AND source_lang = ? AND target_lang = ?"
+_SQL_EXACT_BATCH = """
+    SELECT source_text, target_text
+    FROM translation_units
+    WHERE source_text IN (SELECT value FROM json_each(?))
+      AND source_lang = ?
+      AND target_lang = ?
+"""
+_SQL_FUZZY = """
+    SELECT u.source_text, u.target_text
+    FROM tm_search_index i
+    JOIN translation_units u ON i.rowid = u.id
+    WHERE i.source_text MATCH ?
+      AND u.source_lang = ?
+      AND u.target_lang = ?
+    ORDER BY bm25(tm_search_index)
+    LIMIT 100;
+"""
+_SQL_FUZZY_NGRAM = """
+    SELECT u.source_text, u.target_text
+    FROM tm_trigram_index i
+    JOIN translation_units u ON i.rowid = u.id
+    WHERE i.source_text MATCH ?
+      AND u.source_lang = ?
+      AND u.target_lang = ?
+    ORDER BY bm25(tm_trigram_index)
+    LIMIT 100;
+"""
+# 少于 3 个字符时 trigram 无法匹配：经 idx_tu_short_text 只在长度不超过上限的短条目中做子串匹配
+_SQL_FUZZY_SHORT = """
+    SELECT source_text, target_text
+    FROM translation_units
+    WHERE source_lang = ?
+      AND target_lang = ?
+      AND length(source_text) <= ?
+      AND source_text LIKE ? ESCAPE '\\'
+    ORDER BY length(source_text)
+    LIMIT 100;
+"""
+_SQL_UPSERT = """
+    INSERT OR REPLACE INTO translation_units
+    (source_lang, target_lang, source_text, target_text, source_manifest_key)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_STATEMENT_CACHE_SIZE = 64
+
+# FTS5 trigram 分词器需要 SQLite 3.34+
+TRIGRAM_SUPPORTED = sqlite3.sqlite_version_info >= (3, 34, 0)
+# 这些语言不以空格分词，unicode61 会把整段文字当作一个词，改用 trigram 索引召回
+NGRAM_INDEX_LANGS = ("zh", "ja", "ko", "th", "lo", "km", "my")
+_MAX_NGRAM_TERMS = 32
+
+# 流式导入每个事务提交的条目数
+IMPORT_CHUNK_SIZE = 5000
+_XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+_MATCH_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+class TMMatchCache:
+    """Thread-safe LRU cache for fuzzy TM results, bounded by an approximate memory budget."""
+
+    def __init__(self, max_bytes: int = _MATCH_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, tuple[list[dict], int]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _estimate_size(key: tuple, matches: list[dict]) -> int:
+        # 粗略估算：字符串对象大小 + 每条结果 dict 的固定开销
+        size = 256 + sys.getsizeof(key[0])
+        for m in matches:
+            size += 240 + sys.getsizeof(m["source_text"]) + sys.getsizeof(m["target_text"])
+        return size
+
+    def get(self, key: tuple) -> list[dict] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: tuple, matches: list[dict]):
+        size = self._estimate_size(key, matches)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old[1]
+            self._entries[key] = (matches, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                __, (__, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+class _Reader:
+    __slots__ = ("busy", "conn", "retired")
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.busy = True
+        self.retired = False
+
+
+class _ReaderRegistry:
+    """
+    所有线程的只读连接。连接只在空闲时关闭：断开数据库时空闲连接立即关闭，
+    查询进行中的连接标记为停用，由查询结束时关闭。
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._readers = set()
+
+    def add(self, conn) -> _Reader:
+        reader = _Reader(conn)
+        with self._lock:
+            self._readers.add(reader)
+        return reader
+
+    def acquire(self, reader) -> bool:
+        """标记连接开始查询；连接已停用时返回 False"""
+        with self._lock:
+            if reader.retired:
+                return False
+            reader.busy = True
+            return True
+
+    def release(self, reader):
+        with self._lock:
+            reader.busy = False
+            if reader.retired:
+                self._close(reader)
+
+    def retire(self, reader):
+        with self._lock:
+            reader.retired = True
+            self._readers.discard(reader)
+            if not reader.busy:
+                self._close(reader)
+
+    def retire_all(self):
+        with self._lock:
+            for reader in list(self._readers):
+                self.retire(reader)
+
+    @staticmethod
+    def _close(reader):
+        try:
+            reader.conn.close()
+        except Exception:
+            pass
+
+
+class _ThreadReaders(dict):
+    """一个线程的只读连接 (db_path -> _Reader)；线程结束、threading.local 释放它时停用这些连接"""
+
+    def __init__(self, registry):
+        super().__init__()
+        self.registry = registry
+
+    def __del__(self):
+        # 只靠垃圾回收释放的连接不会结束缓存中的预编译语句，文件句柄会一直保留，需要显式关闭
+        for reader in self.values():
+            self.registry.retire(reader)
+
 
 class TMService:
     def __init__(self):
         self.project_db_path = None
         self.global_db_path = None
+        # 仅用于串行化写入与连接管理；读取走 WAL 快照，不加锁
         self._lock = threading.RLock()
         self._conns = {}
+        # 只读连接按线程保存（threading.local 中的 db_path -> _Reader），并登记在 _readers 中，
+        # 断开数据库时全部关闭（查询进行中的连接在查询结束时关闭）
+        self._local = threading.local()
+        self._readers = _ReaderRegistry()
+        self._read_workers = max(2, min(8, os.cpu_count() or 1))
+        # 并行读取的线程池，首次使用时创建，断开数据库时关闭
+        self._read_executor = None
+        self._executor_lock = threading.Lock()
+
+        # 每次写入递增，作为匹配缓存键的一部分，保证不会返回过期结果
+        self._generation = 0
+        self.match_cache = TMMatchCache()
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def _bump_generation(self):
+        with self._lock:
+            self._generation += 1
+            self.match_cache.clear()
+
+    def get_fuzzy_matches(
+        self, source_text: str, source_lang: str, target_lang: str, limit: int = 5, threshold: float = 0.7
+    ) -> list[dict]:
+        key = (source_text, source_lang, target_lang, limit, threshold, self._generation)
+        cached = self.match_cache.get(key)
+        if cached is not None:
+            return cached
+        matches = self._do_actual_search(source_text, source_lang, target_lang, limit, threshold)
+        # 查询期间若发生写入，结果按旧 generation 入缓存，之后不会再被命中
+        self.match_cache.put(key, matches)
+        return matches
 
-        self.get_fuzzy_matches = lru_cache(maxsize=128)(self._do_actual_search)
+    def get_cache_stats(self) -> dict:
+        """匹配缓存的命中统计（整个会话累计），显示在翻译记忆查看器中"""
+        return {**self.match_cache.stats(), "generation": self._generation}
 
     def _get_conn(self, db_path):
-        """获取或创建持久化连接"""
+        """获取或创建写入用的持久化连接（调用方需持有 self._lock）"""
         if db_path not in self._conns:
-            conn = sqlite3.connect(db_path, timeout=10.0, check_same_thread=False)
+            conn = sqlite3.connect(
+                db_path,
+                timeout=30.0,
+                check_same_thread=False,
+                isolation_level=None,
+                cached_statements=_STATEMENT_CACHE_SIZE,
+            )
             conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("PRAGMA synchronous=NORMAL")
             conn.execute("PRAGMA cache_size=-2000")  # 2MB 缓存
@@ -42,6 +283,111 @@ class TMService:
             self._conns[db_path] = conn
         return self._conns[db_path]
 
+    def _thread_readers(self) -> _ThreadReaders:
+        readers = getattr(self._local, "readers", None)
+        if readers is None:
+            readers = self._local.readers = _ThreadReaders(self._readers)
+        return readers
+
+    def _get_reader(self, db_path: str) -> _Reader:
+        """获取当前线程专属的只读持久化连接，并标记为查询中"""
+        readers = self._thread_readers()
+        reader = readers.get(db_path)
+        if reader is not None and self._readers.acquire(reader):
+            return reader
+        # 首次读取，或连接已在断开数据库时关闭
+        conn = sqlite3.connect(
+            db_path,
+            timeout=10.0,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+        conn.execute("PRAGMA query_only=ON")
+        conn.execute("PRAGMA cache_size=-8000")  # 8MB 缓存
+        conn.row_factory = sqlite3.Row
+        reader = readers[db_path] = self._readers.add(conn)
+        return reader
+
+    @contextmanager
+    def _reader(self, db_path: str):
+        reader = self._get_reader(db_path)
+        try:
+            yield reader.conn
+        except sqlite3.Error:
+            # 连接可能已失效（文件被替换、损坏等），停用后由下次调用重建
+            self._thread_readers().pop(db_path, None)
+            self._readers.retire(reader)
+            raise
+        finally:
+            self._readers.release(reader)
+
+    @contextmanager
+    def _writer(self, db_path: str):
+        with self._lock:
+            conn = self._get_conn(db_path)
+            try:
+                yield conn
+            except Exception:
+                if conn.in_transaction:
+                    try:
+                        conn.execute("ROLLBACK")
+                    except Exception:
+                        pass
+                raise
+            finally:
+                self._bump_generation()
+
+    def _query_databases(self, db_paths: list[str], func, *args) -> list:
+        """
+        Run a read-only query against several databases concurrently without taking the write lock.
+        Results keep the order of db_paths; a database that fails yields None.
+        """
+
+        futures = [self._submit_read(self._run_read, db_path, func, *args) for db_path in db_paths[1:]]
+        results = [self._run_read(db_paths[0], func, *args)] if db_paths else []
+        results.extend(f.result() for f in futures)
+        return results
+
+    def _submit_read(self, fn, *args) -> Future:
+        """在读取线程池中执行 fn；线程池恰好在断开数据库时被关闭则在当前线程中执行"""
+        with self._executor_lock:
+            if self._read_executor is None:
+                self._read_executor = ThreadPoolExecutor(max_workers=self._read_workers, thread_name_prefix="TMReader")
+            executor = self._read_executor
+        try:
+            return executor.submit(fn, *args)
+        except RuntimeError:
+            future = Future()
+            future.set_result(fn(*args))
+            return future
+
+    def _run_read(self, db_path: str, func, *args):
+        try:
+            with self._reader(db_path) as conn:
+                return func(conn, *args)
+        except sqlite3.Error as e:
+            logger.warning(f"TM database error at {db_path}: {e}")
+            return None
+
+    def _close_pooled_connections(self):
+        """
+        关闭写入连接、读取线程池与所有线程的只读连接（调用方需持有 self._lock）。
+        先等待线程池中的查询完成；其他线程正在进行的查询结束时关闭其连接。
+        """
+        with self._executor_lock:
+            executor, self._read_executor = self._read_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        self._readers.retire_all()
+        conns = list(self._conns.values())
+        self._conns.clear()
+        for conn in conns:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
     def connect_databases(self, global_tm_path: str | None, project_tm_path: str | None = None):
         with self._lock:
             self.disconnect_databases()
@@ -60,8 +406,12 @@ class TMService:
 
     def disconnect_databases(self):
         with self._lock:
+            if self.project_db_path or self.global_db_path:
+                logger.debug(f"TM match cache stats: {self.get_cache_stats()}")
             self.project_db_path = None
             self.global_db_path = None
+            self._close_pooled_connections()
+            self._bump_generation()
 
     @contextmanager
     def _get_db_connection(self, db_path: str):
@@ -143,6 +493,61 @@ class TMService:
         except Exception as e:
             cursor.execute("ROLLBACK")
             logger.error(f"TM Schema creation failed: {e}")
+            return
+
+        if TRIGRAM_SUPPORTED:
+            self._create_ngram_schema(conn)
+
+    def _create_ngram_schema(self, conn: sqlite3.Connection):
+        """Character trigram side index used for CJK sources and short strings."""
+        try:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE TRANSACTION")
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tm_trigram_index'")
+            needs_rebuild = cursor.fetchone() is None
+
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS tm_trigram_index USING fts5(
+                    source_text,
+                    content='translation_units',
+                    content_rowid='id',
+                    tokenize='trigram'
+                );
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_tm_trigram_insert AFTER INSERT ON translation_units BEGIN
+                    INSERT INTO tm_trigram_index(rowid, source_text) VALUES (new.id, new.source_text);
+                END;
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_tm_trigram_update AFTER UPDATE ON translation_units BEGIN
+                    INSERT INTO tm_trigram_index(tm_trigram_index, rowid, source_text)
+                    VALUES('delete', old.id, old.source_text);
+                    INSERT INTO tm_trigram_index(rowid, source_text) VALUES (new.id, new.source_text);
+                END;
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_tm_trigram_delete AFTER DELETE ON translation_units BEGIN
+                    INSERT INTO tm_trigram_index(tm_trigram_index, rowid, source_text)
+                    VALUES('delete', old.id, old.source_text);
+                END;
+            """)
+
+            # 短文本查询按 (语言对, 长度) 定位，不扫描整张表
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_tu_short_text
+                ON translation_units(source_lang, target_lang, length(source_text));
+            """)
+
+            # 旧数据库升级：为已有条目建立索引
+            if needs_rebuild:
+                logger.info("Building TM trigram index for existing entries...")
+                cursor.execute("INSERT INTO tm_trigram_index(tm_trigram_index) VALUES('rebuild')")
+
+            cursor.execute("COMMIT")
+        except Exception as e:
+            cursor.execute("ROLLBACK")
+            logger.error(f"TM trigram index creation failed: {e}")
 
     def find_conflicts(
         self, db_path: str, source_texts: list[str], source_lang: str, target_lang: str
@@ -200,7 +605,7 @@ class TMService:
 
         with self._lock:
             try:
-                with self._get_db_connection(db_path) as conn:
+                with self._writer(db_path) as conn:
                     cursor = conn.cursor()
                     cursor.execute("BEGIN IMMEDIATE TRANSACTION")
                     cursor.execute(
@@ -224,23 +629,24 @@ class TMService:
     def get_translation(
         self, source_text: str, source_lang: str, target_lang: str, db_to_check: str = "all"
     ) -> str | None:
-        with self._lock:
-            if db_to_check in ("all", "project") and self.project_db_path:
-                try:
-                    with self._get_db_connection(self.project_db_path) as conn:
-                        result = self._query_translation_in_db(conn, source_text, source_lang, target_lang)
-                        if result is not None:
-                            return result
-                except Exception:
-                    pass
+        # 精确查找很快，顺序查询比并行调度更省；项目库优先
+        project_db_path, global_db_path = self.project_db_path, self.global_db_path
+        if db_to_check in ("all", "project") and project_db_path:
+            try:
+                with self._reader(project_db_path) as conn:
+                    result = self._query_translation_in_db(conn, source_text, source_lang, target_lang)
+                    if result is not None:
+                        return result
+            except Exception:
+                pass
 
-            if db_to_check in ("all", "global") and self.global_db_path:
-                try:
-                    with self._get_db_connection(self.global_db_path) as conn:
-                        return self._query_translation_in_db(conn, source_text, source_lang, target_lang)
-                except Exception:
-                    pass
-            return None
+        if db_to_check in ("all", "global") and global_db_path:
+            try:
+                with self._reader(global_db_path) as conn:
+                    return self._query_translation_in_db(conn, source_text, source_lang, target_lang)
+            except Exception:
+                pass
+        return None
 
     def get_entry_count_by_source(self, dir_path: str, source_key: str) -> int:
         if not dir_path or not os.path.exists(dir_path):
@@ -266,45 +672,23 @@ class TMService:
         if not words:
             return {}
 
-        with self._lock:
-            all_matches = {}
-
-            # Deduplicate words to query
-            unique_words = list(set(words))
+        # Deduplicate words to query
+        unique_words = list(set(words))
+        db_paths = [p for p in (self.global_db_path, self.project_db_path) if p]
 
-            # Query project DB first
-            if self.project_db_path:
-                try:
-                    with self._get_db_connection(self.project_db_path) as conn:
-                        matches = self._query_translations_batch_in_db(conn, unique_words, source_lang, target_lang)
-                        all_matches.update(matches)
-                except Exception as e:
-                    logger.warning(f"Project TM batch query failed: {e}")
-
-            # Query global DB for remaining words
-            if self.global_db_path:
-                remaining_words = [w for w in unique_words if w not in all_matches]
-                if remaining_words:
-                    try:
-                        with self._get_db_connection(self.global_db_path) as conn:
-                            matches = self._query_translations_batch_in_db(
-                                conn, remaining_words, source_lang, target_lang
-                            )
-                            all_matches.update(matches)
-                    except Exception as e:
-                        logger.warning(f"Global TM batch query failed: {e}")
-
-            return all_matches
+        # Query both DBs in parallel; project matches take precedence over global ones
+        all_matches = {}
+        for matches in self._query_databases(
+            db_paths, self._query_translations_batch_in_db, unique_words, source_lang, target_lang
+        ):
+            if matches:
+                all_matches.update(matches)
+        return all_matches
 
     def _query_translation_in_db(
         self, conn: sqlite3.Connection, source_text: str, source_lang: str, target_lang: str
     ) -> str | None:
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT target_text FROM translation_units WHERE source_text = ? AND source_lang = ? AND target_lang = ?",
-            (source_text, source_lang, target_lang),
-        )
-        row = cursor.fetchone()
+        row = conn.execute(_SQL_EXACT, (source_text, source_lang, target_lang)).fetchone()
         return row["target_text"] if row else None
 
     def _query_translations_batch_in_db(
@@ -314,30 +698,9 @@ class TMService:
         if not words:
             return {}
 
-        matches = {}
-        chunk_size = 900
-
-        for i in range(0, len(words), chunk_size):
-            chunk = words[i : i + chunk_size]
-            placeholders = ",".join("?" for _ in chunk)
-
-            query = f"""
-                SELECT source_text, target_text
-                FROM translation_units
-                WHERE source_text IN ({placeholders})
-                  AND source_lang = ?
-                  AND target_lang = ?
-            """
-
-            params = [*chunk, source_lang, target_lang]
-
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-
-            for row in cursor.fetchall():
-                matches[row["source_text"]] = row["target_text"]
-
-        return matches
+        # 以 JSON 数组传参，语句文本固定，可被连接的语句缓存复用
+        cursor = conn.execute(_SQL_EXACT_BATCH, (json.dumps(words, ensure_ascii=False), source_lang, target_lang))
+        return {row["source_text"]: row["target_text"] for row in cursor.fetchall()}
 
     def update_tm_entry(
         self,
@@ -353,99 +716,159 @@ class TMService:
 
         with self._lock:
             try:
-                with self._get_db_connection(db_path) as conn:
+                with self._writer(db_path) as conn:
                     cursor = conn.cursor()
                     cursor.execute("BEGIN IMMEDIATE TRANSACTION")
-                    cursor.execute(
-                        """
-                        INSERT OR REPLACE INTO translation_units
-                        (source_lang, target_lang, source_text, target_text, source_manifest_key)
-                        VALUES (?, ?, ?, ?, ?)
-                    """,
-                        (source_lang, target_lang, source_text, target_text, source_key),
-                    )
+                    cursor.execute(_SQL_UPSERT, (source_lang, target_lang, source_text, target_text, source_key))
                     cursor.execute("COMMIT")
             except Exception as e:
                 logger.error(f"Failed to update TM entry: {e}")
 
-        self.get_fuzzy_matches.cache_clear()
-
     def import_from_file(
-        self, source_filepath: str, tm_dir_path: str, source_lang: str, target_lang: str, progress_callback=None
+        self,
+        source_filepath: str,
+        tm_dir_path: str,
+        source_lang: str,
+        target_lang: str,
+        *,
+        progress_callback=None,
+        cancel_event: threading.Event | None = None,
     ) -> tuple[bool, str]:
-        with self._lock:
-            db_path = os.path.join(tm_dir_path, DB_FILE)
-            manifest_path = os.path.join(tm_dir_path, MANIFEST_FILE)
+        """
+        Stream a TMX/XLSX file into the TM, committing every IMPORT_CHUNK_SIZE units.
+        progress_callback(message, percent=None) receives phase messages and per-chunk progress.
+        If cancel_event is set the import stops after the current chunk; progress is recorded in the
+        manifest and a later import of the same file (same checksum) resumes from there.
+        """
+        db_path = os.path.join(tm_dir_path, DB_FILE)
+        manifest_path = os.path.join(tm_dir_path, MANIFEST_FILE)
 
-            try:
-                os.makedirs(tm_dir_path, exist_ok=True)
+        try:
+            os.makedirs(tm_dir_path, exist_ok=True)
+            if progress_callback:
+                progress_callback(_("Verifying TM file..."))
+            file_stats = self._get_file_stats(source_filepath)
+            filename = os.path.basename(source_filepath)
+
+            with self._lock:
                 manifest = self._read_manifest(manifest_path)
-                file_stats = self._get_file_stats(source_filepath)
-                filename = os.path.basename(source_filepath)
+            if filename in manifest.get("imported_sources", {}):
+                existing_stats = manifest["imported_sources"][filename]
+                if all(existing_stats.get(k) == file_stats.get(k) for k in ["filesize", "last_modified", "checksum"]):
+                    return True, _("This TM file has already been imported and has not changed.")
+
+            resume_from = 0
+            pending = manifest.get("pending_imports", {}).get(filename)
+            if (
+                pending
+                and pending.get("checksum") == file_stats["checksum"]
+                and pending.get("source_lang") == source_lang
+                and pending.get("target_lang") == target_lang
+            ):
+                resume_from = pending.get("units_done", 0)
+                if progress_callback:
+                    progress_callback(_("Resuming import after {count} entries...").format(count=resume_from))
 
-                if filename in manifest.get("imported_sources", {}):
-                    existing_stats = manifest["imported_sources"][filename]
-                    if all(
-                        existing_stats.get(k) == file_stats.get(k) for k in ["filesize", "last_modified", "checksum"]
-                    ):
-                        return True, _("This TM file has already been imported and has not changed.")
+            if progress_callback:
+                progress_callback(_("Connecting to database..."))
+            with self._writer(db_path) as conn:
+                self._create_schema(conn)
 
-                if progress_callback:
-                    progress_callback(_("Parsing TM file..."))
-                tus_to_import = self._parse_tm_file(source_filepath, source_lang, target_lang)
+            units_done = resume_from
+            chunk = []
+            for index, (src, tgt, fraction) in enumerate(self._iter_tm_file(source_filepath, source_lang, target_lang)):
+                if index < resume_from:
+                    continue
+                chunk.append((source_lang, target_lang, src, tgt, filename))
+                if len(chunk) < IMPORT_CHUNK_SIZE:
+                    continue
 
+                self._merge_tus_into_db(db_path, chunk)
+                units_done = index + 1
+                chunk = []
+                self._record_pending_import(
+                    manifest_path,
+                    filename,
+                    file_stats,
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                    units_done=units_done,
+                )
                 if progress_callback:
-                    progress_callback(_("Connecting to database..."))
-                with self._get_db_connection(db_path) as conn:
-                    self._create_schema(conn)
-                    self._merge_tus_into_db(conn, tus_to_import, filename, progress_callback)
+                    progress_callback(
+                        _("Imported {count} TM entries...").format(count=units_done), min(99, int(fraction * 100))
+                    )
+                if cancel_event is not None and cancel_event.is_set():
+                    return False, _(
+                        "Import cancelled after {count} entries. Importing the same file again will resume from there."
+                    ).format(count=units_done)
+
+            if chunk:
+                self._merge_tus_into_db(db_path, chunk)
+                units_done += len(chunk)
 
+            with self._lock:
+                manifest = self._read_manifest(manifest_path)
+                manifest.get("pending_imports", {}).pop(filename, None)
                 file_stats["import_date"] = datetime.now().isoformat() + "Z"
-                file_stats["tu_count"] = len(tus_to_import)
+                file_stats["tu_count"] = units_done
                 file_stats["source_lang"] = source_lang
                 file_stats["target_lang"] = target_lang
                 manifest.setdefault("imported_sources", {})[filename] = file_stats
                 self._write_manifest(manifest_path, manifest)
-                self.get_fuzzy_matches.cache_clear()
-                return True, _("Successfully imported {count} TM entries.").format(count=len(tus_to_import))
-            except Exception as e:
-                logger.error(f"Failed to import TM file '{source_filepath}': {e}", exc_info=True)
-                return False, str(e)
+            return True, _("Successfully imported {count} TM entries.").format(count=units_done)
+        except Exception as e:
+            logger.error(f"Failed to import TM file '{source_filepath}': {e}", exc_info=True)
+            return False, str(e)
+
+    def _record_pending_import(self, manifest_path, filename, file_stats, *, source_lang, target_lang, units_done):
+        with self._lock:
+            manifest = self._read_manifest(manifest_path)
+            manifest.setdefault("pending_imports", {})[filename] = {
+                "checksum": file_stats["checksum"],
+                "source_lang": source_lang,
+                "target_lang": target_lang,
+                "units_done": units_done,
+            }
+            self._write_manifest(manifest_path, manifest)
 
     def _query_fuzzy_in_db(self, conn, source_text, source_lang, target_lang, limit):
         tokens = [t for t in re.findall(r"\w+", source_text) if len(t) > 1]
+        if TRIGRAM_SUPPORTED and (source_lang.startswith(NGRAM_INDEX_LANGS) or len(tokens) < 2):
+            return self._query_ngram_candidates(conn, source_text, source_lang, target_lang)
         if not tokens:
             return []
         fts_query = " OR ".join(tokens[:10])
+        return conn.execute(_SQL_FUZZY, (fts_query, source_lang, target_lang)).fetchall()
 
-        query = """
-            SELECT u.source_text, u.target_text
-            FROM tm_search_index i
-            JOIN translation_units u ON i.rowid = u.id
-            WHERE i.source_text MATCH ?
-              AND u.source_lang = ?
-              AND u.target_lang = ?
-            ORDER BY bm25(tm_search_index)
-            LIMIT 100;
-        """
-        cursor = conn.cursor()
-        cursor.execute(query, (fts_query, source_lang, target_lang))
-        return cursor.fetchall()
+    def _query_ngram_candidates(self, conn, source_text, source_lang, target_lang):
+        text = " ".join(source_text.split())
+        if not text:
+            return []
+        if len(text) < 3:
+            pattern = "%" + text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            return conn.execute(_SQL_FUZZY_SHORT, (source_lang, target_lang, len(text) * 4, pattern)).fetchall()
+
+        grams = [g for g in dict.fromkeys(text[i : i + 3] for i in range(len(text) - 2)) if g.strip()]
+        if not grams:
+            return []
+        if len(grams) > _MAX_NGRAM_TERMS:
+            # 均匀抽样，覆盖整条文本而非只取开头
+            step = len(grams) / _MAX_NGRAM_TERMS
+            grams = [grams[int(i * step)] for i in range(_MAX_NGRAM_TERMS)]
+        fts_query = " OR ".join('"' + g.replace('"', '""') + '"' for g in grams)
+        return conn.execute(_SQL_FUZZY_NGRAM, (fts_query, source_lang, target_lang)).fetchall()
 
     def _do_actual_search(
         self, source_text: str, source_lang: str, target_lang: str, limit: int = 5, threshold: float = 0.7
     ) -> list[dict]:
         all_candidates = []
-        with self._lock:
-            for db_path in filter(None, [self.project_db_path, self.global_db_path]):
-                try:
-                    with self._get_db_connection(db_path) as conn:
-                        all_candidates.extend(
-                            self._query_fuzzy_in_db(conn, source_text, source_lang, target_lang, limit)
-                        )
-                except sqlite3.Error as e:
-                    logger.warning(f"Database error at {db_path}: {e}")
-                    continue
+        db_paths = [p for p in (self.project_db_path, self.global_db_path) if p]
+        for rows in self._query_databases(
+            db_paths, self._query_fuzzy_in_db, source_text, source_lang, target_lang, limit
+        ):
+            if rows:
+                all_candidates.extend(rows)
 
         if not all_candidates:
             return []
@@ -474,6 +897,10 @@ class TMService:
                     {"score": final_score, "source_text": cand_src, "target_text": cand["target_text"]}
                 )
 
+        return self._select_top_matches(scored_matches, limit)
+
+    @staticmethod
+    def _select_top_matches(scored_matches: list[dict], limit: int) -> list[dict]:
         # 排序并
         scored_matches.sort(key=lambda x: x["score"], reverse=True)
 
@@ -489,63 +916,185 @@ class TMService:
 
         return unique_results
 
-    def _parse_tm_file(self, filepath: str, source_lang: str, target_lang: str) -> list[dict]:
+    def _query_fuzzy_batch_in_db(self, conn, sources, source_lang, target_lang, limit) -> list[list]:
+        """One FTS pass per source on a single connection, reusing the prepared fuzzy statement."""
+        return [self._query_fuzzy_in_db(conn, src, source_lang, target_lang, limit) for src in sources]
+
+    def get_fuzzy_matches_batch(
+        self,
+        sources: list[str],
+        source_lang: str,
+        target_lang: str,
+        *,
+        limit: int = 5,
+        threshold: float = 0.7,
+        workers: int = -1,
+    ) -> dict[str, list[dict]]:
+        """
+        Fuzzy-match many source strings at once.
+        Candidates for all sources are gathered per database (both databases concurrently), then every
+        (source, candidate) pair is scored in one rapidfuzz cpdist call that runs on native threads.
+        Returns {source_text: ranked matches}, identical to calling get_fuzzy_matches for each source;
+        results also populate the match cache.
+        """
+        generation = self._generation
+        results = {}
+        pending = []
+        for src in dict.fromkeys(sources):
+            if not src:
+                continue
+            cached = self.match_cache.get((src, source_lang, target_lang, limit, threshold, generation))
+            if cached is not None:
+                results[src] = cached
+            else:
+                pending.append(src)
+
+        if not pending:
+            return results
+
+        # 1. 召回阶段：按数据库与分片在读取线程池上并行收集候选（SQLite 查询期间会释放 GIL）
+        candidates = [[] for __ in pending]
+        db_paths = [p for p in (self.project_db_path, self.global_db_path) if p]
+        chunk_size = max(64, -(-len(pending) // self._read_workers))
+        futures = [
+            (
+                start,
+                self._submit_read(
+                    self._run_read,
+                    db_path,
+                    self._query_fuzzy_batch_in_db,
+                    pending[start : start + chunk_size],
+                    source_lang,
+                    target_lang,
+                    limit,
+                ),
+            )
+            for db_path in db_paths
+            for start in range(0, len(pending), chunk_size)
+        ]
+        for start, future in futures:
+            rows_per_source = future.result()
+            if rows_per_source:
+                for offset, rows in enumerate(rows_per_source):
+                    candidates[start + offset].extend(rows)
+
+        pair_owner = []
+        pair_queries = []
+        pair_sources = []
+        pair_targets = []
+        for i, rows in enumerate(candidates):
+            for row in rows:
+                pair_owner.append(i)
+                pair_queries.append(pending[i])
+                pair_sources.append(row["source_text"])
+                pair_targets.append(row["target_text"])
+
+        # 2. 精排阶段：成对打分 + 向量化长度惩罚，公式与 _do_actual_search 保持一致
+        scored_per_source = [[] for __ in pending]
+        if pair_queries:
+            base_scores = process.cpdist(
+                pair_queries, pair_sources, scorer=fuzz.token_set_ratio, dtype=np.float64, workers=workers
+            )
+            query_lens = np.fromiter(map(len, pair_queries), dtype=np.float64, count=len(pair_queries))
+            cand_lens = np.fromiter(map(len, pair_sources), dtype=np.float64, count=len(pair_sources))
+            penalties = np.sqrt(np.minimum(query_lens, cand_lens) / np.maximum(np.maximum(query_lens, cand_lens), 1))
+            final_scores = (base_scores / 100.0) * penalties
+
+            for k in np.flatnonzero(final_scores >= threshold):
+                scored_per_source[pair_owner[k]].append(
+                    {"score": float(final_scores[k]), "source_text": pair_sources[k], "target_text": pair_targets[k]}
+                )
+
+        for src, scored in zip(pending, scored_per_source, strict=True):
+            matches = self._select_top_matches(scored, limit)
+            self.match_cache.put((src, source_lang, target_lang, limit, threshold, generation), matches)
+            results[src] = matches
+
+        return results
+
+    def _iter_tm_file(self, filepath: str, source_lang: str, target_lang: str):
+        """Yield (source_text, target_text, fraction_read) without loading the whole file."""
         __, ext = os.path.splitext(filepath)
         ext = ext.lower()
 
         if ext == ".xlsx":
-            return self._parse_xlsx(filepath, source_lang, target_lang)
+            return self._iter_xlsx(filepath)
+        if ext == ".tmx":
+            return self._iter_tmx(filepath, source_lang, target_lang)
         raise ValueError(_("Unsupported file extension: {ext}").format(ext=ext))
 
-    def _parse_xlsx(self, filepath: str, source_lang: str, target_lang: str) -> list[dict]:
+    def _iter_xlsx(self, filepath: str):
         from openpyxl import load_workbook
 
-        tus = []
         wb = load_workbook(filepath, read_only=True)
-        ws = wb.active
-        for row in ws.iter_rows(min_row=2, values_only=True):
-            if len(row) >= 2 and row[0] is not None and row[1] is not None:
-                source_text = str(row[0])
-                target_text = str(row[1])
-                tus.append(
-                    {
-                        "source_lang": source_lang,
-                        "target_lang": target_lang,
-                        "source_text": source_text,
-                        "target_text": target_text,
-                    }
-                )
-        return tus
-
-    def _merge_tus_into_db(self, conn: sqlite3.Connection, tus: list[dict], source_key: str, progress_callback=None):
-        cursor = conn.cursor()
-        data_to_insert = [
-            (tu["source_lang"], tu["target_lang"], tu["source_text"], tu["target_text"], source_key)
-            for tu in tus
-            if tu.get("source_text") and tu.get("target_text")
-        ]
-
-        if not data_to_insert:
-            return
-
         try:
-            cursor.execute("BEGIN IMMEDIATE TRANSACTION;")
-            if progress_callback:
-                progress_callback(_("Inserting {count} TM entries...").format(count=len(data_to_insert)))
-
-            cursor.executemany(
-                """
-                INSERT OR REPLACE INTO translation_units
-                (source_lang, target_lang, source_text, target_text, source_manifest_key)
-                VALUES (?, ?, ?, ?, ?)
-            """,
-                data_to_insert,
-            )
+            ws = wb.active
+            total_rows = ws.max_row or 0
+            for row_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):
+                if len(row) >= 2 and row[0] is not None and row[1] is not None:
+                    source_text = str(row[0])
+                    target_text = str(row[1])
+                    if source_text and target_text:
+                        yield source_text, target_text, (row_idx / total_rows if total_rows else 0.0)
+        finally:
+            wb.close()
+
+    @staticmethod
+    def _pick_tuv(variants: dict[str, str], lang: str) -> str | None:
+        wanted = lang.lower().replace("_", "-")
+        if wanted in variants:
+            return variants[wanted]
+        primary = wanted.split("-")[0]
+        for code, text in variants.items():
+            if code.split("-")[0] == primary:
+                return text
+        return None
+
+    def _iter_tmx(self, filepath: str, source_lang: str, target_lang: str):
+        total_size = os.path.getsize(filepath) or 1
+        with open(filepath, "rb") as f:
+            parent = None
+            for event, elem in ET.iterparse(f, events=("start", "end")):
+                tag = elem.tag.rsplit("}", 1)[-1]
+                if event == "start":
+                    if tag == "body":
+                        parent = elem
+                    continue
+                if tag != "tu":
+                    continue
 
-            cursor.execute("COMMIT")
-        except Exception as e:
-            cursor.execute("ROLLBACK")
-            raise OSError(f"Database operation failed: {e}") from e
+                variants = {}
+                for tuv in elem:
+                    if tuv.tag.rsplit("}", 1)[-1] != "tuv":
+                        continue
+                    lang = tuv.get(_XML_LANG) or tuv.get("lang")
+                    seg = next((c for c in tuv if c.tag.rsplit("}", 1)[-1] == "seg"), None)
+                    if lang and seg is not None:
+                        variants[lang.lower().replace("_", "-")] = "".join(seg.itertext())
+
+                source_text = self._pick_tuv(variants, source_lang)
+                target_text = self._pick_tuv(variants, target_lang)
+
+                # 处理完立即释放，保持内存占用与文件大小无关
+                elem.clear()
+                if parent is not None:
+                    parent.remove(elem)
+
+                if source_text and target_text:
+                    yield source_text, target_text, f.tell() / total_size
+
+    def _merge_tus_into_db(self, db_path: str, rows: list[tuple]) -> int:
+        """Insert one chunk of (source_lang, target_lang, source, target, key) rows in its own transaction."""
+        with self._writer(db_path) as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("BEGIN IMMEDIATE TRANSACTION;")
+                cursor.executemany(_SQL_UPSERT, rows)
+                cursor.execute("COMMIT")
+            except Exception as e:
+                cursor.execute("ROLLBACK")
+                raise OSError(f"Database operation failed: {e}") from e
+        return len(rows)
 
     def remove_source(self, source_key: str, tm_dir_path: str) -> tuple[bool, str]:
         with self._lock:
@@ -553,7 +1102,7 @@ class TMService:
             manifest_path = os.path.join(tm_dir_path, MANIFEST_FILE)
 
             try:
-                with self._get_db_connection(db_path) as conn:
+                with self._writer(db_path) as conn:
                     cursor = conn.cursor()
                     cursor.execute("BEGIN IMMEDIATE TRANSACTION;")
                     cursor.execute("DELETE FROM translation_units WHERE source_manifest_key = ?", (source_key,))
@@ -656,7 +1205,7 @@ class TMService:
     def update_entry_target(self, db_path: str, entry_id: int, new_target: str) -> bool:
         with self._lock:
             try:
-                with self._get_db_connection(db_path) as conn:
+                with self._writer(db_path) as conn:
                     cursor = conn.cursor()
                     cursor.execute("BEGIN IMMEDIATE TRANSACTION")
                     cursor.execute("UPDATE translation_units SET target_text = ? WHERE id = ?", (new_target, entry_id))
@@ -669,7 +1218,7 @@ class TMService:
     def update_entry_source(self, db_path: str, entry_id: int, new_source: str) -> bool:
         with self._lock:
             try:
-                with self._get_db_connection(db_path) as conn:
+                with self._writer(db_path) as conn:
                     cursor = conn.cursor()
                     cursor.execute("BEGIN IMMEDIATE TRANSACTION")
                     cursor.execute("UPDATE translation_units SET source_text = ? WHERE id = ?", (new_source, entry_id))
@@ -685,7 +1234,7 @@ class TMService:
     def delete_entry_by_id(self, db_path: str, entry_id: int) -> bool:
         with self._lock:
             try:
-                with self._get_db_connection(db_path) as conn:
+                with self._writer(db_path) as conn:
                     cursor = conn.cursor()
                     cursor.execute("BEGIN IMMEDIATE TRANSACTION")
                     cursor.execute("DELETE FROM translation_units WHERE id = ?", (entry_id,))
@@ -746,17 +1295,10 @@ class TMService:
 
         with self._lock:
             try:
-                with self._get_db_connection(db_path) as conn:
+                with self._writer(db_path) as conn:
                     cursor = conn.cursor()
                     cursor.execute("BEGIN IMMEDIATE TRANSACTION")
-
-                    sql = """
-                        INSERT OR REPLACE INTO translation_units
-                        (source_lang, target_lang, source_text, target_text, source_manifest_key)
-                        VALUES (?, ?, ?, ?, ?)
-                    """
-
-                    cursor.executemany(sql, data_to_insert)
+                    cursor.executemany(_SQL_UPSERT, data_to_insert)
 
                     cursor.execute(
                         "SELECT COUNT(*) FROM translation_units WHERE source_manifest_key = ?", (source_key,)
@@ -787,6 +1329,31 @@ class TMService:
                 logger.error(f"Batch TM update failed: {e}", exc_info=True)
                 return False, str(e)
 
+    def run_maintenance(self, db_paths: list[str] | None = None) -> list[dict]:
+        """Optimize the connected (or given) TM databases and report size and fuzzy-query latency."""
+        if db_paths is None:
+            db_paths = [self.project_db_path, self.global_db_path]
+
+        reports = []
+        for db_path in dict.fromkeys(p for p in db_paths if p and os.path.exists(p)):
+            try:
+                with self._writer(db_path) as conn:
+                    samples = conn.execute(
+                        "SELECT source_text, source_lang, target_lang FROM translation_units ORDER BY random() LIMIT 20"
+                    ).fetchall()
+
+                    def probe(c, samples=samples):
+                        for row in samples:
+                            self._query_fuzzy_in_db(c, row[0], row[1], row[2], 5)
+
+                    reports.append(
+                        optimize_database(conn, db_path, ("tm_search_index", "tm_trigram_index"), probe=probe)
+                    )
+            except Exception as e:
+                logger.error(f"TM maintenance failed for {db_path}: {e}", exc_info=True)
+                reports.append({"db_path": db_path, "error": str(e)})
+        return reports
+
     def _read_manifest(self, manifest_path: str) -> dict:
         try:
             with open(manifest_path, encoding="utf-8") as f:
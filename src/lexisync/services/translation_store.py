@@ -0,0 +1,283 @@
+# Copyright (c) 2025-2026, TheSkyC
+# SPDX-License-Identifier: Apache-2.0
+
+from contextlib import contextmanager
+import json
+import logging
+import os
+from pathlib import Path
+import secrets
+import sqlite3
+import threading
+
+import xxhash
+
+logger = logging.getLogger(__name__)
+
+STORE_SUFFIX = ".db"
+LEGACY_SUFFIX = ".json"
+STORE_FORMAT_VERSION = 1
+# 按 ID 批量查询时每条语句的参数个数上限（SQLite 默认限制为 999）
+_ID_BATCH_SIZE = 900
+# 校验结果在加载后重新计算，不写入存储；否则每次校验都会让大量条目变成“已修改”
+_TRANSIENT_FIELDS = ("warnings", "minor_warnings", "infos")
+
+_SQL_UPSERT = (
+    "INSERT INTO entries (id, digest, data) VALUES (?, ?, ?) "
+    "ON CONFLICT(id) DO UPDATE SET digest = excluded.digest, data = excluded.data"
+)
+
+
+def entry_record(ts_obj) -> dict:
+    """条目写入存储的字段，与旧版 translation/<lang>.json 中的条目格式一致"""
+    record = ts_obj.to_dict()
+    for key in _TRANSIENT_FIELDS:
+        del record[key]
+    return record
+
+
+def _entry_row(record) -> tuple[str, int, str]:
+    """:return: (id, digest, data)"""
+    data = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+    # 右移一位使摘要落在 SQLite 有符号 64 位整数的范围内
+    return record["id"], xxhash.xxh3_64_intdigest(data.encode("utf-8")) >> 1, data
+
+
+def store_path(translation_dir, lang) -> Path:
+    return Path(translation_dir) / f"{lang}{STORE_SUFFIX}"
+
+
+def legacy_store_path(translation_dir, lang) -> Path:
+    return Path(translation_dir) / f"{lang}{LEGACY_SUFFIX}"
+
+
+class TranslationStore:
+    """
+    一个目标语言的翻译数据：translation/<lang>.db（SQLite），每个条目一行，以 JSON 保存。
+    保存时按内容摘要只写入有变化的条目，加载时可以只读取指定 ID 的条目。
+    首次访问时自动把旧版的 translation/<lang>.json 转换过来，原文件保留为 <lang>.json.bak。
+    """
+
+    def __init__(self, translation_dir, lang):
+        self.path = store_path(translation_dir, lang)
+        self.legacy_path = legacy_store_path(translation_dir, lang)
+        self._lock = threading.Lock()
+        # 已写入条目的摘要 (id -> digest)，首次保存时从数据库读取；
+        # 文件的 (store_id, generation) 与读取时不同说明被其他途径改写过，需要重新读取
+        self._digests = None
+        self._generation = None
+
+    def exists(self) -> bool:
+        return self.path.is_file() or self.legacy_path.is_file()
+
+    def convert_legacy(self) -> bool:
+        """旧版 JSON 尚未转换时立即转换。:return: 数据库文件是否存在"""
+        with self._lock:
+            return self._ensure_store()
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _create_schema(conn):
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries (id TEXT PRIMARY KEY, digest INTEGER NOT NULL, data TEXT NOT NULL)"
+        )
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('format_version', ?)", (STORE_FORMAT_VERSION,))
+        # store_id 区分同一路径上先后出现的不同文件，generation 每次写入加一
+        conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('store_id', ?)", (secrets.randbits(62),))
+        conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('generation', 0)")
+
+    def _ensure_store(self, create=False) -> bool:
+        """:return: 数据库是否存在（必要时先从旧版 JSON 转换或新建）"""
+        if self.path.is_file():
+            return True
+        if self.legacy_path.is_file():
+            self._migrate_legacy()
+            return True
+        if not create:
+            return False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            self._create_schema(conn)
+        return True
+
+    def _migrate_legacy(self):
+        with open(self.legacy_path, encoding="utf-8") as f:
+            records = json.load(f)
+        for record in records:
+            for key in _TRANSIENT_FIELDS:
+                record.pop(key, None)
+        # 写入临时文件后整体替换，转换中断时旧文件不受影响
+        self._write_new_store(records)
+        self.legacy_path.replace(self.legacy_path.with_name(self.legacy_path.name + ".bak"))
+        logger.info(f"Converted {self.legacy_path.name} to {self.path.name} ({len(records)} entries).")
+
+    def _write_new_store(self, records):
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        if temp_path.exists():
+            temp_path.unlink()
+        conn = sqlite3.connect(str(temp_path), isolation_level=None)
+        try:
+            self._create_schema(conn)
+            conn.execute("BEGIN IMMEDIATE TRANSACTION")
+            conn.executemany(_SQL_UPSERT, map(_entry_row, records))
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+        os.replace(temp_path, self.path)
+        self._digests = None
+
+    def load(self, ids=None) -> dict:
+        """
+        :param ids: 只读取这些 ID 的条目；为 None 时读取全部
+        :return: {id: 条目字典}
+        """
+        if not self.convert_legacy():
+            return {}
+        with self._connect() as conn:
+            if ids is None:
+                rows = conn.execute("SELECT data FROM entries").fetchall()
+            else:
+                ids = list(dict.fromkeys(ids))
+                rows = []
+                for start in range(0, len(ids), _ID_BATCH_SIZE):
+                    batch = ids[start : start + _ID_BATCH_SIZE]
+                    placeholders = ",".join("?" * len(batch))
+                    rows.extend(conn.execute(f"SELECT data FROM entries WHERE id IN ({placeholders})", batch))
+        records = (json.loads(data) for (data,) in rows)
+        return {record["id"]: record for record in records}
+
+    def iter_records(self):
+        """逐条读取全部条目，不一次性载入内存"""
+        if not self.convert_legacy():
+            return
+        with self._connect() as conn:
+            for (data,) in conn.execute("SELECT data FROM entries"):
+                yield json.loads(data)
+
+    def replace_all(self, records):
+        """用 records（条目字典）整体替换存储内容"""
+        with self._lock:
+            if self.path.is_file():
+                with self._connect() as conn:
+                    self._write(conn, map(_entry_row, records), replace=True)
+            else:
+                self._write_new_store(records)
+                if self.legacy_path.is_file():
+                    self.legacy_path.replace(self.legacy_path.with_name(self.legacy_path.name + ".bak"))
+
+    def save(self, ts_objects) -> int:
+        """
+        把 ts_objects 写入存储：只写入内容有变化的条目，整体在一个事务中提交。
+        不在 ts_objects 中的条目保持不变（按需加载时未打开的源文件的条目不在内存中），
+        已删除的条目由调用方通过 save_records 的 removed_ids 或 delete_ids 移除。
+        :return: 写入的条目数
+        """
+        return self.save_records(map(entry_record, ts_objects))
+
+    def save_records(self, records, removed_ids=()) -> int:
+        """
+        同 save，records 为 entry_record 得到的条目字典；removed_ids 中的条目在同一事务中删除，
+        且不会被 records 重新写入。
+        :return: 写入与删除的条目数
+        """
+        removed_ids = set(removed_ids)
+        with self._lock:
+            self._ensure_store(create=True)
+            with self._connect() as conn:
+                digests = self._stored_digests(conn)
+                rows = [
+                    row
+                    for row in map(_entry_row, records)
+                    if row[0] not in removed_ids and digests.get(row[0]) != row[1]
+                ]
+                removed_ids &= digests.keys()
+                if rows or removed_ids:
+                    self._write(conn, rows, removed_ids=removed_ids)
+        logger.debug(f"Translation store {self.path.name}: {len(rows)} entries written, {len(removed_ids)} removed.")
+        return len(rows) + len(removed_ids)
+
+    def delete_ids(self, ids) -> int:
+        """删除指定 ID 的条目（源文件重新扫描后消失的字符串、被移出项目的源文件）"""
+        return self.save_records((), removed_ids=ids)
+
+    def ids_for_sources(self, source_paths) -> set:
+        """来源文件（项目内相对路径）属于 source_paths 的条目 ID"""
+        source_paths = {path.replace("\\", "/") for path in source_paths}
+        return {
+            record["id"]
+            for record in self.iter_records()
+            if record.get("source_file_path", "").replace("\\", "/") in source_paths
+        }
+
+    def delete(self):
+        with self._lock:
+            for path in (self.path, self.legacy_path):
+                if path.is_file():
+                    path.unlink()
+            self._digests = None
+
+    @staticmethod
+    def _read_generation(conn):
+        meta = dict(conn.execute("SELECT key, value FROM meta WHERE key IN ('store_id', 'generation')"))
+        return meta.get("store_id"), meta["generation"]
+
+    def _stored_digests(self, conn) -> dict:
+        generation = self._read_generation(conn)
+        if self._digests is None or generation != self._generation:
+            self._digests = dict(conn.execute("SELECT id, digest FROM entries"))
+            self._generation = generation
+        return self._digests
+
+    def _write(self, conn, rows, replace=False, removed_ids=()):
+        """
+        写入 rows (id, digest, data)，并删除 removed_ids 中的条目；replace 为 True 时先清空全部条目（整体替换）。
+        调用方持有 self._lock。
+        """
+        cursor = conn.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE TRANSACTION")
+            if replace:
+                cursor.execute("DELETE FROM entries")
+            elif removed_ids:
+                cursor.executemany("DELETE FROM entries WHERE id = ?", ((ts_id,) for ts_id in removed_ids))
+            rows = list(rows)
+            cursor.executemany(_SQL_UPSERT, rows)
+            cursor.execute("UPDATE meta SET value = value + 1 WHERE key = 'generation'")
+            generation = self._read_generation(conn)
+            cursor.execute("COMMIT")
+        except Exception as e:
+            # BEGIN 本身失败（如数据库被锁定）时没有可回滚的事务
+            if conn.in_transaction:
+                cursor.execute("ROLLBACK")
+            raise OSError(f"Translation store write failed: {e}") from e
+
+        if replace:
+            self._digests = {ts_id: digest for ts_id, digest, __ in rows}
+        elif self._digests is not None:
+            for ts_id in removed_ids:
+                self._digests.pop(ts_id, None)
+            for ts_id, digest, __ in rows:
+                self._digests[ts_id] = digest
+        self._generation = generation
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_translation_store(translation_dir, lang) -> TranslationStore:
+    """同一文件共用一个 TranslationStore，使已写入条目的摘要在多次保存之间保留"""
+    key = os.path.normcase(os.path.abspath(store_path(translation_dir, lang)))
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = TranslationStore(translation_dir, lang)
+        return store
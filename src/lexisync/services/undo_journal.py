@@ -0,0 +1,296 @@
+# Copyright (c) 2025-2026, TheSkyC
+# SPDX-License-Identifier: Apache-2.0
+
+from collections import deque
+from copy import deepcopy
+import sys
+
+from lexisync.utils.constants import MAX_UNDO_HISTORY, UNDO_HISTORY_MEMORY_BUDGET
+
+# 不超过该长度的值直接驻留（sys.intern），相同的短文本在所有记录间共享
+INTERN_MAX_CHARS = 64
+# 新旧值都不短于该长度时，只完整保存一侧，另一侧保存为相对它的差异
+DELTA_MIN_CHARS = 256
+# 每条变更除字符串外的估算开销（字典、键、整数等）
+_CHANGE_OVERHEAD = 240
+_RECORD_OVERHEAD = 480
+
+_SCALAR_TYPES = (int, float, bool, type(None))
+
+
+def _common_prefix_len(a, b):
+    """二分查找公共前缀长度，每步是一次 C 层面的切片比较"""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix_len(a, b, limit):
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid :] == b[len(b) - mid :]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def make_delta(base, text):
+    """
+    :return: (前缀长度, 后缀长度, 中间部分)，配合 base 可还原 text。
+    编辑通常集中在一处，首尾相同的部分不再重复保存。
+    """
+    prefix = _common_prefix_len(base, text)
+    limit = min(len(base), len(text)) - prefix
+    suffix = _common_suffix_len(base, text, limit)
+    return prefix, suffix, text[prefix : len(text) - suffix]
+
+
+def apply_delta(base, delta):
+    prefix, suffix, middle = delta
+    return base[:prefix] + middle + base[len(base) - suffix :]
+
+
+def _compact_value(value):
+    if isinstance(value, str):
+        return sys.intern(value) if len(value) <= INTERN_MAX_CHARS else value
+    if isinstance(value, _SCALAR_TYPES):
+        return value
+    return deepcopy(value)
+
+
+def _other_side(key):
+    return "old_value" if key == "new_value" else "new_value"
+
+
+class _CompactChange(dict):
+    """
+    压缩后的变更。prev/next 链接同一栈中同一字段的上一条/下一条变更，
+    keep 一侧与 next 的另一侧相同时省略不存，需要时沿 next 还原。
+    """
+
+    __slots__ = ("next", "prev", "record")
+
+    def __init__(self, items):
+        super().__init__(items)
+        self.next = None
+        self.prev = None
+        self.record = None
+
+
+class _Record(dict):
+    __slots__ = ("size",)
+
+
+def _compact_change(change, keep_key):
+    """
+    复制一条变更并压缩其文本：短文本驻留，长文本只完整保存 keep_key 一侧，
+    另一侧存为 "<old|new>_delta"。keep_key 应是当前仍被条目引用的那一侧，这样完整文本不额外占用内存。
+    """
+    compact = _CompactChange((key, _compact_value(value)) for key, value in change.items())
+    other_key = _other_side(keep_key)
+    kept, other = compact.get(keep_key), compact.get(other_key)
+    if (
+        isinstance(kept, str)
+        and isinstance(other, str)
+        and len(kept) >= DELTA_MIN_CHARS
+        and len(other) >= DELTA_MIN_CHARS
+    ):
+        delta = make_delta(kept, other)
+        if len(delta[2]) < len(other):
+            del compact[other_key]
+            compact[other_key[:3] + "_delta"] = delta
+    return compact
+
+
+def _full_value(change, key):
+    """变更中 key（old_value/new_value）一侧的完整值"""
+    if key in change:
+        return change[key]
+    delta = change.get(key[:3] + "_delta")
+    if delta is not None:
+        return apply_delta(_full_value(change, _other_side(key)), delta)
+    # 与同一字段下一条变更的另一侧相同，保存时已省略
+    return _full_value(change.next, _other_side(key))
+
+
+def expand_change(change):
+    """还原压缩过的变更（普通字典）；未压缩的变更原样返回"""
+    if not isinstance(change, _CompactChange):
+        return change
+    expanded = {key: value for key, value in change.items() if not key.endswith("_delta")}
+    for key in ("old_value", "new_value"):
+        if key not in expanded and (key[:3] + "_delta" in change or change.next is not None):
+            expanded[key] = _full_value(change, key)
+    return expanded
+
+
+def _change_size(change):
+    size = _CHANGE_OVERHEAD
+    for key, value in change.items():
+        if isinstance(value, str):
+            size += sys.getsizeof(value)
+        elif key.endswith("_delta"):
+            size += sys.getsizeof(value[2])
+    return size
+
+
+def _changes_of(data):
+    if not isinstance(data, dict):
+        return []
+    if "changes" in data:
+        return data["changes"]
+    return [data] if "string_id" in data else []
+
+
+def _map_changes(data, func):
+    if not isinstance(data, dict):
+        return data
+    if "changes" in data:
+        return {**data, "changes": [func(change) for change in data["changes"]]}
+    if "string_id" in data:
+        return func(data)
+    return deepcopy(data)
+
+
+def _link_key(change):
+    return change.get("string_id"), change.get("field"), change.get("plural_index", 0)
+
+
+class UndoStack:
+    """
+    撤销或重做栈，接口与列表一致（append/pop/[-1]/迭代/len/clear）。
+    记录以压缩形式保存在 deque 中，pop 时还原；超出数量或共享内存预算时从最旧的一端以 O(1) 丢弃。
+    同一字段的连续修改首尾相接，只有最新一条保存完整文本，更早的版本都以差异形式保存。
+    """
+
+    def __init__(self, journal, keep_key):
+        self.journal = journal
+        self._keep_key = keep_key
+        self._records = deque()
+        # (string_id, field, plural_index) -> 栈中该字段最新的一条变更
+        self._latest = {}
+        self.memory_bytes = 0
+
+    def append(self, record):
+        keep_key, other_key = self._keep_key, _other_side(self._keep_key)
+        stored = _Record(record)
+        stored["data"] = _map_changes(record.get("data"), lambda change: _compact_change(change, keep_key))
+        stored.size = _RECORD_OVERHEAD
+        latest = self._latest
+        for original, change in zip(_changes_of(record.get("data")), _changes_of(stored["data"]), strict=True):
+            change.record = stored
+            stored.size += _change_size(change)
+            key = _link_key(change)
+            prev = latest.get(key)
+            latest[key] = change
+            if prev is None:
+                continue
+            prev.next, change.prev = change, prev
+            kept = prev.get(keep_key)
+            if isinstance(kept, str) and len(kept) >= DELTA_MIN_CHARS and kept == original.get(other_key):
+                del prev[keep_key]
+                saved = sys.getsizeof(kept)
+                prev.record.size -= saved
+                self.memory_bytes -= saved
+        self._records.append(stored)
+        self.memory_bytes += stored.size
+        self.journal._trim(self)
+
+    def pop(self):
+        stored = self._records.pop()
+        self.memory_bytes -= stored.size
+        record = dict(stored)
+        record["data"] = _map_changes(stored.get("data"), expand_change)
+
+        keep_key = self._keep_key
+        latest = self._latest
+        for change, expanded in zip(
+            reversed(_changes_of(stored.get("data"))), reversed(_changes_of(record["data"])), strict=True
+        ):
+            prev = change.prev
+            key = _link_key(change)
+            if prev is None:
+                latest.pop(key, None)
+                continue
+            latest[key] = prev
+            prev.next = None
+            if keep_key not in prev:
+                # 被省略的完整文本等于刚弹出的这条变更的另一侧
+                value = expanded[_other_side(keep_key)]
+                prev[keep_key] = value
+                restored = sys.getsizeof(value)
+                prev.record.size += restored
+                self.memory_bytes += restored
+        return record
+
+    def popleft(self):
+        stored = self._records.popleft()
+        self.memory_bytes -= stored.size
+        for change in _changes_of(stored.get("data")):
+            if change.next is not None:
+                change.next.prev = None
+            else:
+                key = _link_key(change)
+                if self._latest.get(key) is change:
+                    del self._latest[key]
+
+    def clear(self):
+        self._records.clear()
+        self._latest.clear()
+        self.memory_bytes = 0
+
+    def __len__(self):
+        return len(self._records)
+
+    def __bool__(self):
+        return bool(self._records)
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __reversed__(self):
+        return reversed(self._records)
+
+    def __getitem__(self, index):
+        return self._records[index]
+
+
+class UndoJournal:
+    """
+    撤销/重做共用的历史记录。两个栈共享一份内存预算，超出时先丢弃最旧的撤销记录，
+    再丢弃最远的重做记录；刚加入的记录始终保留。
+    """
+
+    def __init__(self, max_records=MAX_UNDO_HISTORY, memory_budget=UNDO_HISTORY_MEMORY_BUDGET):
+        self.max_records = max_records
+        self.memory_budget = memory_budget
+        # 撤销记录的 new_value 与重做记录的 old_value 是条目当前的值，完整保存这一侧
+        self.undo = UndoStack(self, "new_value")
+        self.redo = UndoStack(self, "old_value")
+
+    def memory_bytes(self) -> int:
+        """两个栈中记录的估算内存占用（字节）"""
+        return self.undo.memory_bytes + self.redo.memory_bytes
+
+    def clear(self):
+        self.undo.clear()
+        self.redo.clear()
+
+    def _trim(self, pushed):
+        for stack in (self.undo, self.redo):
+            while len(stack) > self.max_records:
+                stack.popleft()
+        while self.memory_bytes() > self.memory_budget:
+            if len(self.undo) > (1 if pushed is self.undo else 0):
+                self.undo.popleft()
+            elif len(self.redo) > (1 if pushed is self.redo else 0):
+                self.redo.popleft()
+            else:
+                break
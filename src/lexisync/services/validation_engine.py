@@ -0,0 +1,232 @@
+# Copyright (c) 2025-2026, TheSkyC
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+
+from lexisync.services.plugin_validation_rules import plugin_rule_registry
+from lexisync.services.validation_profiler import validation_profiler
+from lexisync.services.validation_service import (
+    get_validation_context,
+    validate_string,
+    validation_context_fingerprint,
+)
+
+logger = logging.getLogger(__name__)
+
+MARKER_KINDS = ("error", "warning", "info")
+
+
+def validation_signature(ts_obj) -> tuple:
+    """影响校验结果的字符串内容与标记；与上次校验时不同即视为脏条目"""
+    translations = tuple(ts_obj.plural_translations.items()) if ts_obj.is_plural else ts_obj.translation
+    return (
+        ts_obj.original_semantic,
+        ts_obj.original_plural,
+        translations,
+        ts_obj.is_ignored,
+        ts_obj.is_fuzzy,
+        ts_obj.plural_expr,
+    )
+
+
+class IncrementalValidator:
+    """
+    增量校验引擎：只重新校验"脏"字符串。
+    每个字符串在校验后记录状态戳 (上下文版本, 术语索引 generation, 插件规则状态版本, 内容签名)：
+    - 译文、复数形式、忽略/模糊标记变化时内容签名不同，条目变脏；
+    - 校验配置或语言对变化时上下文版本递增，全部条目变脏；
+    - 术语库增量更新时，只有原文包含变更术语的条目变脏；
+    - 插件规则因超出耗时预算被降级或停用时，只有含有该规则结果的条目变脏。
+    同时维护错误/警告/提示条目 ID 集合，供标记栏增量更新。
+    挂接了 ValidationResultCache 时，脏条目先按内容哈希查找上次会话的结果。
+    """
+
+    def __init__(self):
+        self._fingerprint = None
+        self._ctx_env = None
+        self._epoch = 0
+        self._plugin_state_version = 0
+        # 状态已变化的插件规则产生过的结果 -> 变化时的状态版本
+        self._stale_plugin_results = {}
+        self._marker_ids = {kind: set() for kind in MARKER_KINDS}
+        self.result_cache = None
+
+    def invalidate_all(self):
+        """强制下一次校验时重新校验全部字符串"""
+        self._fingerprint = None
+        self._ctx_env = None
+        self._epoch += 1
+
+    @staticmethod
+    def mark_dirty(ts_objects):
+        for ts_obj in ts_objects:
+            ts_obj._validation_stamp = None
+
+    def _sync_context(self, ctx_env):
+        # 上下文来自共享缓存，对象未变即说明配置未变
+        if ctx_env is self._ctx_env:
+            return
+        self._ctx_env = ctx_env
+        fingerprint = validation_context_fingerprint(ctx_env)
+        if fingerprint != self._fingerprint:
+            self._fingerprint = fingerprint
+            self._epoch += 1
+            # 新版本中校验的条目都晚于已记录的状态变化
+            self._stale_plugin_results.clear()
+
+    def _sync_plugin_states(self):
+        if plugin_rule_registry.state_version == self._plugin_state_version:
+            return
+        for state_version, rule in plugin_rule_registry.state_changes_since(self._plugin_state_version):
+            for result in rule["stats"].results:
+                self._stale_plugin_results[result] = state_version
+            self._plugin_state_version = state_version
+
+    def _has_stale_plugin_results(self, ts_obj, stamp_state_version) -> bool:
+        """条目中是否有在其校验之后才改变状态的插件规则给出的结果"""
+        stale = self._stale_plugin_results
+        for messages in (ts_obj.warnings, ts_obj.minor_warnings, ts_obj.infos):
+            for message in messages:
+                if stale.get(message, 0) > stamp_state_version:
+                    return True
+        return False
+
+    @staticmethod
+    def _glossary_unaffected(ts_obj, stamp_generation, term_index) -> bool:
+        """术语索引相对于上次校验只前进了一步增量更新，且原文中不包含任何变更术语"""
+        if term_index is None or stamp_generation != term_index.parent_generation:
+            return False
+        changed_keys = term_index.changed_keys
+        if changed_keys is None:
+            return False
+        sources = ts_obj.original_semantic.lower()
+        if ts_obj.is_plural and ts_obj.original_plural:
+            sources += "\n" + ts_obj.original_plural.lower()
+        return not any(key in sources for key in changed_keys)
+
+    def prepare(self, config, app_instance=None):
+        """
+        构建校验上下文并同步上下文版本。
+        :return: (ctx_env, stamp_prefix)，stamp_prefix 为 (上下文版本, 术语索引 generation, 插件规则状态版本)
+        """
+        ctx_env = get_validation_context(config, app_instance)
+        self._sync_context(ctx_env)
+        self._sync_plugin_states()
+        term_index = ctx_env["term_cache"]
+        generation = term_index.generation if term_index is not None else None
+        return ctx_env, (self._epoch, generation, self._plugin_state_version)
+
+    def needs_validation(self, ts_obj, stamp_prefix, ctx_env, signature=None) -> bool:
+        if signature is None:
+            signature = validation_signature(ts_obj)
+        stamp = ts_obj._validation_stamp
+        if stamp is None or stamp[0] != stamp_prefix[0] or stamp[3] != signature:
+            return True
+        if stamp[2] != stamp_prefix[2]:
+            if self._has_stale_plugin_results(ts_obj, stamp[2]):
+                return True
+            stamp = ts_obj._validation_stamp = (stamp[0], stamp[1], stamp_prefix[2], signature)
+        if stamp[1] == stamp_prefix[1]:
+            return False
+        if self._glossary_unaffected(ts_obj, stamp[1], ctx_env["term_cache"]):
+            ts_obj._validation_stamp = (*stamp_prefix, signature)
+            return False
+        return True
+
+    def revalidate(self, ts_objects, config, app_instance=None) -> list:
+        """
+        重新校验其中的脏字符串并刷新其样式缓存。
+        :return: 实际重新校验过的字符串列表
+        """
+        ctx_env, stamp_prefix = self.prepare(config, app_instance)
+        # 一次只校验一条时视为交互式编辑，降级的插件规则仍会执行
+        bulk = len(ts_objects) > 1
+
+        validated = []
+        for ts_obj in ts_objects:
+            signature = validation_signature(ts_obj)
+            if not self.needs_validation(ts_obj, stamp_prefix, ctx_env, signature):
+                continue
+
+            if not self.apply_cached_result(ts_obj, stamp_prefix, ctx_env, signature):
+                self._validate_and_store(ts_obj, ctx_env, signature, bulk)
+                ts_obj.update_style_cache()
+                ts_obj._validation_stamp = (*stamp_prefix, signature)
+                self.record(ts_obj)
+            validated.append(ts_obj)
+
+        if validated:
+            logger.debug(f"Incremental validation: {len(validated)} of {len(ts_objects)} entries re-validated.")
+        return validated
+
+    def _validate_and_store(self, ts_obj, ctx_env, signature, bulk=False):
+        validate_string(ts_obj, ctx_env, bulk)
+        if self.result_cache is not None:
+            key = self.result_cache.key_for(ts_obj, ctx_env, signature)
+            self.result_cache.store(key, ts_obj.warnings, ts_obj.minor_warnings, ts_obj.infos)
+
+    def apply_cached_result(self, ts_obj, stamp_prefix, ctx_env, signature) -> bool:
+        """从持久化的结果缓存中恢复校验结果，未挂接缓存或未命中时返回 False"""
+        # 剖析模式下需要实际执行校验，不使用缓存结果
+        if self.result_cache is None or validation_profiler.enabled:
+            return False
+        result = self.result_cache.lookup(self.result_cache.key_for(ts_obj, ctx_env, signature))
+        if result is None:
+            return False
+        ts_obj.warnings, ts_obj.minor_warnings, ts_obj.infos = result
+        ts_obj.update_style_cache()
+        ts_obj._validation_stamp = (*stamp_prefix, signature)
+        self.record(ts_obj)
+        return True
+
+    def store_result(self, ts_obj, ctx_env, signature, result):
+        if self.result_cache is not None:
+            self.result_cache.store(self.result_cache.key_for(ts_obj, ctx_env, signature), *result)
+
+    def attach_result_cache(self, result_cache):
+        """切换持久化结果缓存，旧缓存在切换前保存"""
+        if self.result_cache is result_cache:
+            return
+        self.save_result_cache()
+        self.result_cache = result_cache
+
+    def save_result_cache(self):
+        if self.result_cache is not None:
+            self.result_cache.save()
+
+    def apply_result(self, ts_obj, stamp_prefix, signature, result) -> bool:
+        """
+        写回在其他进程中得到的校验结果；校验期间内容已被修改时丢弃结果，条目保持为脏。
+        :param result: (warnings, minor_warnings, infos)
+        """
+        if validation_signature(ts_obj) != signature:
+            return False
+        ts_obj.warnings, ts_obj.minor_warnings, ts_obj.infos = result
+        ts_obj.update_style_cache()
+        ts_obj._validation_stamp = (*stamp_prefix, signature)
+        self.record(ts_obj)
+        return True
+
+    def record(self, ts_obj):
+        """按字符串当前的校验结果更新标记集合"""
+        ts_id = ts_obj.id
+        active = not ts_obj.is_warning_ignored
+        for kind, messages in (
+            ("error", ts_obj.warnings),
+            ("warning", ts_obj.minor_warnings),
+            ("info", ts_obj.infos),
+        ):
+            if messages and active:
+                self._marker_ids[kind].add(ts_id)
+            else:
+                self._marker_ids[kind].discard(ts_id)
+
+    def rebuild_markers(self, ts_objects):
+        """条目列表整体替换后，从头重建标记集合"""
+        self._marker_ids = {kind: set() for kind in MARKER_KINDS}
+        for ts_obj in ts_objects:
+            if ts_obj.warnings or ts_obj.minor_warnings or ts_obj.infos:
+                self.record(ts_obj)
+
+    def marker_ids(self, kind) -> set:
+        return self._marker_ids[kind]
@@ -4,6 +4,7 @@
 from collections import Counter
 from functools import lru_cache
 import html
+import string
 
 import regex as re
 
@@ -43,15 +44,18 @@ RE_LATIN = r"[a-zA-Z0-9]"
 RE_PANGU_CJK_LATIN = re.compile(f"({RE_CJK})({RE_LATIN})")
 RE_PANGU_LATIN_CJK = re.compile(f"({RE_LATIN})({RE_CJK})")
 
-RE_ICU_SELECTOR = re.compile(r"=\d+\s*\{")
-RE_ORDINAL = re.compile(r"(\d+)(st|nd|rd|th)\b", re.IGNORECASE)
+# 只匹配选择器本身，其后的 { 仍可能是占位符
+RE_ICU_SELECTOR = re.compile(r"=\d+\s*(?=\{)")
 RE_APOSTROPHE = re.compile(r"(?<!['’])\b\w+(?:['’]\w+|s['’])(?![\w'’])", re.IGNORECASE)
 RE_ICU_PLACEHOLDER = re.compile(r"\{(?:[^{}]|(?R))*\}")
 RE_ICU_INNER_TYPE = re.compile(r"^[a-zA-Z0-9_]+\s*,\s*(plural|select|gender)\s*,")
 RE_ICU_VAR_NAME = re.compile(r"^([a-zA-Z0-9_]+)")
 
 RE_HAS_DIGIT = re.compile(r"\d")
-RE_PRINTF_FALSE_POSITIVE = re.compile(r"%\s+[a-zA-Z]")
+RE_PRINTF_SPACED_WORD = re.compile(r"% +[a-zA-Z]+")
+RE_PRINTF_POSITION = re.compile(r"\d+\$")
+RE_PRINTF_FLAGS = re.compile(r"[-+ 0#]")
+RE_PRINTF_WIDTH = re.compile(r"\d+(\.\d+)?")
 
 QUOTE_CHARS = {"'", "‘", "’", "「", "」", '"', "“", "”", "『", "』", "«", "»", "„"}
 STRFTIME_EQUIVALENCE = {
@@ -271,6 +275,115 @@ if False:
     _("Curly Braces {}")
 
 
+# --- 单遍分词 ---
+# 代码类规则（printf、Python 占位符、URL/Email、HTML 标签、数字）不再各自对文本跑一遍正则，
+# 而是共享同一次扫描得到的类型化记号流。
+# URL、Email、HTML 标签各自对整段文本独立匹配，互不抢占，也不与下面的主扫描抢占；
+# 主扫描中交替分支的顺序即优先级：先被前面分支吃掉的字符不会再被后面的分支识别（例如占位符里的数字不算作数字）。
+TOKEN_URL = "url"
+TOKEN_EMAIL = "email"
+TOKEN_HTML_TAG = "html_tag"
+TOKEN_ENTITY = "entity"
+TOKEN_ICU_SELECTOR = "icu_selector"
+TOKEN_ESCAPED_BRACE = "escaped_brace"
+TOKEN_PLACEHOLDER = "placeholder"
+TOKEN_PRINTF = "printf"
+TOKEN_NUMBER = "number"
+TOKEN_WHITESPACE = "whitespace"
+TOKEN_PUNCTUATION = "punctuation"
+
+_SCANNER = re.compile(
+    "|".join(
+        f"(?P<{kind}>{pattern})"
+        for kind, pattern in (
+            (TOKEN_ENTITY, RE_HTML_ENTITY_NUM.pattern),
+            (TOKEN_ICU_SELECTOR, RE_ICU_SELECTOR.pattern),
+            (TOKEN_ESCAPED_BRACE, r"\{\{|\}\}"),
+            (TOKEN_PLACEHOLDER, RE_PYTHON_BRACE.pattern),
+            (TOKEN_PRINTF, RE_PRINTF.pattern),
+            (TOKEN_NUMBER, RE_NUMBER.pattern),
+            (TOKEN_WHITESPACE, r"\s+"),
+            (TOKEN_PUNCTUATION, r"[^\w\s]"),
+        )
+    )
+)
+
+
+def _is_printf_false_positive(spec, text, end):
+    """'%' 后跟空格再接普通单词，如 "50% off"、"100% loaded"、"100% https://..." """
+    if end >= len(text) or not (text[end].isalpha() or text.startswith("://", end)):
+        return False
+    return RE_PRINTF_SPACED_WORD.fullmatch(spec) is not None
+
+
+def _may_contain_link(text):
+    # RE_URL 的每个分支都需要 '/' 或 'www'，RE_EMAIL 需要 '@'
+    return "/" in text or "@" in text or "www" in text
+
+
+class TokenStream:
+    """
+    一段文本的类型化记号流。
+    tokens 为按起始位置排列的 (kind, text, start, end)；容器记号（URL、Email、HTML 标签）之后紧跟其内部记号。
+    """
+
+    __slots__ = ("_by_kind", "text", "tokens")
+
+    def __init__(self, text):
+        self.text = text
+        self.tokens = []
+        self._by_kind = {}
+        if _may_contain_link(text):
+            self._add_all(TOKEN_URL, RE_URL, text)
+            self._add_all(TOKEN_EMAIL, RE_EMAIL, text)
+        if "<" in text:
+            self._add_all(TOKEN_HTML_TAG, RE_HTML_TAG, text)
+        has_containers = bool(self.tokens)
+        self._scan(text)
+        if has_containers:
+            # 排序稳定，同一起点上容器记号排在其内部记号之前
+            self.tokens.sort(key=lambda token: token[2])
+
+    def _add(self, kind, token_text, start):
+        token = (kind, token_text, start, start + len(token_text))
+        self.tokens.append(token)
+        self._by_kind.setdefault(kind, []).append(token)
+
+    def _add_all(self, kind, pattern, text):
+        for m in pattern.finditer(text):
+            self._add(kind, m.group(), m.start())
+
+    def _scan(self, text):
+        pos = 0
+        while True:
+            for m in _SCANNER.finditer(text, pos):
+                kind = m.lastgroup
+                token_text = m.group()
+                if kind == TOKEN_PRINTF and _is_printf_false_positive(token_text, text, m.end()):
+                    # 不是格式符：'%' 与空格照常记录，从单词开头重新扫描
+                    word_start = len(token_text.rstrip(string.ascii_letters))
+                    self._add(TOKEN_PUNCTUATION, "%", m.start())
+                    self._add(TOKEN_WHITESPACE, token_text[1:word_start], m.start() + 1)
+                    pos = m.start() + word_start
+                    break
+                self._add(kind, token_text, m.start())
+            else:
+                return
+
+    def of(self, kind):
+        """:return: 指定类型的记号列表（只读）"""
+        return self._by_kind.get(kind, ())
+
+    def texts(self, kind):
+        return [token[1] for token in self._by_kind.get(kind, ())]
+
+
+@lru_cache(maxsize=4096)
+def tokenize(text) -> TokenStream:
+    """同一文本在一次校验中会被多条规则使用，项目中也常有重复原文，因此按文本缓存"""
+    return TokenStream(text)
+
+
 def _has_case(char):
     return char.lower() != char.upper()
 
@@ -583,58 +696,40 @@ def _format_missing_extra(missing, extra, label):
     return " | ".join(parts)
 
 
-def check_printf(source, target, mode="loose"):
-    def get_normalized_printf_matches(text, label=_("Text")):
-        matches = []
-        for m in RE_PRINTF.finditer(text):
-            full_match = m.group(0)
-
-            # 过滤误判
-            if not full_match.startswith("%") or (
-                len(full_match) > 1 and full_match[1].isdigit() and "$" not in full_match and full_match != "%%"
-            ):
-                pass
-            elif RE_PRINTF_FALSE_POSITIVE.fullmatch(full_match):
-                if m.end() < len(text) and text[m.end()].isalpha():
-                    continue
+@lru_cache(maxsize=512)
+def _normalize_printf(spec, mode):
+    if mode != "loose" or spec == "%%" or (spec[1:].isdigit() and "$" not in spec):
+        return spec
+    # 1. 移除位置参数 (例如 %1$s -> %s)
+    normalized = RE_PRINTF_POSITION.sub("", spec)
+    # 2. 移除修饰符 (-+ 0#)
+    normalized = RE_PRINTF_FLAGS.sub("", normalized)
+    # 3. 移除宽度和精度 (例如 %2d -> %d, %.2f -> %f)
+    normalized = RE_PRINTF_WIDTH.sub("", normalized)
+    # 4. 归一化时间格式字符
+    type_char = normalized[-1]
+    if type_char in STRFTIME_EQUIVALENCE:
+        normalized = normalized[:-1] + STRFTIME_EQUIVALENCE[type_char]
+    return normalized
 
-            normalized_match = full_match
-
-            if mode == "loose":
-                if full_match == "%%":
-                    normalized_match = "%%"
-                elif full_match[1:].isdigit() and "$" not in full_match:
-                    normalized_match = full_match
-                else:
-                    # 1. 移除位置参数 (例如 %1$s -> %s)
-                    normalized_match = re.sub(r"\d+\$", "", normalized_match)
-                    # 2. 移除修饰符 (-+ 0#)
-                    normalized_match = re.sub(r"[-+ 0#]", "", normalized_match)
-                    # 3. 移除宽度和精度 (例如 %2d -> %d, %.2f -> %f)
-                    normalized_match = re.sub(r"\d+(\.\d+)?", "", normalized_match)
-                    # 4. 归一化时间格式字符
-                    type_char = normalized_match[-1]
-                    if type_char in STRFTIME_EQUIVALENCE:
-                        normalized_match = normalized_match[:-1] + STRFTIME_EQUIVALENCE[type_char]
-
-            matches.append(normalized_match)
-        return matches
-
-    src_fmt = get_normalized_printf_matches(source, _("Source"))
-    tgt_fmt = get_normalized_printf_matches(target, _("Target"))
 
+def check_printf(source, target, mode="loose"):
+    # "50% off" 之类的误判在分词时已排除
+    src_fmt = [_normalize_printf(spec, mode) for spec in tokenize(source).texts(TOKEN_PRINTF)]
+    tgt_fmt = [_normalize_printf(spec, mode) for spec in tokenize(target).texts(TOKEN_PRINTF)]
     missing, extra = _compare_counts(src_fmt, tgt_fmt)
     if missing or extra:
         return _format_missing_extra(missing, extra, "printf")
     return None
 
 
+def _brace_names(text):
+    # {{ 与 }} 是转义的花括号，分词时已作为独立记号，不会被识别为占位符
+    return [token[1][1:-1].strip() for token in tokenize(text).of(TOKEN_PLACEHOLDER)]
+
+
 def check_python_brace(source, target):
-    src_clean = source.replace("{{", "").replace("}}", "")
-    tgt_clean = target.replace("{{", "").replace("}}", "")
-    src_fmt = RE_PYTHON_BRACE.findall(src_clean)
-    tgt_fmt = RE_PYTHON_BRACE.findall(tgt_clean)
-    missing, extra = _compare_counts(src_fmt, tgt_fmt)
+    missing, extra = _compare_counts(_brace_names(source), _brace_names(target))
     if missing or extra:
         return _format_missing_extra(missing, extra, _("Python brace"))
     return None
@@ -666,10 +761,12 @@ def check_icu_placeholders(source, target):
 def check_urls_emails(source, target):
     """检查 URL 和 Email 是否匹配"""
     errors = []
+    src_stream = tokenize(source)
+    tgt_stream = tokenize(target)
 
     # --- URL 检查 ---
-    src_urls = set(RE_URL.findall(source))
-    tgt_urls = set(RE_URL.findall(target))
+    src_urls = set(src_stream.texts(TOKEN_URL))
+    tgt_urls = set(tgt_stream.texts(TOKEN_URL))
 
     if src_urls != tgt_urls:
         missing_urls = src_urls - tgt_urls
@@ -679,8 +776,8 @@ def check_urls_emails(source, target):
             errors.append(_format_missing_extra(missing_urls, extra_urls, _("URL")))
 
     # --- Email 检查 ---
-    src_emails = set(RE_EMAIL.findall(source))
-    tgt_emails = set(RE_EMAIL.findall(target))
+    src_emails = set(src_stream.texts(TOKEN_EMAIL))
+    tgt_emails = set(tgt_stream.texts(TOKEN_EMAIL))
 
     if src_emails != tgt_emails:
         missing_emails = src_emails - tgt_emails
@@ -695,27 +792,12 @@ def check_urls_emails(source, target):
 def check_numbers(source, target, mode="loose"):
     if not RE_HAS_DIGIT.search(source) and not RE_HAS_DIGIT.search(target):
         return None
-    # 1. 预处理：清理干扰项
-    src_clean = RE_ICU_SELECTOR.sub("", source)
-    tgt_clean = RE_ICU_SELECTOR.sub("", target)
-
-    src_clean = RE_PYTHON_BRACE.sub("", src_clean)
-    src_clean = RE_PRINTF.sub("", src_clean)
-    src_clean = RE_HTML_ENTITY_NUM.sub("", src_clean)
-
-    tgt_clean = RE_PYTHON_BRACE.sub("", tgt_clean)
-    tgt_clean = RE_PRINTF.sub("", tgt_clean)
-    tgt_clean = RE_HTML_ENTITY_NUM.sub("", tgt_clean)
-
-    # 2. 提取阿拉伯数字
-    # 即使在严格模式下，也先处理一下英文序数词后缀(1st->1)，防止误报
-    src_clean = RE_ORDINAL.sub(r"\1", src_clean)
-    tgt_clean = RE_ORDINAL.sub(r"\1", tgt_clean)
-
-    src_nums = RE_NUMBER.findall(src_clean)
-    tgt_nums = RE_NUMBER.findall(tgt_clean)
+    # 1. 数字记号已排除占位符、printf、HTML 实体与 ICU 选择器 (=1 {...}) 中的数字；
+    #    英文序数词后缀(1st)不属于数字记号，因此严格模式下也不会误报
+    src_nums = tokenize(source).texts(TOKEN_NUMBER)
+    tgt_nums = tokenize(target).texts(TOKEN_NUMBER)
 
-    # 3. 计数比较
+    # 2. 计数比较
     src_counter = Counter(src_nums)
     tgt_counter = Counter(tgt_nums)
     if src_counter == tgt_counter:
@@ -804,8 +886,7 @@ def check_html_tags(source, target):
 
     def get_valid_tags(text):
         tags = []
-        for m in RE_HTML_TAG.finditer(text):
-            tag_content = m.group(0)
+        for __, tag_content, __, __ in tokenize(text).of(TOKEN_HTML_TAG):
             inner_content = tag_content[1:-1]
             if " " in inner_content and "=" not in inner_content:
                 if not inner_content.strip().endswith("/"):
@@ -0,0 +1,116 @@
+# Copyright (c) 2025-2026, TheSkyC
+# SPDX-License-Identifier: Apache-2.0
+
+import datetime
+import json
+import logging
+import random
+import threading
+
+from lexisync.utils.constants import APP_VERSION
+from lexisync.utils.file_utils import atomic_open
+
+logger = logging.getLogger(__name__)
+
+# validate_string 中非规则部分的计时项
+SECTION_TOTAL = "(validate_string)"
+SECTION_GLOSSARY = "(glossary)"
+SECTION_LENGTH_RATIO = "(length_ratio)"
+
+# 每个计时项最多保留的耗时样本数，超出后用蓄水池抽样估计 p95
+MAX_SAMPLES_PER_KEY = 20000
+
+
+class _KeyStats:
+    __slots__ = ("calls", "max_seconds", "samples", "skipped", "total_seconds")
+
+    def __init__(self):
+        self.calls = 0
+        self.skipped = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.samples = []
+
+
+class ValidationProfiler:
+    """
+    可选的校验性能剖析：开启后 validate_string 按规则记录调用次数、fast_path 跳过次数、
+    总耗时与 p95 耗时，并单独统计术语检查和长度比例检查两部分。
+    默认关闭，关闭时校验路径上只多一次属性读取。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._rng = random.Random(0)
+        self.enabled = False
+
+    def set_enabled(self, enabled):
+        self.enabled = bool(enabled)
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+
+    def _get(self, key):
+        stats = self._stats.get(key)
+        if stats is None:
+            with self._lock:
+                stats = self._stats.setdefault(key, _KeyStats())
+        return stats
+
+    def record(self, key, seconds):
+        stats = self._get(key)
+        stats.calls += 1
+        stats.total_seconds += seconds
+        stats.max_seconds = max(stats.max_seconds, seconds)
+        samples = stats.samples
+        if len(samples) < MAX_SAMPLES_PER_KEY:
+            samples.append(seconds)
+        else:
+            slot = self._rng.randrange(stats.calls)
+            if slot < MAX_SAMPLES_PER_KEY:
+                samples[slot] = seconds
+
+    def record_skip(self, key):
+        self._get(key).skipped += 1
+
+    def has_data(self) -> bool:
+        return bool(self._stats)
+
+    def report(self) -> list:
+        """:return: 按总耗时降序排列的每项统计，时间单位为毫秒"""
+        with self._lock:
+            items = list(self._stats.items())
+        rows = []
+        for key, stats in items:
+            samples = sorted(stats.samples)
+            p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))] if samples else 0.0
+            evaluated = stats.calls + stats.skipped
+            rows.append(
+                {
+                    "key": key,
+                    "calls": stats.calls,
+                    "skipped": stats.skipped,
+                    "skip_ratio": stats.skipped / evaluated if evaluated else 0.0,
+                    "total_ms": stats.total_seconds * 1000,
+                    "mean_ms": stats.total_seconds / stats.calls * 1000 if stats.calls else 0.0,
+                    "p95_ms": p95 * 1000,
+                    "max_ms": stats.max_seconds * 1000,
+                }
+            )
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return rows
+
+    def export_json(self, filepath):
+        data = {
+            "app_version": APP_VERSION,
+            "generated_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "rules": self.report(),
+        }
+        with atomic_open(filepath, "w") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        logger.info(f"Validation profile exported to {filepath}")
+
+
+validation_profiler = ValidationProfiler()
@@ -0,0 +1,156 @@
+# Copyright (c) 2025-2026, TheSkyC
+# SPDX-License-Identifier: Apache-2.0
+
+import gzip
+import json
+import logging
+import os
+
+import xxhash
+
+from lexisync.services.plugin_validation_rules import RULE_STATE_ACTIVE, plugin_rule_registry
+from lexisync.services.project_service import TRANSLATION_DIR
+from lexisync.services.validation_service import (
+    lookup_glossary_matches,
+    translated_forms,
+    validation_context_fingerprint,
+)
+from lexisync.utils.constants import APP_VERSION
+from lexisync.utils.enums import WarningType
+from lexisync.utils.file_utils import atomic_open
+from lexisync.utils.localization import lang_manager
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 2
+CACHE_FILE_SUFFIX = ".vcache"
+# 超过该条目数时，保存前丢弃本次会话未使用过的旧条目
+MAX_CACHE_ENTRIES = 300000
+
+
+def validation_cache_path(project_path, target_language) -> str:
+    """校验结果缓存与项目译文放在一起：translation/<lang>.vcache"""
+    return os.path.join(project_path, TRANSLATION_DIR, f"{target_language}{CACHE_FILE_SUFFIX}")
+
+
+def _encode_messages(messages):
+    return [[warning_type.name, msg] for warning_type, msg in messages]
+
+
+def _decode_messages(encoded):
+    return [(WarningType[name], msg) for name, msg in encoded]
+
+
+class ValidationResultCache:
+    """
+    跨会话的校验结果缓存，以 gzip 压缩的 JSON 保存。
+    键为 xxhash(规则配置指纹, 目标语言, 原文, 译文, 标记, 命中的术语)，内容相同的字符串
+    在重新打开项目时可以直接复用上次的校验结果，无需重新校验。
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._entries = None
+        self._used = set()
+        self._dirty = False
+        self._fingerprint_ctx = None
+        self._fingerprint_state_version = None
+        self._fingerprint = ""
+
+    def _ensure_loaded(self):
+        if self._entries is not None:
+            return
+        self._entries = {}
+        if not os.path.isfile(self.path):
+            return
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_FORMAT_VERSION:
+                self._entries = data.get("entries", {})
+                logger.debug(f"Loaded {len(self._entries)} cached validation results from {self.path}")
+        except (OSError, ValueError, EOFError) as e:
+            logger.warning(f"Ignoring unreadable validation cache {self.path}: {e}")
+
+    def _context_fingerprint(self, ctx_env) -> str:
+        """
+        规则配置指纹；上下文来自共享缓存，同一个上下文对象只计算一次。
+        降级/停用的插件规则改变了会产生的结果，也计入指纹。
+        """
+        state_version = plugin_rule_registry.state_version
+        if ctx_env is not self._fingerprint_ctx or state_version != self._fingerprint_state_version:
+            parts = (
+                CACHE_FORMAT_VERSION,
+                APP_VERSION,
+                lang_manager.get_current_language(),
+                validation_context_fingerprint(ctx_env),
+                tuple(
+                    (rule_pack["rule"]["key"], rule_pack["rule"]["stats"].state)
+                    for rule_pack in ctx_env["plugin_rules"]
+                    if rule_pack["rule"]["stats"].state != RULE_STATE_ACTIVE
+                ),
+            )
+            self._fingerprint = xxhash.xxh3_64_hexdigest(repr(parts).encode("utf-8"))
+            self._fingerprint_ctx = ctx_env
+            self._fingerprint_state_version = state_version
+        return self._fingerprint
+
+    def key_for(self, ts_obj, ctx_env, signature) -> str:
+        """
+        :param signature: validation_signature(ts_obj)，包含原文、译文与忽略/模糊标记
+        """
+        parts = [self._context_fingerprint(ctx_env), ctx_env["target_lang"], repr(signature)]
+        # 术语库的内容无法跨会话比较，改为把原文中命中的术语及其要求的译法计入键
+        if ctx_env["term_cache"] is not None and ctx_env["glossary_enabled"] and not ts_obj.is_ignored:
+            for idx, original in translated_forms(ts_obj):
+                for match in lookup_glossary_matches(ts_obj, idx, original, ctx_env):
+                    parts.append(match["term"])
+                    parts.extend(translation["target"] for translation in match["translations"])
+        return xxhash.xxh3_128_hexdigest("\x00".join(parts).encode("utf-8", "surrogatepass"))
+
+    def lookup(self, key):
+        """:return: (warnings, minor_warnings, infos) 的新列表，未命中返回 None"""
+        self._ensure_loaded()
+        encoded = self._entries.get(key)
+        if encoded is None:
+            return None
+        try:
+            result = tuple(_decode_messages(messages) for messages in encoded)
+        except (KeyError, ValueError, TypeError):
+            # 警告类型已不存在（版本变化），当作未命中
+            del self._entries[key]
+            self._dirty = True
+            return None
+        self._used.add(key)
+        return result
+
+    def store(self, key, warnings, minor_warnings, infos):
+        self._ensure_loaded()
+        self._entries[key] = [
+            _encode_messages(warnings),
+            _encode_messages(minor_warnings),
+            _encode_messages(infos),
+        ]
+        self._used.add(key)
+        self._dirty = True
+
+    def save(self) -> bool:
+        if not self._dirty or self._entries is None:
+            return True
+        entries = self._entries
+        if len(entries) > MAX_CACHE_ENTRIES:
+            entries = {key: value for key, value in entries.items() if key in self._used}
+            self._entries = entries
+        try:
+            with atomic_open(self.path, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as f:
+                f.write(
+                    json.dumps(
+                        {"version": CACHE_FORMAT_VERSION, "entries": entries}, ensure_ascii=False, separators=(",", ":")
+                    ).encode("utf-8")
+                )
+        except OSError as e:
+            logger.error(f"Failed to save validation cache {self.path}: {e}")
+            return False
+        self._dirty = False
+        logger.debug(f"Saved {len(entries)} validation results to {self.path}")
+        return True
@@ -1,11 +1,28 @@
+from collections import Counter
+import logging
+import threading
+import time
+
 import regex as re
 
 from lexisync.services import validation_helpers
 from lexisync.services.expansion_ratio_service import ExpansionRatioService
+from lexisync.services.plugin_validation_rules import (
+    RULE_STATE_DEMOTED,
+    RULE_STATE_DISABLED,
+    plugin_rule_registry,
+)
+from lexisync.services.validation_profiler import (
+    SECTION_GLOSSARY,
+    SECTION_LENGTH_RATIO,
+    SECTION_TOTAL,
+    validation_profiler,
+)
 from lexisync.utils.constants import DEFAULT_VALIDATION_RULES
 from lexisync.utils.enums import WarningType
 from lexisync.utils.localization import _
-from lexisync.utils.text_utils import generate_ngrams, get_linguistic_length
+
+logger = logging.getLogger(__name__)
 
 placeholder_regex = re.compile(r"\{([^{}]+)\}")
 BRACKET_CHARS = set("()[]{}（）【】")
@@ -196,7 +213,97 @@ VALIDATION_REGISTRY = [
 ]
 
 
-def validate_string(ts_obj, ctx_env):
+# 剖析报告按规则区分耗时；同一 key 对应多条规则时（如 whitespace 的开头/结尾检查）附上检查名
+_registry_key_counts = Counter(rule["key"] for rule in VALIDATION_REGISTRY)
+for _rule in VALIDATION_REGISTRY:
+    _rule["profile_key"] = (
+        _rule["key"]
+        if _registry_key_counts[_rule["key"]] == 1
+        else f"{_rule['key']}.{_rule['check_func'].__name__.removeprefix('check_')}"
+    )
+
+
+def translated_forms(ts_obj):
+    """返回需要校验的 (复数形式下标, 对应原文) 列表；非复数字符串的下标为 None"""
+    if ts_obj.is_plural:
+        s_idx = ts_obj.singular_index
+        return [
+            (idx, ts_obj.original_semantic if idx == s_idx else ts_obj.original_plural)
+            for idx, trans in ts_obj.plural_translations.items()
+            if trans and trans.strip()
+        ]
+    if ts_obj.translation.strip():
+        return [(None, ts_obj.original_semantic)]
+    return []
+
+
+def lookup_glossary_matches(ts_obj, plural_index, original, ctx_env):
+    """返回原文中命中的术语：[{'term': ..., 'translations': [{'target': ...}, ...]}, ...]"""
+    glossary_hits = ctx_env["glossary_hits"]
+    if glossary_hits is not None:
+        return glossary_hits.get_hits(ts_obj, plural_index, ctx_env["source_lang"], ctx_env["target_lang"])
+    return [
+        {"term": m["term"], "translations": m["data"]["translations"]}
+        for m in ctx_env["term_cache"].extract_keywords(original)
+    ]
+
+
+def _forms_to_check(ts_obj):
+    if ts_obj.is_plural:
+        s_idx = ts_obj.singular_index
+        return [
+            (idx, ts_obj.original_semantic if idx == s_idx else ts_obj.original_plural, trans)
+            for idx, trans in ts_obj.plural_translations.items()
+            if trans
+        ]
+    return [(None, ts_obj.original_semantic, ts_obj.translation)]
+
+
+def _form_context(original, translation, markers):
+    """单个 (原文, 译文) 的规则执行上下文，fast_path 谓词基于其中的标记判断"""
+    has_marker_orig = any(m in original for m in markers)
+    has_marker_trans = any(m in translation for m in markers)
+
+    original_clean = validation_helpers.strip_accelerators(original, markers) if has_marker_orig else original
+    translation_clean = validation_helpers.strip_accelerators(translation, markers) if has_marker_trans else translation
+
+    return {
+        "original": original,
+        "translation": translation,
+        "original_clean": original_clean,
+        "translation_clean": translation_clean,
+        "has_marker_orig": has_marker_orig,
+        "has_marker_trans": has_marker_trans,
+        "has_percent": "%" in original or "%" in translation,
+        "has_brace": "{" in original or "{" in translation,
+        "has_html": "<" in original or "<" in translation,
+        "has_url_email": _has_url_email(original) or _has_url_email(translation),
+        "has_brackets": not BRACKET_CHARS.isdisjoint(original_clean) or not BRACKET_CHARS.isdisjoint(translation_clean),
+    }
+
+
+def _append_message(ts_obj, level, warning_type, msg):
+    if level == "error":
+        ts_obj.warnings.append((warning_type, msg))
+    elif level == "info":
+        ts_obj.infos.append((warning_type, msg))
+    else:
+        ts_obj.minor_warnings.append((warning_type, msg))
+
+
+def validate_string(ts_obj, ctx_env, bulk=False):
+    """
+    :param bulk: 是否为批量校验（全项目、多条目）；批量校验时跳过因超出耗时预算而降级的插件规则
+    """
+    if not validation_profiler.enabled:
+        _validate_string(ts_obj, ctx_env, bulk, None)
+        return
+    start = time.perf_counter()
+    _validate_string(ts_obj, ctx_env, bulk, validation_profiler)
+    validation_profiler.record(SECTION_TOTAL, time.perf_counter() - start)
+
+
+def _validate_string(ts_obj, ctx_env, bulk, profiler):
     ts_obj.warnings = []
     ts_obj.minor_warnings = []
     ts_obj.infos = []
@@ -204,20 +311,13 @@ def validate_string(ts_obj, ctx_env):
     if ts_obj.is_ignored:
         return
 
-    forms_to_check = []
-    if ts_obj.is_plural:
-        s_idx = ts_obj.singular_index
-        for idx, trans in ts_obj.plural_translations.items():
-            if trans:
-                orig = ts_obj.original_semantic if idx == s_idx else ts_obj.original_plural
-                forms_to_check.append((idx, orig, trans))
-    else:
-        forms_to_check.append((None, ts_obj.original_semantic, ts_obj.translation))
-
+    forms_to_check = _forms_to_check(ts_obj)
     if not forms_to_check:
         return
 
     markers = ctx_env["markers"]
+    expected_ratio = ctx_env["expected_ratio"]
+    check_length = ctx_env["check_length"] and expected_ratio is not None and expected_ratio > 0
 
     for idx, original, translation in forms_to_check:
         if not translation.strip():
@@ -226,49 +326,28 @@ def validate_string(ts_obj, ctx_env):
         def format_msg(msg, current_idx=idx):
             return f"[Form {current_idx}] {msg}" if current_idx is not None else msg
 
-        has_marker_orig = any(m in original for m in markers)
-        has_marker_trans = any(m in translation for m in markers)
-
-        original_clean = validation_helpers.strip_accelerators(original, markers) if has_marker_orig else original
-        translation_clean = (
-            validation_helpers.strip_accelerators(translation, markers) if has_marker_trans else translation
-        )
-
         # 准备单次执行的上下文
-        ctx = {
-            "original": original,
-            "translation": translation,
-            "original_clean": original_clean,
-            "translation_clean": translation_clean,
-            "has_marker_orig": has_marker_orig,
-            "has_marker_trans": has_marker_trans,
-            "has_percent": "%" in original or "%" in translation,
-            "has_brace": "{" in original or "{" in translation,
-            "has_html": "<" in original or "<" in translation,
-            "has_url_email": _has_url_email(original) or _has_url_email(translation),
-            "has_brackets": not BRACKET_CHARS.isdisjoint(original_clean)
-            or not BRACKET_CHARS.isdisjoint(translation_clean),
-        }
+        ctx = _form_context(original, translation, markers)
 
         for rule_pack in ctx_env["active_rules"]:
             rule = rule_pack["rule"]
             if not rule["fast_path"](ctx):
+                if profiler is not None:
+                    profiler.record_skip(rule["profile_key"])
                 continue
 
             src_text = ctx["original_clean"] if rule["use_clean_text"] else ctx["original"]
             tgt_text = ctx["translation_clean"] if rule["use_clean_text"] else ctx["translation"]
 
-            err_msg = rule["check_func"](src_text, tgt_text, **rule_pack["kwargs"])
+            if profiler is None:
+                err_msg = rule["check_func"](src_text, tgt_text, **rule_pack["kwargs"])
+            else:
+                start = time.perf_counter()
+                err_msg = rule["check_func"](src_text, tgt_text, **rule_pack["kwargs"])
+                profiler.record(rule["profile_key"], time.perf_counter() - start)
 
             if err_msg:
-                level = rule_pack["level"]
-                formatted_msg = format_msg(err_msg)
-                if level == "error":
-                    ts_obj.warnings.append((rule["warning_type"], formatted_msg))
-                elif level == "info":
-                    ts_obj.infos.append((rule["warning_type"], formatted_msg))
-                else:
-                    ts_obj.minor_warnings.append((rule["warning_type"], formatted_msg))
+                _append_message(ts_obj, rule_pack["level"], rule["warning_type"], format_msg(err_msg))
 
         # --- 特殊逻辑 ---
         if ts_obj.is_fuzzy and ctx_env["fuzzy_enabled"]:
@@ -281,11 +360,12 @@ def validate_string(ts_obj, ctx_env):
             target_list.append((WarningType.FUZZY_TRANSLATION, msg))
 
         if ctx_env["term_cache"] is not None and ctx_env["glossary_enabled"]:
-            matches = ctx_env["term_cache"].extract_keywords(original)
+            section_start = time.perf_counter() if profiler is not None else 0.0
+            matches = lookup_glossary_matches(ts_obj, idx, original, ctx_env)
             if matches:
                 translation_lower = translation.lower()
                 for match in matches:
-                    required_targets = [t["target"].lower() for t in match["data"]["translations"]]
+                    required_targets = [t["target"].lower() for t in match["translations"]]
                     if not any(target in translation_lower for target in required_targets):
                         msg = format_msg(
                             _("Glossary Mismatch: Term '{term}' should be translated as one of '{targets}'.").format(
@@ -298,34 +378,86 @@ def validate_string(ts_obj, ctx_env):
                             else (ts_obj.infos if ctx_env["glossary_level"] == "info" else ts_obj.minor_warnings)
                         )
                         target_list.append((WarningType.GLOSSARY_MISMATCH, msg))
+            if profiler is not None:
+                profiler.record(SECTION_GLOSSARY, time.perf_counter() - section_start)
 
-        if ctx_env["check_length"]:
-            if len(original) > 4 and original != translation:
-                len_orig = get_linguistic_length(original)
-                len_trans = get_linguistic_length(translation)
+        if check_length:
+            if len(original) <= 4 or original == translation:
+                if profiler is not None:
+                    profiler.record_skip(SECTION_LENGTH_RATIO)
+            else:
+                section_start = time.perf_counter() if profiler is not None else 0.0
+                len_orig = ts_obj.linguistic_length(original)
 
                 if len_orig > 0:
-                    actual_ratio = len_trans / len_orig
-                    expected_ratio = ctx_env["ratio_service"].get_expected_ratio(
-                        ctx_env["source_lang"], ctx_env["target_lang"], original, "none"
-                    )
-                    if expected_ratio is not None and expected_ratio > 0:
-                        if (
-                            actual_ratio > expected_ratio * ctx_env["len_major_up"]
-                            or actual_ratio < expected_ratio * ctx_env["len_major_down"]
-                        ):
-                            msg = _(
-                                "Length warning: Unusual expansion ratio ({actual:.1f}x), expected around {expected:.1f}x."
-                            ).format(actual=actual_ratio, expected=expected_ratio)
-                            ts_obj.warnings.append((WarningType.LENGTH_DEVIATION_MAJOR, msg))
-                        elif (
-                            actual_ratio > expected_ratio * ctx_env["len_minor_up"]
-                            or actual_ratio < expected_ratio * ctx_env["len_minor_down"]
-                        ):
-                            msg = _(
-                                "Length warning: Unusual expansion ratio ({actual:.1f}x), expected around {expected:.1f}x."
-                            ).format(actual=actual_ratio, expected=expected_ratio)
-                            ts_obj.minor_warnings.append((WarningType.LENGTH_DEVIATION_MINOR, msg))
+                    actual_ratio = ts_obj.linguistic_length(translation) / len_orig
+                    if (
+                        actual_ratio > expected_ratio * ctx_env["len_major_up"]
+                        or actual_ratio < expected_ratio * ctx_env["len_major_down"]
+                    ):
+                        msg = _(
+                            "Length warning: Unusual expansion ratio ({actual:.1f}x), expected around {expected:.1f}x."
+                        ).format(actual=actual_ratio, expected=expected_ratio)
+                        ts_obj.warnings.append((WarningType.LENGTH_DEVIATION_MAJOR, msg))
+                    elif (
+                        actual_ratio > expected_ratio * ctx_env["len_minor_up"]
+                        or actual_ratio < expected_ratio * ctx_env["len_minor_down"]
+                    ):
+                        msg = _(
+                            "Length warning: Unusual expansion ratio ({actual:.1f}x), expected around {expected:.1f}x."
+                        ).format(actual=actual_ratio, expected=expected_ratio)
+                        ts_obj.minor_warnings.append((WarningType.LENGTH_DEVIATION_MINOR, msg))
+                if profiler is not None:
+                    profiler.record(SECTION_LENGTH_RATIO, time.perf_counter() - section_start)
+
+    if ctx_env["plugin_rules"]:
+        run_plugin_rules(ts_obj, ctx_env, bulk)
+
+
+def run_plugin_rules(ts_obj, ctx_env, bulk=False):
+    """
+    执行插件提供的校验规则，结果追加到已有的校验结果之后。
+    插件规则不会发送到并行校验的子进程中，由主进程在收到子进程结果后单独执行这一步。
+    插件代码不要求线程安全，在其他线程中（如 AI 自修复检查）跳过插件规则。
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return
+    markers = ctx_env["markers"]
+    clock = time.perf_counter
+    for idx, original, translation in _forms_to_check(ts_obj):
+        if not translation.strip():
+            continue
+        ctx = _form_context(original, translation, markers)
+        for rule_pack in ctx_env["plugin_rules"]:
+            rule = rule_pack["rule"]
+            state = rule["stats"].state
+            if state == RULE_STATE_DISABLED or (bulk and state == RULE_STATE_DEMOTED):
+                continue
+
+            src_text = ctx["original_clean"] if rule["use_clean_text"] else ctx["original"]
+            tgt_text = ctx["translation_clean"] if rule["use_clean_text"] else ctx["translation"]
+            err_msg = None
+            failed = False
+            start = clock()
+            try:
+                if not rule["fast_path"](ctx):
+                    rule["stats"].skipped += 1
+                    if validation_profiler.enabled:
+                        validation_profiler.record_skip(rule["key"])
+                    continue
+                err_msg = rule["check_func"](src_text, tgt_text, **rule_pack["kwargs"])
+            except Exception as e:
+                failed = True
+                logger.error(f"Plugin validation rule '{rule['key']}' failed: {e}", exc_info=True)
+            elapsed = clock() - start
+            plugin_rule_registry.record(rule, elapsed, failed)
+            if validation_profiler.enabled:
+                validation_profiler.record(rule["key"], elapsed)
+
+            if err_msg:
+                msg = f"[Form {idx}] {err_msg}" if idx is not None else err_msg
+                _append_message(ts_obj, rule_pack["level"], rule["warning_type"], msg)
+                rule["stats"].results.add((rule["warning_type"], msg))
 
 
 def build_validation_context(config, app_instance=None):
@@ -348,51 +480,41 @@ def build_validation_context(config, app_instance=None):
                 {"rule": rule, "kwargs": rule["kwargs_gen"](init_ctx), "level": get_rule_level(config, rule["key"])}
             )
 
+    plugin_rules_pack = []
+    for rule in plugin_rule_registry.rules():
+        if is_rule_enabled(config, rule["key"]):
+            level = config.get("validation_rules", {}).get(rule["key"], {}).get("level", rule["default_level"])
+            try:
+                kwargs = rule["kwargs_gen"](init_ctx)
+            except Exception as e:
+                logger.error(f"Plugin validation rule '{rule['key']}' kwargs_gen failed: {e}", exc_info=True)
+                continue
+            plugin_rules_pack.append({"rule": rule, "kwargs": kwargs, "level": level})
+
     check_length = config.get("check_length", True)
     len_major_up = config.get("length_threshold_major", 2.5)
 
     matcher = None
     if config.get("check_glossary", True) and app_instance:
-        if (
-            hasattr(app_instance, "_validation_glossary_matcher")
-            and app_instance._validation_glossary_matcher is not None
-        ):
-            matcher = app_instance._validation_glossary_matcher
-        else:
-            all_words = set()
-            source_pool = (
-                app_instance.all_project_strings if app_instance.is_project_mode else app_instance.translatable_objects
-            )
-
-            for ts_obj in source_pool:
-                if not ts_obj.is_ignored:
-                    sem = ts_obj.original_semantic.lower()
-                    if re.search(r"\w", sem):
-                        all_words.update(generate_ngrams(sem, min_n=1, max_n=5))
-
-            if all_words:
-                term_cache_dict = app_instance.glossary_service.get_translations_batch(
-                    words=list(all_words), source_lang=source_lang, target_lang=target_lang, include_reverse=False
-                )
-                if term_cache_dict:
-                    from lexisync.utils.keyword_matcher import KeywordMatcher
-
-                    matcher = KeywordMatcher(case_sensitive=False)
-                    for term, info in term_cache_dict.items():
-                        matcher.add_keyword(term, info)
-
-                    app_instance._validation_glossary_matcher = matcher
+        term_index = app_instance.glossary_service.get_term_index(source_lang, target_lang)
+        if len(term_index):
+            matcher = term_index
 
     return {
         "active_rules": active_rules_pack,
+        "plugin_rules": plugin_rules_pack,
         "markers": markers,
         "fuzzy_enabled": is_rule_enabled(config, "fuzzy"),
         "fuzzy_level": get_rule_level(config, "fuzzy"),
         "glossary_enabled": is_rule_enabled(config, "glossary"),
         "glossary_level": get_rule_level(config, "glossary"),
         "term_cache": matcher,
+        "glossary_hits": getattr(app_instance, "glossary_hits", None) if matcher is not None else None,
         "check_length": check_length,
-        "ratio_service": ExpansionRatioService.get_instance() if check_length else None,
+        # 语言对在整个上下文中不变，预期膨胀率只查一次
+        "expected_ratio": ExpansionRatioService.get_instance().get_expected_ratio(source_lang, target_lang)
+        if check_length
+        else None,
         "source_lang": source_lang,
         "target_lang": target_lang,
         "len_major_up": len_major_up,
@@ -404,12 +526,121 @@ def build_validation_context(config, app_instance=None):
     }
 
 
+def validation_context_fingerprint(ctx_env):
+    """
+    返回校验上下文中会影响校验结果的配置指纹（不含术语库，术语库变化按 generation 单独判断）。
+    指纹不变时，内容未变化的字符串无需重新校验。
+    插件规则的降级/停用属于运行时状态，不计入指纹，由校验引擎只重新校验受影响的条目。
+    """
+    return (
+        ctx_env["source_lang"],
+        ctx_env["target_lang"],
+        tuple(ctx_env["markers"]),
+        tuple(
+            (rule_pack["rule"]["key"], rule_pack["level"], repr(sorted(rule_pack["kwargs"].items())))
+            for rule_pack in ctx_env["active_rules"]
+        ),
+        tuple(
+            (
+                rule_pack["rule"]["key"],
+                rule_pack["rule"]["plugin"],
+                rule_pack["level"],
+                repr(sorted(rule_pack["kwargs"].items())),
+            )
+            for rule_pack in ctx_env["plugin_rules"]
+        ),
+        ctx_env["fuzzy_enabled"],
+        ctx_env["fuzzy_level"],
+        ctx_env["glossary_enabled"],
+        ctx_env["glossary_level"],
+        ctx_env["check_length"],
+        ctx_env["expected_ratio"],
+        ctx_env["len_major_up"],
+        ctx_env["len_minor_up"],
+    )
+
+
+def _context_cache_key(config, app_instance):
+    """决定校验上下文内容的全部输入：相关配置、语言对与术语索引的 generation"""
+    if app_instance:
+        source_lang = app_instance.source_language
+        target_lang = app_instance.current_target_language
+        term_index = app_instance.glossary_service.peek_term_index(source_lang, target_lang)
+        generation = term_index.generation if term_index is not None else None
+    else:
+        source_lang = target_lang = "en"
+        generation = None
+    return (
+        plugin_rule_registry.version,
+        id(app_instance) if app_instance else None,
+        source_lang,
+        target_lang,
+        generation,
+        repr(config.get("validation_rules", {})),
+        config.get("accelerator_marker", "&"),
+        config.get("check_length", True),
+        config.get("length_threshold_major", 2.5),
+        config.get("length_threshold_minor", 2.0),
+        config.get("check_glossary", True),
+    )
+
+
+class ValidationContextCache:
+    """
+    线程安全的校验上下文缓存。
+    上下文只在配置、语言对或术语库变化（缓存键不同）或显式 invalidate() 后重建，
+    编辑器、AI 自修复和 Web 更新共用同一份只读上下文。
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = 0
+        self._entry = None  # (key, version, ctx_env)
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def invalidate(self):
+        with self._lock:
+            self._version += 1
+            self._entry = None
+
+    def get(self, config, app_instance=None):
+        # 已启用的插件变化时重新收集插件规则，规则表版本是缓存键的一部分；
+        # 收集会调用插件代码，只在主线程中进行，其他线程沿用已收集的规则
+        if threading.current_thread() is threading.main_thread():
+            plugin_rule_registry.sync(getattr(app_instance, "plugin_manager", None))
+        key = _context_cache_key(config, app_instance)
+        with self._lock:
+            entry = self._entry
+            version = self._version
+        if entry is not None and entry[0] == key and entry[1] == version:
+            return entry[2]
+
+        # 在锁外构建：首次加载术语索引可能较慢，不应阻塞其他线程读取旧上下文
+        ctx_env = build_validation_context(config, app_instance)
+        # 构建过程中术语索引可能被加载，以构建后的键存储，下次查询才能命中
+        key = _context_cache_key(config, app_instance)
+        with self._lock:
+            if self._version == version:
+                self._entry = (key, version, ctx_env)
+        return ctx_env
+
+
+validation_context_cache = ValidationContextCache()
+
+
+def get_validation_context(config, app_instance=None):
+    return validation_context_cache.get(config, app_instance)
+
+
 def validate_single_string(ts_obj, config, app_instance=None):
-    ctx_env = build_validation_context(config, app_instance)
+    ctx_env = get_validation_context(config, app_instance)
     validate_string(ts_obj, ctx_env)
 
 
 def run_validation_on_all(translatable_objects, config, app_instance=None):
-    ctx_env = build_validation_context(config, app_instance)
+    ctx_env = get_validation_context(config, app_instance)
     for ts_obj in translatable_objects:
-        validate_string(ts_obj, ctx_env)
+        validate_string(ts_obj, ctx_env, bulk=True)
@@ -889,7 +889,7 @@ class WebServerService(QThread):
             data = list(main_app.translatable_objects)
             if search:
                 q = search.lower()
-                data = [ts for ts in data if q in ts._search_cache]
+                data = [ts for ts in data if q in ts.search_text]
             data = self._apply_status_filter(data, status)
             total = len(data)
 
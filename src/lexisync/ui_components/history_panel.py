@@ -19,6 +19,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from lexisync.services.undo_journal import expand_change
 from lexisync.ui_components.tooltip import Tooltip
 from lexisync.utils.localization import _
 from lexisync.utils.path_utils import get_resource_path
@@ -127,6 +128,7 @@ class HistoryItemWidget(QWidget):
             return text[:length] + "..." if len(text) > length else text
 
         if action_type == "single_change":
+            data = expand_change(data)
             field = data.get("field", "unknown")
             old_val = data.get("old_value", "")
             new_val = data.get("new_value", "")
@@ -147,7 +149,8 @@ class HistoryItemWidget(QWidget):
             html += f"<div style='color:#CCCCCC; margin-bottom:4px;'>{_('Affected items')}: {count}</div>"
 
             preview_limit = 3
-            for _i, change in enumerate(changes[:preview_limit]):
+            for _i, stored_change in enumerate(changes[:preview_limit]):
+                change = expand_change(stored_change)
                 old_val = change.get("old_value", "")
                 new_val = change.get("new_value", "")
                 html += "<div style='margin-bottom:4px;'>"
@@ -210,6 +213,7 @@ class HistoryPanel(QWidget):
         self.undo_history = []
         self.redo_history = []
         self.current_file_id = None
+        self.memory_usage = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -266,6 +270,13 @@ class HistoryPanel(QWidget):
         self.list_widget.itemDoubleClicked.connect(self._on_item_double_clicked)
         layout.addWidget(self.list_widget)
 
+        self.memory_label = QLabel()
+        self.memory_label.setStyleSheet(
+            "color: #888888; font-size: 11px; padding: 3px 6px; border-top: 1px solid #E0E0E0; background: #F8F9FA;"
+        )
+        self.memory_label.setVisible(False)
+        layout.addWidget(self.memory_label)
+
     def _get_current_state_index(self):
         for i in range(self.list_widget.count()):
             widget = self.list_widget.itemWidget(self.list_widget.item(i))
@@ -401,10 +412,13 @@ class HistoryPanel(QWidget):
                 # 破坏性还原：红色 (包含目标项及之上所有项)
                 widget.setStyleSheet("background-color: #FFEBEE; color: #D32F2F;")
 
-    def refresh(self, undo_history, redo_history, current_file_id):
+    def refresh(self, undo_history, redo_history, current_file_id, memory_usage=None):
+        """:param memory_usage: (历史记录估算占用字节数, 内存预算字节数)，为 None 时不显示"""
         self.undo_history = undo_history
         self.redo_history = redo_history
         self.current_file_id = current_file_id
+        self.memory_usage = memory_usage
+        self._update_memory_label()
 
         v_scrollbar = self.list_widget.verticalScrollBar()
         saved_scroll_value = v_scrollbar.value() if v_scrollbar else 0
@@ -443,10 +457,22 @@ class HistoryPanel(QWidget):
 
             QTimer.singleShot(0, lambda: v_scrollbar.setValue(saved_scroll_value))
 
+    def _update_memory_label(self):
+        if self.memory_usage is None:
+            self.memory_label.setVisible(False)
+            return
+        used, budget = self.memory_usage
+        self.memory_label.setText(
+            _("History memory: {used:.2f} MB / {budget:.0f} MB").format(
+                used=used / (1024 * 1024), budget=budget / (1024 * 1024)
+            )
+        )
+        self.memory_label.setVisible(True)
+
     def update_ui_texts(self):
         self.clear_action.setText(_("Clear History"))
         self.search_edit.setPlaceholderText(_("Filter history..."))
-        self.refresh(self.undo_history, self.redo_history, self.current_file_id)
+        self.refresh(self.undo_history, self.redo_history, self.current_file_id, self.memory_usage)
 
     def _filter_list(self, text):
         text = text.lower()
@@ -11,6 +11,8 @@ def _(message):
 APP_NAMESPACE_UUID = uuid.UUID("c2e02333-2f1d-48ba-bc8d-90d49da373af")
 EXPANSION_DATA_DIR = "expansion_data"
 MAX_UNDO_HISTORY = 30
+# 撤销/重做历史共享的内存预算（字节）
+UNDO_HISTORY_MEMORY_BUDGET = 64 * 1024 * 1024
 DEFAULT_API_URL = "https://api.deepseek.com/chat/completions"
 APP_VERSION = "1.4.0"
 PROMPT_PRESET_EXTENSION = ".prompt"
@@ -0,0 +1,92 @@
+# Copyright (c) 2025-2026, TheSkyC
+# SPDX-License-Identifier: Apache-2.0
+
+from collections import OrderedDict
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+# 上下文窗口：当前行前后各取多少行
+CONTEXT_RADIUS = 5
+# 行缓存中最多保留的源文件数
+MAX_CACHED_FILES = 32
+
+
+class LineCache:
+    """
+    按路径缓存源文件的行列表，LRU 淘汰。文件修改时间变化后重新读取。
+    只在上下文面板或 AI 提示词需要时读取，加载翻译文件时不再读取引用的源文件。
+    """
+
+    def __init__(self, max_files=MAX_CACHED_FILES):
+        self._lock = threading.Lock()
+        self._files = OrderedDict()
+        self.max_files = max_files
+
+    def get(self, path) -> list:
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return []
+        with self._lock:
+            cached = self._files.get(path)
+            if cached is not None and cached[0] == mtime:
+                self._files.move_to_end(path)
+                return cached[1]
+
+        try:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                lines = f.read().splitlines()
+        except OSError as e:
+            logger.warning(f"Failed to read source file for context: {path}, error: {e}")
+            return []
+
+        with self._lock:
+            self._files[path] = (mtime, lines)
+            self._files.move_to_end(path)
+            while len(self._files) > self.max_files:
+                self._files.popitem(last=False)
+        return lines
+
+    def clear(self):
+        with self._lock:
+            self._files.clear()
+
+
+line_cache = LineCache()
+
+
+class ContextSource:
+    """
+    条目上下文行的来源，同一文件的所有条目共享同一个对象。
+    来自磁盘的源文件只记录路径，行内容从 line_cache 中按需读取；
+    已在内存中的内容（如正在翻译的代码文件）直接引用其行列表。
+    """
+
+    __slots__ = ("_lines", "path")
+
+    def __init__(self, lines=None, path=None):
+        self._lines = lines
+        self.path = path
+
+    @classmethod
+    def from_path(cls, path):
+        return cls(path=path)
+
+    def lines(self) -> list:
+        if self._lines is not None:
+            return self._lines
+        return line_cache.get(self.path) if self.path else []
+
+    def window(self, line_num, radius=CONTEXT_RADIUS):
+        """
+        :return: (第 line_num 行前后各 radius 行, 当前行在其中的下标)；没有内容时返回 ([], -1)
+        """
+        lines = self.lines()
+        if not lines:
+            return [], -1
+        start = max(0, line_num - 1 - radius)
+        current = line_num - 1
+        return lines[start : min(len(lines), current + radius + 1)], current - start
@@ -43,6 +43,7 @@ class WarningType(Enum):
     NUMBER_MISMATCH = auto()  # 数字内容不一致
     FUZZY_TRANSLATION = auto()  # 模糊标记
     UNUSUAL_EXPANSION_RATIO = auto()  # 膨胀率差异大
+    PLUGIN_RULE = auto()  # 插件提供的校验规则
 
     def get_display_text(self):
         from lexisync.utils.localization import _
@@ -106,6 +107,8 @@ class WarningType(Enum):
             return _("Fuzzy Translation")
         if self == WarningType.UNUSUAL_EXPANSION_RATIO:
             return _("Unusual Expansion Ratio")
+        if self == WarningType.PLUGIN_RULE:
+            return _("Plugin Rule")
 
         # Fallback
         return self.name.replace("_", " ").title()
@@ -1,25 +1,67 @@
 # Copyright (c) 2025-2026, TheSkyC
 # SPDX-License-Identifier: Apache-2.0
 
+import unicodedata
 
-class TrieNode:
-    __slots__ = ("children", "data", "is_end")
+# 不以空格分词的文字（汉字、假名、韩文、泰文、老挝文、高棉文、缅甸文），与相邻字符之间不要求词边界
+_UNSEGMENTED_RANGES = (
+    (0x0E00, 0x0EFF),
+    (0x1000, 0x109F),
+    (0x1100, 0x11FF),
+    (0x1780, 0x17FF),
+    (0x2E80, 0x9FFF),
+    (0xA960, 0xA97F),
+    (0xAC00, 0xD7FF),
+    (0xF900, 0xFAFF),
+    (0xFF66, 0xFFDC),
+    (0x20000, 0x3FFFF),
+)
 
-    def __init__(self):
-        self.children = {}
-        self.is_end = False
-        self.data = None
+
+def is_word_char(ch: str) -> bool:
+    """与正则 \\w 一致的 Unicode 单词字符判断（含组合附加符号）"""
+    if ch.isalnum() or ch == "_":
+        return True
+    return unicodedata.category(ch) in ("Mn", "Mc", "Me", "Pc")
+
+
+def _is_unsegmented(ch: str) -> bool:
+    code = ord(ch)
+    for low, high in _UNSEGMENTED_RANGES:
+        if code < low:
+            return False
+        if code <= high:
+            return True
+    return False
+
+
+class _SegmentedWordChars(dict):
+    """字符 -> 是否为以空格分词文字中的单词字符，按需计算并缓存"""
+
+    def __missing__(self, ch):
+        value = self[ch] = is_word_char(ch) and not _is_unsegmented(ch)
+        return value
+
+
+_SEGMENTED_WORD_CHARS = _SegmentedWordChars()
 
 
 class KeywordMatcher:
     """
-    基于 Trie 树的高效关键词匹配器。
-    用于在长文本中快速查找已知的术语。
+    基于 Aho-Corasick 自动机的关键词匹配器。
+    一次扫描即可找出文本中的全部已知术语，复杂度与文本长度和匹配数成线性关系。
+    结果采用最左最长、互不重叠的原则，并要求匹配两端均位于词边界。
+    添加关键词后自动机在下一次查询时重新编译。
     """
 
-    def __init__(self, case_sensitive=False):
-        self.root = TrieNode()
+    def __init__(self, case_sensitive=False, word_boundaries=True):
         self.case_sensitive = case_sensitive
+        self.word_boundaries = word_boundaries
+        self._keywords = {}
+        self._automaton = None
+
+    def __len__(self):
+        return len(self._keywords)
 
     def add_keywords(self, keywords_dict):
         """
@@ -32,62 +74,109 @@ class KeywordMatcher:
     def add_keyword(self, term, data=None):
         if not term:
             return
-
-        node = self.root
-        processing_term = term if self.case_sensitive else term.lower()
-
-        for char in processing_term:
-            if char not in node.children:
-                node.children[char] = TrieNode()
-            node = node.children[char]
-
-        node.is_end = True
-        node.data = data
+        self._keywords[self._fold(term)] = data
+        self._automaton = None
+
+    def _compile(self):
+        # 节点以整数编号，各属性存放在并列的列表中
+        goto = [{}]
+        term_len = [0]
+        term_data = [None]
+        for term, data in self._keywords.items():
+            node = 0
+            for char in term:
+                nxt = goto[node].get(char)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][char] = nxt
+                    goto.append({})
+                    term_len.append(0)
+                    term_data.append(None)
+                node = nxt
+            term_len[node] = len(term)
+            term_data[node] = data
+
+        # 广度优先计算失败链接与输出链接（沿失败链最近的终止节点）
+        fail = [0] * len(goto)
+        output = [0] * len(goto)
+        queue = list(goto[0].values())
+        for node in queue:
+            for char, child in goto[node].items():
+                queue.append(child)
+                f = fail[node]
+                while f and char not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(char, 0)
+                output[child] = fail[child] if term_len[fail[child]] else output[fail[child]]
+
+        # hit[node]：到达该节点时需要报告的第一个终止节点（0 表示无匹配）
+        hit = [node if term_len[node] else output[node] for node in range(len(goto))]
+        self._automaton = ([d.get for d in goto], fail, output, hit, term_len, term_data)
+        return self._automaton
+
+    def _fold(self, text):
+        if self.case_sensitive:
+            return text
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            return lowered
+        # 个别字符小写后长度会变化（如 'İ'），逐字处理以保持下标对齐
+        return "".join(low if len(low) == 1 else char for char, low in ((c, c.lower()) for c in text))
+
+    def _find_candidates(self, automaton, text, processing_text):
+        """扫描一遍文本，返回所有满足词边界的 (start, end, node) 候选匹配"""
+        goto, fail, output, hit, term_len, _term_data = automaton
+        check_boundaries = self.word_boundaries
+        in_word = _SEGMENTED_WORD_CHARS
+        n = len(text)
+        candidates = []
+        state = 0
+
+        for j, char in enumerate(processing_text):
+            nxt = goto[state](char)
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto[state](char)
+            if nxt is None:
+                state = 0
+                continue
+            state = nxt
+
+            node = hit[state]
+            if not node:
+                continue
+            end = j + 1
+            if check_boundaries and end < n and in_word[text[end]] and in_word[text[j]]:
+                continue
+            while node:
+                start = end - term_len[node]
+                if not check_boundaries or start == 0 or not (in_word[text[start - 1]] and in_word[text[start]]):
+                    candidates.append((start, end, node))
+                node = output[node]
+        return candidates
 
     def extract_keywords(self, text):
         """
         在文本中查找所有匹配的关键词。
-        采用最长匹配原则 (Longest Match Preference)。
+        采用最左最长匹配原则 (Leftmost-Longest)，结果互不重叠。
         :return: list of {'term': str, 'data': any, 'start': int, 'end': int}
         """
-        if not text:
+        if not text or not self._keywords:
             return []
 
-        processing_text = text if self.case_sensitive else text.lower()
-        n = len(processing_text)
-        results = []
-        i = 0
-
-        while i < n:
-            node = self.root
-            j = i
-            last_match_end = -1
-            last_match_data = None
-
-            # 尝试匹配尽可能长的词
-            while j < n and processing_text[j] in node.children:
-                node = node.children[processing_text[j]]
-                j += 1
-                if node.is_end:
-                    last_match_end = j
-                    last_match_data = node.data
-
-            if last_match_end != -1:
-                # 找到了匹配
-                # 简单的单词边界检查 (可选，防止匹配到单词内部，如 "he" 匹配 "hello")
-                # 这里做一个简单的边界检查：如果匹配结束位置后面是字母数字，则视为单词内部匹配，忽略
-                is_valid_word = True
-                if last_match_end < n:
-                    next_char = processing_text[last_match_end]
-                    if next_char.isalnum() or next_char == "_":
-                        is_valid_word = False
-
-                if is_valid_word:
-                    original_term = text[i:last_match_end]
-                    results.append({"term": original_term, "data": last_match_data, "start": i, "end": last_match_end})
-                    i = last_match_end
-                    continue
-
-            i += 1
+        automaton = self._automaton or self._compile()
+        candidates = self._find_candidates(automaton, text, self._fold(text))
+        if not candidates:
+            return []
+        if len(candidates) > 1:
+            candidates.sort(key=lambda c: (c[0], -c[1]))
 
+        term_data = automaton[5]
+        results = []
+        last_end = 0
+        for start, end, node in candidates:
+            if start < last_end:
+                continue
+            results.append({"term": text[start:end], "data": term_data[node], "start": start, "end": end})
+            last_end = end
         return results
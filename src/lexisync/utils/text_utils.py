@@ -7,34 +7,25 @@ non_linguistic_chars_regex = re.compile(r"[\p{P}\p{N}\p{S}\p{Z}]")
 placeholder_regex = re.compile(r"\{([^{}]+)\}")
 
 
-def get_linguistic_length(text: str) -> int:
-    if not text:
-        return 0
-    text_no_placeholders = placeholder_regex.sub("", text)
-    linguistic_text = non_linguistic_chars_regex.sub("", text_no_placeholders)
-    return len(linguistic_text)
-
+class _NonLinguisticTable(dict):
+    """str.translate 用的删除表：按需对遇到的字符做一次 Unicode 属性判断并记住结果"""
 
-def generate_ngrams(text: str, min_n: int = 1, max_n: int = 5) -> list[str]:
-    """
-    生成文本的 N-gram 列表。
-    """
-    if not text:
-        return []
+    def __missing__(self, code):
+        value = None if non_linguistic_chars_regex.match(chr(code)) else code
+        self[code] = value
+        return value
 
-    words = re.findall(r"\b\w+\b", text)
-    if not words:
-        return []
 
-    ngrams = set()
-    count = len(words)
+_non_linguistic_table = _NonLinguisticTable()
 
-    for n in range(min_n, max_n + 1):
-        for i in range(count - n + 1):
-            gram = " ".join(words[i : i + n])
-            ngrams.add(gram)
 
-    return list(ngrams)
+def get_linguistic_length(text: str) -> int:
+    """去掉 {占位符}、标点、数字、符号和空白后的字符数"""
+    if not text:
+        return 0
+    if "{" in text:
+        text = placeholder_regex.sub("", text)
+    return len(text.translate(_non_linguistic_table))
 
 
 def format_file_size(size_bytes: int) -> str:
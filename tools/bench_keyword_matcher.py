@@ -0,0 +1,95 @@
+from pathlib import Path
+import random
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from lexisync.utils.keyword_matcher import KeywordMatcher
+
+SYLLABLES = ["ka", "to", "ri", "ne", "sa", "mo", "lu", "pe", "di", "an", "or", "el", "is", "un", "ex", "co"]
+
+
+def random_word(rng: random.Random) -> str:
+    return "".join(rng.choices(SYLLABLES, k=rng.randint(1, 4)))
+
+
+def build_terms(rng: random.Random, count: int) -> dict[str, str]:
+    terms = {}
+    while len(terms) < count:
+        terms[" ".join(random_word(rng) for _ in range(rng.randint(1, 3)))] = "x"
+    return terms
+
+
+def legacy_extract(trie: dict, text: str) -> int:
+    """旧实现：在每个字符位置重新开始 Trie 遍历"""
+    text = text.lower()
+    n = len(text)
+    found = 0
+    i = 0
+    while i < n:
+        node = trie
+        j = i
+        last_end = -1
+        while j < n and text[j] in node:
+            node = node[text[j]]
+            j += 1
+            if "$" in node:
+                last_end = j
+        if last_end != -1 and (last_end == n or not (text[last_end].isalnum() or text[last_end] == "_")):
+            found += 1
+            i = last_end
+            continue
+        i += 1
+    return found
+
+
+def run(label: str, func, strings: list[str]):
+    start = time.perf_counter()
+    matches = sum(func(s) for s in strings)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {elapsed:8.3f} s  ({elapsed / len(strings) * 1e6:8.1f} µs/string, {matches} matches)")
+
+
+def build_legacy_trie(terms) -> dict:
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term.lower():
+            node = node.setdefault(char, {})
+        node["$"] = True
+    return trie
+
+
+def main():
+    term_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    string_count = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    rng = random.Random(42)
+
+    terms = build_terms(rng, term_count)
+    strings = [" ".join(random_word(rng) for _ in range(rng.randint(3, 15))) for _ in range(string_count)]
+    print(f"🔧 {len(terms)} terms, {len(strings)} strings ({sum(map(len, strings)) / 1e6:.1f}M chars)")
+
+    start = time.perf_counter()
+    matcher = KeywordMatcher(case_sensitive=False)
+    matcher.add_keywords(terms)
+    matcher.extract_keywords("warm up")
+    print(f"{'Aho-Corasick build':<34} {time.perf_counter() - start:8.3f} s")
+
+    run("Aho-Corasick", lambda s: len(matcher.extract_keywords(s)), strings)
+    trie = build_legacy_trie(terms)
+    run("Per-position trie (legacy)", lambda s: legacy_extract(trie, s), strings)
+
+    # 病态输入：大量共享前缀的长术语，旧实现在每个位置都要走完整条前缀
+    print("🔧 Pathological: 200 terms 'a'*k + 'b', 100 strings of 2000 x 'a'")
+    bad_terms = {"a" * k + "b": "x" for k in range(1, 201)}
+    bad_strings = ["a" * 2000] * 100
+    bad_matcher = KeywordMatcher(case_sensitive=False)
+    bad_matcher.add_keywords(bad_terms)
+    run("Aho-Corasick", lambda s: len(bad_matcher.extract_keywords(s)), bad_strings)
+    bad_trie = build_legacy_trie(bad_terms)
+    run("Per-position trie (legacy)", lambda s: legacy_extract(bad_trie, s), bad_strings)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from lexisync.services.po_file_service import load_from_po
+
+WORDS = [
+    "open", "save", "file", "project", "settings", "export", "import", "window", "close", "delete",
+    "translation", "memory", "glossary", "string", "search", "replace", "error", "warning", "status", "update",
+]  # fmt: skip
+
+
+def write_fixture(root: Path, count: int, rng: random.Random) -> Path:
+    """生成一个源文件和引用它的 PO 文件，每个条目对应源文件中的一行"""
+    src_dir = root / "src"
+    src_dir.mkdir()
+    source_lines = []
+    entries = []
+    for i in range(count):
+        text = " ".join(rng.choice(WORDS) for __ in range(rng.randint(2, 8))).capitalize() + f" {i}"
+        source_lines.append(f'    label_{i} = _("{text}")')
+        translation = text.upper() if rng.random() < 0.6 else ""
+        entries.append(f'#: src/app.py:{i + 1}\nmsgid "{text}"\nmsgstr "{translation}"\n')
+    (src_dir / "app.py").write_text("\n".join(source_lines), encoding="utf-8")
+
+    po_path = root / "messages.po"
+    header = 'msgid ""\nmsgstr ""\n"Content-Type: text/plain; charset=UTF-8\\n"\n"Language: zh\\n"\n\n'
+    po_path.write_text(header + "\n".join(entries), encoding="utf-8")
+    return po_path
+
+
+def report(label: str, elapsed: float, count: int):
+    print(f"{label:<34} {elapsed:8.3f} s  ({elapsed / count * 1e6:8.2f} µs/entry)")
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    count = int(args[0]) if args else 200000
+    # tracemalloc 会显著拖慢加载，只在需要内存数据时开启
+    trace_memory = "--memory" in sys.argv
+    rng = random.Random(42)
+    with tempfile.TemporaryDirectory() as tmp:
+        po_path = write_fixture(Path(tmp), count, rng)
+        print(f"🔧 {count} entries, {po_path.stat().st_size / 1024 / 1024:.1f} MB PO file")
+
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        translatable_objects, __, __, __ = load_from_po(str(po_path))
+        report("load_from_po", time.perf_counter() - start, count)
+        if trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{'  memory held / peak':<34} {current / 1024 / 1024:8.1f} MB / {peak / 1024 / 1024:.1f} MB")
+
+        # 派生字段与上下文按需生成，首次读取的成本
+        start = time.perf_counter()
+        for ts_obj in translatable_objects:
+            __ = ts_obj.search_text
+        report("First search_text pass", time.perf_counter() - start, count)
+
+        sample = rng.sample(translatable_objects, min(1000, count))
+        start = time.perf_counter()
+        for ts_obj in sample:
+            __ = ts_obj.context_lines
+        report("context_lines (1000 entries)", time.perf_counter() - start, len(sample))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+from contextlib import nullcontext
+import json
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from PySide6.QtCore import QCoreApplication
+
+from lexisync.services import project_service
+from lexisync.services.project_saver import ProjectSaver
+
+WORDS = [
+    "open", "save", "file", "project", "settings", "export", "import", "window", "close", "delete",
+    "translation", "memory", "glossary", "string", "search", "replace", "error", "warning", "status", "update",
+]  # fmt: skip
+EDIT_COUNTS = [1, 10, 100, 1000]
+
+
+def create_fixture(root: Path, count: int, rng: random.Random) -> str:
+    """一个包含 JSON 源文件的项目，目标语言 zh"""
+    source = root / "app.json"
+    texts = {f"key_{i}": " ".join(rng.choice(WORDS) for __ in range(rng.randint(2, 8))) for i in range(count)}
+    source.write_text(json.dumps(texts), encoding="utf-8")
+    return project_service.create_project(
+        str(root / "project"), "Bench", "en", ["zh"], [{"path": str(source), "format_id": "json_i18n"}], False, None
+    )
+
+
+def timed_save(saver, project_path):
+    """:return: (UI 线程中准备的耗时, 写入的耗时, 写入的条目数)"""
+    start = time.perf_counter()
+    job = saver._prepare(project_path)
+    prepared = time.perf_counter()
+    saver._job = job
+    job.run()
+    saver._finish_job(job)
+    return prepared - start, time.perf_counter() - prepared, job.written
+
+
+def report(label, timings):
+    prepare, write, written = timings
+    print(f"{label:<28} UI {prepare * 1000:9.2f} ms   write {write * 1000:9.2f} ms  ({written} written)")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    __ = QCoreApplication([])
+    rng = random.Random(42)
+    with tempfile.TemporaryDirectory() as tmp:
+        project_path = create_fixture(Path(tmp), count, rng)
+        project_config, ts_objects = project_service.load_project_data(project_path, "zh", None, all_files=True)
+        app = SimpleNamespace(
+            current_target_language="zh",
+            all_project_strings=ts_objects,
+            project_config=project_config,
+            search_entry=SimpleNamespace(text=lambda: ""),
+            current_selected_ts_id=None,
+            file_monitor=SimpleNamespace(ignore_changes=nullcontext),
+            validation_engine=SimpleNamespace(save_result_cache=lambda: None),
+        )
+        saver = ProjectSaver(app)
+        print(f"🔧 {count} entries")
+
+        report("first save (compare all)", timed_save(saver, project_path))
+        for edits in EDIT_COUNTS:
+            for ts_obj in rng.sample(ts_objects, edits):
+                ts_obj.set_translation_internal(f"edited {rng.random()}")
+            report(f"save after {edits} edits", timed_save(saver, project_path))
+        report("save without edits", timed_save(saver, project_path))
+
+
+if __name__ == "__main__":
+    main()
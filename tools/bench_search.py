@@ -0,0 +1,91 @@
+from pathlib import Path
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from PySide6.QtCore import QCoreApplication, Qt
+
+from lexisync.models.translatable_string import TranslatableString
+from lexisync.models.translatable_strings_model import TranslatableStringsModel
+from lexisync.services.search_index import build_search_index
+from lexisync.services.search_service import SearchService
+
+WORDS = [
+    "open", "save", "file", "project", "settings", "export", "import", "window", "close", "delete",
+    "translation", "memory", "glossary", "string", "search", "replace", "error", "warning", "status", "update",
+]  # fmt: skip
+WORDS_ZH = ["打开", "保存", "文件", "项目", "设置", "导出", "导入", "窗口", "关闭", "删除", "翻译", "术语"]
+QUERIES = ["glossary", "memory warning", "item 12345", "12345", "导出", "search rep", "zzz"]
+
+
+def build_objects(rng: random.Random, count: int) -> list:
+    objects = []
+    for i in range(count):
+        original = " ".join(rng.choice(WORDS) for __ in range(rng.randint(2, 10))).capitalize() + f" item {i}"
+        ts_obj = TranslatableString(original, original, i + 1, 0, 0, None)
+        if rng.random() < 0.6:
+            ts_obj.set_translation_internal("".join(rng.choice(WORDS_ZH) for __ in range(rng.randint(2, 6))))
+        objects.append(ts_obj)
+    return objects
+
+
+def timed(func, repeat=5):
+    best = float("inf")
+    result = None
+    for __ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    __ = QCoreApplication([])
+    rng = random.Random(42)
+    objects = build_objects(rng, count)
+    print(f"🔧 {count} entries")
+
+    start = time.perf_counter()
+    build_search_index(objects)
+    print(f"{'Index build (background)':<34} {time.perf_counter() - start:8.3f} s")
+
+    model = TranslatableStringsModel(objects)
+    model._search_index.build_requested = None  # 同步构建，便于计时
+    model.search_candidate_rows("warmup")
+    app = SimpleNamespace(config={}, sheet_model=model)
+    search_service = SearchService(app)
+
+    def quick_filter(term):
+        model._search_results.clear()
+        model.apply_filter_and_sort(term, True, True, True, False, False, -1, Qt.AscendingOrder)
+        return model.rowCount()
+
+    def find(term):
+        search_service.last_options = {}
+        return search_service.perform_search(term, {"case": False, "in_orig": True, "in_trans": True})
+
+    for term in QUERIES:
+        filter_time, rows = timed(lambda term=term: quick_filter(term))
+        # 查找在全部行上进行，先清除快速过滤
+        quick_filter("")
+        find_time, matches = timed(lambda term=term: find(term))
+        print(
+            f"{term!r:<20} filter {filter_time * 1000:8.2f} ms ({rows:>6} rows)   "
+            f"find {find_time * 1000:8.2f} ms ({matches:>6} matches)"
+        )
+
+    # 编辑后的查询：修改过的条目单独确认，索引不重建
+    edited = rng.sample(range(count), 1000)
+    for raw_index in edited:
+        objects[raw_index].set_translation_internal("glossary edited")
+    model.refresh_rows_by_ids([objects[raw_index].id for raw_index in edited])
+    filter_time, rows = timed(lambda: quick_filter("glossary edited"))
+    print(f"{'after 1000 edits':<20} filter {filter_time * 1000:8.2f} ms ({rows:>6} rows)")
+
+
+if __name__ == "__main__":
+    main()
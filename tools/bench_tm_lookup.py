@@ -0,0 +1,71 @@
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from lexisync.services.tm_service import TMService
+
+WORDS = [
+    "open", "save", "file", "project", "settings", "export", "import", "window", "close", "delete",
+    "translation", "memory", "glossary", "string", "search", "replace", "error", "warning", "status", "update",
+]  # fmt: skip
+
+
+def build_tm(service: TMService, tm_dir: str, count: int) -> list[str]:
+    rng = random.Random(42)
+    sources = []
+    for i in range(count):
+        words = rng.choices(WORDS, k=rng.randint(2, 8))
+        sources.append(f"{' '.join(words)} {i}")
+
+    db_path = str(Path(tm_dir) / "tm.db")
+    service.connect_databases(tm_dir)
+    entries = [{"source": s, "target": s.upper()} for s in sources]
+    manifest = Path(tm_dir) / "manifest.json"
+    manifest.touch()
+    service.batch_update_tm(db_path, entries, "en", "zh", "bench", "bench")
+    return sources
+
+
+def timeit(label: str, func, queries: list[str]):
+    start = time.perf_counter()
+    for q in queries:
+        func(q)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed / len(queries) * 1e6:10.1f} µs/lookup")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    service = TMService()
+    with tempfile.TemporaryDirectory() as tm_dir:
+        print(f"🔧 Building TM with {count} units...")
+        sources = build_tm(service, tm_dir, count)
+        queries = random.Random(7).sample(sources, 500)
+        db_path = service.global_db_path
+
+        # 旧实现：每次查询都新建连接并设置 PRAGMA
+        def legacy_exact(q):
+            with service._get_db_connection(db_path) as conn:
+                service._query_translation_in_db(conn, q, "en", "zh")
+
+        def legacy_fuzzy(q):
+            with service._get_db_connection(db_path) as conn:
+                service._query_fuzzy_in_db(conn, q, "en", "zh", 5)
+
+        def pooled_fuzzy(q):
+            with service._reader(db_path) as conn:
+                service._query_fuzzy_in_db(conn, q, "en", "zh", 5)
+
+        timeit("exact  (per-call connect)", legacy_exact, queries)
+        timeit("exact  (pooled)", lambda q: service.get_translation(q, "en", "zh"), queries)
+        timeit("fuzzy  (per-call connect)", legacy_fuzzy, queries)
+        timeit("fuzzy  (pooled)", pooled_fuzzy, queries)
+        service.disconnect_databases()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+from pathlib import Path
+import random
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from lexisync.models.translatable_string import TranslatableString
+from lexisync.services import validation_helpers
+from lexisync.services.validation_service import build_validation_context, validate_string
+
+WORDS = [
+    "open", "save", "file", "project", "settings", "export", "import", "window", "close", "delete",
+    "translation", "memory", "glossary", "string", "search", "replace", "error", "warning", "status", "update",
+]  # fmt: skip
+WORDS_ZH = ["打开", "保存", "文件", "项目", "设置", "导出", "导入", "窗口", "关闭", "删除", "翻译", "术语"]
+
+# (原文模板, 译文模板)；{w} 为随机单词，{n} 为随机数字
+TEMPLATES = [
+    ("{w} {w}", "{z}{z}"),
+    ("Are you sure you want to {w} this {w}?", "确定要{z}此{z}吗？"),
+    ("Open %s", "打开 %s"),
+    ("Downloaded %d of %d {w} (%.1f%%)", "已下载 %d / %d 个{z} (%.1f%%)"),
+    ("Saved {{count}} {w} to {{path}}", "已将 {{count}} 个{z}保存到 {{path}}"),
+    ("<b>Warning:</b> %1 {w} selected.", "<b>警告：</b>已选择 %1 个{z}。"),
+    ("Visit https://example.com/{w}/{n} for help.", "请访问 https://example.com/{w}/{n} 获取帮助。"),
+    ("Contact {w}@example.com about {w}", "关于{z}请联系 {w}@example.com"),
+    ("Version {n}.{n} released, 100% {w}", "版本 {n}.{n} 已发布，100% {z}"),
+    ("{{n, plural, one {{# {w}}} other {{# {w}s}}}}", "{{n, plural, other {{# 个{z}}}}}"),
+    ("&{w}", "{z}(&F)"),
+    ("The {w} {w} could not be {w}ed. {w} {w} {w} {w}.", "无法{z}{z}。{z}{z}。"),
+    ("100%{w}@example.com", "100%{w}@example.com"),
+    ("{w}@example.comhttp://example.com/{w}?id={n}", "{w}@example.com http://example.com/{w}?id={n}"),
+]
+
+# 分词器回归用例：(文本, 期望的 URL 列表, 期望的 Email 列表)
+# URL/Email 须与逐条正则独立匹配的结果一致，不能被前面的 printf 或相邻的记号吞掉
+TOKENIZER_CASES = [
+    ("100%a@b.com", [], ["a@b.com"]),
+    ("a@b.comhttp://ex.com/a?b=1", ["http://ex.com/a?b=1"], ["a@b.comhttp"]),
+    ("50% https://ex.com/a%20s", ["https://ex.com/a%20s"], []),
+    ('<a href="http://ex.com/{id}">mail@ex.com</a>', ["http://ex.com/{id}"], ["mail@ex.com"]),
+]
+
+
+def build_corpus(rng: random.Random, count: int) -> list[tuple[str, str]]:
+    def fill(template):
+        return (
+            template.replace("{w}", rng.choice(WORDS), 1)
+            .replace("{z}", rng.choice(WORDS_ZH), 1)
+            .replace("{n}", str(rng.randint(0, 999)), 1)
+        )
+
+    corpus = []
+    for __ in range(count):
+        src, tgt = rng.choice(TEMPLATES)
+        while "{w}" in src or "{n}" in src:
+            src = fill(src)
+        while "{w}" in tgt or "{z}" in tgt or "{n}" in tgt:
+            tgt = fill(tgt)
+        corpus.append((src.replace("{{", "{").replace("}}", "}"), tgt.replace("{{", "{").replace("}}", "}")))
+    return corpus
+
+
+def check_tokenizer() -> bool:
+    ok = True
+    for text, urls, emails in TOKENIZER_CASES:
+        stream = validation_helpers.tokenize(text)
+        got = (stream.texts(validation_helpers.TOKEN_URL), stream.texts(validation_helpers.TOKEN_EMAIL))
+        if got != (urls, emails):
+            print(f"❌ tokenize({text!r}): URL/email {got}, expected {(urls, emails)}")
+            ok = False
+    return ok
+
+
+def report(label: str, elapsed: float, count: int):
+    print(f"{label:<34} {elapsed:8.3f} s  ({elapsed / count * 1e6:8.2f} µs/string)")
+
+
+def main():
+    if not check_tokenizer():
+        sys.exit(1)
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    rng = random.Random(42)
+    corpus = build_corpus(rng, count)
+    print(f"🔧 {count} strings, {len({s for s, __ in corpus})} distinct sources")
+
+    validation_helpers.tokenize.cache_clear()
+    start = time.perf_counter()
+    for src, tgt in corpus:
+        validation_helpers.tokenize(src)
+        validation_helpers.tokenize(tgt)
+    report("Tokenize source + target", time.perf_counter() - start, count)
+
+    ts_objects = []
+    for i, (src, tgt) in enumerate(corpus):
+        ts_obj = TranslatableString(src, src, i, 0, 0, [])
+        ts_obj.translation = tgt
+        ts_objects.append(ts_obj)
+    ctx_env = build_validation_context({"check_length": False})
+
+    validation_helpers.tokenize.cache_clear()
+    start = time.perf_counter()
+    for ts_obj in ts_objects:
+        validate_string(ts_obj, ctx_env)
+    report("validate_string (all rules)", time.perf_counter() - start, count)
+
+    # 各规则单独耗时；按字符串逐条执行全部规则，与 validate_string 一致，
+    # 记号流的生成成本计入第一条用到它的规则
+    print("🔧 Per rule")
+    validation_helpers.tokenize.cache_clear()
+    rules = [(rule_pack["rule"]["check_func"], rule_pack["kwargs"]) for rule_pack in ctx_env["active_rules"]]
+    totals = [0.0] * len(rules)
+    clock = time.perf_counter
+    for src, tgt in corpus:
+        for i, (check_func, kwargs) in enumerate(rules):
+            start = clock()
+            check_func(src, tgt, **kwargs)
+            totals[i] += clock() - start
+    for (check_func, __), elapsed in sorted(zip(rules, totals, strict=True), key=lambda item: -item[1]):
+        report(f"  {check_func.__name__}", elapsed, count)
+
+
+if __name__ == "__main__":
+    main()
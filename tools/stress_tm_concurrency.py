@@ -0,0 +1,91 @@
+from pathlib import Path
+import random
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from openpyxl import Workbook
+
+from lexisync.services.tm_service import TMService
+
+WORDS = [
+    "open", "save", "file", "project", "settings", "export", "import", "window", "close", "delete",
+    "translation", "memory", "glossary", "string", "search", "replace", "error", "warning", "status", "update",
+]  # fmt: skip
+
+
+def random_sentence(rng: random.Random, i: int) -> str:
+    return f"{' '.join(rng.choices(WORDS, k=rng.randint(2, 8)))} {i}"
+
+
+def write_xlsx(path: Path, count: int, seed: int):
+    rng = random.Random(seed)
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(["source", "target"])
+    for i in range(count):
+        src = random_sentence(rng, i)
+        ws.append([src, src.upper()])
+    wb.save(path)
+
+
+def main():
+    reader_count = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    import_size = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    service = TMService()
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        global_dir, project_dir = tmp_path / "global", tmp_path / "project"
+        service.connect_databases(str(global_dir), str(project_dir))
+
+        print("🔧 Preparing TM data...")
+        seed_file = tmp_path / "seed.xlsx"
+        write_xlsx(seed_file, 20000, seed=1)
+        service.import_from_file(str(seed_file), str(project_dir), "en", "zh")
+        import_file = tmp_path / "vendor.xlsx"
+        write_xlsx(import_file, import_size, seed=2)
+
+        stop = threading.Event()
+        counters = {"queries": 0, "errors": 0}
+        counter_lock = threading.Lock()
+
+        def reader(idx: int):
+            rng = random.Random(100 + idx)
+            done = errors = 0
+            while not stop.is_set():
+                try:
+                    # 绕过结果缓存，直接压测数据库读取路径
+                    service._do_actual_search(random_sentence(rng, rng.randint(0, 20000)), "en", "zh")
+                    done += 1
+                except Exception as e:
+                    errors += 1
+                    print(f"⚠️ reader {idx}: {e}")
+            with counter_lock:
+                counters["queries"] += done
+                counters["errors"] += errors
+
+        threads = [threading.Thread(target=reader, args=(i,)) for i in range(reader_count)]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+
+        print(f"📥 Importing {import_size} units while {reader_count} readers run fuzzy matches...")
+        ok, msg = service.import_from_file(str(import_file), str(global_dir), "en", "zh")
+        import_elapsed = time.perf_counter() - start
+        stop.set()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+
+        print(f"Import: {'✅' if ok else '❌'} {msg} ({import_elapsed:.2f}s)")
+        print(f"Fuzzy queries: {counters['queries']} in {elapsed:.2f}s ({counters['queries'] / elapsed:.0f} q/s)")
+        print(f"Reader errors: {counters['errors']}")
+        service.disconnect_databases()
+        sys.exit(1 if counters["errors"] or not ok else 0)
+
+
+if __name__ == "__main__":
+    main()